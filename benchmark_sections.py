@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Portfolio Section Benchmarks
+Reruns every section with AppTest and checks the results against a history
+
+For each section (and the contact form submit) this records:
+- wall time per rerun (median of several reruns)
+- number of elements the rerun emits
+- payload bytes of those elements
+- peak memory allocated during the rerun (tracemalloc)
+
+Results are appended to benchmark_history.json. A run fails, with status 1,
+when a metric regresses past benchmark_thresholds.json compared to earlier
+runs on the same machine.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Benchmark submissions and views must not reach the real outbox or analytics
+os.environ.setdefault("PORTFOLIO_OUTBOX", os.path.join(tempfile.gettempdir(), "portfolio-benchmark-outbox.sqlite3"))
+os.environ.setdefault("PORTFOLIO_ANALYTICS_DB", os.path.join(tempfile.gettempdir(), "portfolio-benchmark-analytics.sqlite3"))
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+import app
+
+HISTORY_PATH = Path("benchmark_history.json")
+THRESHOLDS_PATH = Path("benchmark_thresholds.json")
+APP_SCRIPT = str(Path(app.__file__).resolve())
+CONTACT_PAGE = "sections/contact.py"
+CONTACT_SUBMIT = "Contact (submit)"
+# Keep the history file small enough to review in a diff
+MAX_HISTORY = 50
+METRICS = ("rerun_ms", "elements", "payload_bytes", "peak_kb")
+
+_submissions = itertools.count(1)
+
+
+def _tree_stats(at):
+    """Count the elements of the last run and the bytes of their protos"""
+    elements = 0
+    payload = 0
+    for root in (at.main, at.sidebar):
+        for node in root:
+            proto = getattr(node, "proto", None)
+            if proto is None:
+                continue
+            elements += 1
+            payload += proto.ByteSize()
+    return elements, payload
+
+
+def _submit_contact_form(at):
+    """Fill in and submit the contact form of the current run"""
+    # A distinct message each time, or the form would reject it as a duplicate
+    at.text_input[0].input("Ada Lovelace")
+    at.text_input[1].input("ada@example.com")
+    at.text_area[0].input(f"I would like to talk about data science project #{next(_submissions)}.")
+    at.button[0].click()
+
+
+def _scenarios():
+    """Return ``(name, page, action)`` for every benchmarked rerun"""
+    scenarios = [(title, path, None) for path, title, _, _ in app.PAGES]
+    scenarios.append((CONTACT_SUBMIT, CONTACT_PAGE, _submit_contact_form))
+    return scenarios
+
+
+def _prepare(page, action):
+    """Open a page in a fresh AppTest, ready for the benchmarked rerun"""
+    at = AppTest.from_file(APP_SCRIPT, default_timeout=60).run()
+    at.switch_page(page).run()
+    if action is not None:
+        action(at)
+    return at
+
+
+def _check_run(name, at):
+    """Fail loudly instead of benchmarking a broken page"""
+    if at.exception:
+        messages = "; ".join(e.message for e in at.exception)
+        raise RuntimeError(f"{name} raised: {messages}")
+
+
+def measure_scenario(name, page, action=None, repeat=5):
+    """
+    Benchmark one rerun of a section
+
+    Timing and memory are measured in separate reruns, since tracemalloc
+    slows down the code it traces.
+
+    Args:
+        name (str): Label of the scenario
+        page (str): Page script to open
+        action (callable, optional): Interaction applied before the rerun
+        repeat (int): Timed reruns (median is kept)
+
+    Returns:
+        dict: rerun_ms, elements, payload_bytes and peak_kb
+    """
+    timings = []
+    for _ in range(repeat):
+        at = _prepare(page, action)
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+        _check_run(name, at)
+    elements, payload = _tree_stats(at)
+
+    at = _prepare(page, action)
+    tracemalloc.start()
+    try:
+        at.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    _check_run(name, at)
+
+    return {
+        "rerun_ms": round(statistics.median(timings), 2),
+        "elements": elements,
+        "payload_bytes": payload,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(repeat=5):
+    """
+    Benchmark every section and the contact form submit
+
+    Args:
+        repeat (int): Timed reruns per scenario
+
+    Returns:
+        dict: Metrics keyed by scenario name
+    """
+    return {name: measure_scenario(name, page, action, repeat) for name, page, action in _scenarios()}
+
+
+def _git_revision():
+    """Return the current commit hash, or None outside a git checkout"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _baseline(history, machine, window):
+    """Median of every metric over the latest runs on this machine"""
+    runs = [run for run in history if run["machine"] == machine][-window:]
+    baseline = {}
+    for run in runs:
+        for name, metrics in run["sections"].items():
+            for metric, value in metrics.items():
+                baseline.setdefault(name, {}).setdefault(metric, []).append(value)
+    return {
+        name: {metric: statistics.median(values) for metric, values in metrics.items()}
+        for name, metrics in baseline.items()
+    }
+
+
+def check_regressions(results, history, thresholds, machine):
+    """
+    Compare benchmark results against earlier runs and absolute limits
+
+    Args:
+        results (dict): Output of ``run_benchmarks``
+        history (list): Earlier runs from the history file
+        thresholds (dict): Parsed benchmark_thresholds.json
+        machine (str): Identifier of the current machine
+
+    Returns:
+        list: Human-readable regressions (empty when within thresholds)
+    """
+    regressions = []
+    baseline = _baseline(history, machine, thresholds.get("baseline_runs", 5))
+    tolerances = thresholds.get("max_regression", {})
+
+    for name, metrics in results.items():
+        limits = thresholds.get("limits", {}).get(name, {})
+        for metric, value in metrics.items():
+            limit = limits.get(metric)
+            if limit is not None and value > limit:
+                regressions.append(f"{name}: {metric} {value} exceeds limit of {limit}")
+
+            previous = baseline.get(name, {}).get(metric)
+            tolerance = tolerances.get(metric)
+            if previous is None or tolerance is None:
+                continue
+            allowed = previous * (1 + tolerance)
+            if value > allowed:
+                regressions.append(
+                    f"{name}: {metric} {value} is {(value / previous - 1) * 100:.0f}% above "
+                    f"the baseline of {previous} (allowed {tolerance * 100:.0f}%)"
+                )
+    return regressions
+
+
+def load_history(path=HISTORY_PATH):
+    """Load earlier benchmark runs, oldest first"""
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["runs"]
+
+
+def save_history(history, path=HISTORY_PATH):
+    """Write the latest ``MAX_HISTORY`` runs back to the history file"""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"runs": history[-MAX_HISTORY:]}, file, indent=2)
+        file.write("\n")
+
+
+def print_results(results, baseline):
+    """Print the benchmark results as a table, with the change from the baseline"""
+    print(f"{'Section':<20}" + "".join(f"{metric:>22}" for metric in METRICS))
+    for name, metrics in results.items():
+        cells = []
+        for metric in METRICS:
+            value = metrics[metric]
+            previous = baseline.get(name, {}).get(metric)
+            change = f" ({(value / previous - 1) * 100:+.0f}%)" if previous else ""
+            cells.append(f"{value}{change}".rjust(22))
+        print(f"{name:<20}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every portfolio section with AppTest")
+    parser.add_argument("--repeat", type=int, default=5, help="timed reruns per section (median is kept)")
+    parser.add_argument("--thresholds", default=str(THRESHOLDS_PATH), help="thresholds file")
+    parser.add_argument("--history", default=str(HISTORY_PATH), help="history file")
+    parser.add_argument("--no-record", action="store_true", help="do not append this run to the history")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    history_path = Path(args.history)
+    with open(args.thresholds, encoding="utf-8") as file:
+        thresholds = json.load(file)
+    history = load_history(history_path)
+    machine = os.environ.get("PORTFOLIO_BENCHMARK_MACHINE", platform.node())
+
+    results = run_benchmarks(args.repeat)
+    regressions = check_regressions(results, history, thresholds, machine)
+
+    if args.json:
+        print(json.dumps({"sections": results, "regressions": regressions}, indent=2))
+    else:
+        print("📏 Portfolio section benchmarks")
+        print("=" * 50)
+        print_results(results, _baseline(history, machine, thresholds.get("baseline_runs", 5)))
+        print()
+        for regression in regressions:
+            print(f"✗ {regression}")
+        if not regressions:
+            print("✓ No regressions")
+
+    if not args.no_record:
+        history.append({
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": _git_revision(),
+            "machine": machine,
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "sections": results,
+        })
+        save_history(history, history_path)
+
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Portfolio Asset Builder
+Pre-processes assets/ so the running app never resizes or compresses anything
+
+Writes to assets/build/:
+- responsive profile picture variants (1x/2x, JPEG/WebP)
+- a small blurred placeholder for the profile picture
+- gzip (and brotli, when installed) copies of compressible assets
+- manifest.json with hashes, sizes and dimensions, loaded by utils.assets
+"""
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import shutil
+import sys
+from pathlib import Path
+
+from utils.assets import (
+    BUILD_DIR,
+    PROFILE_PICTURE_PATH,
+    PROFILE_PICTURE_SIZE,
+    render_profile_variants,
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ASSETS_DIR = Path("assets")
+PLACEHOLDER_SIZE = 16
+# Keep a compressed copy only when it saves at least this fraction of the bytes
+MIN_COMPRESSION_SAVING = 0.05
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
+FORMAT_SUFFIXES = {"JPEG": ".jpg", "WEBP": ".webp"}
+
+
+def _digest(data):
+    """Return the SHA-256 hex digest of some bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write(out_dir, name, data):
+    """Write bytes to the build directory and return their manifest record"""
+    (out_dir / name).write_bytes(data)
+    return {"file": name, "bytes": len(data), "sha256": _digest(data)}
+
+
+def build_placeholder(data):
+    """
+    Create a tiny blurred preview of an image
+
+    Args:
+        data (bytes): Raw image bytes
+
+    Returns:
+        str: JPEG data URI of a few hundred bytes
+    """
+    from PIL import Image, ImageFilter
+
+    img = Image.open(io.BytesIO(data))
+    img.draft("RGB", (PLACEHOLDER_SIZE * 4, PLACEHOLDER_SIZE * 4))
+    img = img.convert("RGB").resize((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.Resampling.LANCZOS)
+    img = img.filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=40)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def build_compressed(out_dir, name, data):
+    """
+    Write precompressed copies of a file
+
+    Args:
+        out_dir (Path): Build directory
+        name (str): Hashed file name the copies are derived from
+        data (bytes): Uncompressed file contents
+
+    Returns:
+        dict: Manifest records keyed by encoding ("gzip", "br")
+    """
+    compressed = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressed["br"] = brotli.compress(data, quality=11)
+
+    suffixes = {"gzip": ".gz", "br": ".br"}
+    records = {}
+    for encoding, payload in compressed.items():
+        if len(payload) <= len(data) * (1 - MIN_COMPRESSION_SAVING):
+            records[encoding] = _write(out_dir, name + suffixes[encoding], payload)
+    return records
+
+
+def build_profile_picture(out_dir, path):
+    """
+    Build the responsive variants and placeholder of the profile picture
+
+    Args:
+        out_dir (Path): Build directory
+        path (Path): Source image
+
+    Returns:
+        dict: Manifest entry for the source image
+    """
+    from PIL import Image
+
+    data = path.read_bytes()
+    width, height = Image.open(io.BytesIO(data)).size
+
+    variants = []
+    for (scale, fmt), encoded in sorted(render_profile_variants(data).items()):
+        px = PROFILE_PICTURE_SIZE * scale
+        name = f"{path.stem}.{px}.{_digest(encoded)[:12]}{FORMAT_SUFFIXES[fmt]}"
+        record = _write(out_dir, name, encoded)
+        record.update({"scale": scale, "format": fmt, "width": px, "height": px})
+        variants.append(record)
+
+    return {
+        "sha256": _digest(data),
+        "bytes": len(data),
+        "width": width,
+        "height": height,
+        "placeholder": build_placeholder(data),
+        "variants": variants,
+    }
+
+
+def build_file(out_dir, path):
+    """
+    Copy a non-image asset under a hashed name with compressed siblings
+
+    Args:
+        out_dir (Path): Build directory
+        path (Path): Source file
+
+    Returns:
+        dict: Manifest entry for the source file
+    """
+    data = path.read_bytes()
+    name = f"{path.stem}.{_digest(data)[:12]}{path.suffix}"
+    entry = _write(out_dir, name, data)
+    entry["precompressed"] = build_compressed(out_dir, name, data)
+    return entry
+
+
+def build_image(out_dir, path):
+    """
+    Record an image that has no dedicated pipeline
+
+    Args:
+        out_dir (Path): Build directory
+        path (Path): Source image
+
+    Returns:
+        dict: Manifest entry for the source image
+    """
+    from PIL import Image
+
+    data = path.read_bytes()
+    width, height = Image.open(io.BytesIO(data)).size
+    return {
+        "sha256": _digest(data),
+        "bytes": len(data),
+        "width": width,
+        "height": height,
+        "placeholder": build_placeholder(data),
+    }
+
+
+def build_assets(assets_dir=ASSETS_DIR, out_dir=Path(BUILD_DIR)):
+    """
+    Build every asset and write the manifest
+
+    Args:
+        assets_dir (Path): Directory holding the source assets
+        out_dir (Path): Directory to write the build into (recreated)
+
+    Returns:
+        dict: The manifest that was written
+    """
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+
+    sources = {}
+    for path in sorted(assets_dir.iterdir()):
+        if not path.is_file():
+            continue
+        if path == Path(PROFILE_PICTURE_PATH):
+            sources[path.name] = build_profile_picture(out_dir, path)
+        elif path.suffix.lower() in IMAGE_SUFFIXES:
+            sources[path.name] = build_image(out_dir, path)
+        else:
+            sources[path.name] = build_file(out_dir, path)
+        print(f"✓ {path.name}")
+
+    manifest = {"version": 1, "sources": sources}
+    with open(out_dir / "manifest.json", "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    return manifest
+
+
+if __name__ == "__main__":
+    print("🔧 Building portfolio assets")
+    print("=" * 50)
+
+    try:
+        build_assets()
+    except ImportError as e:
+        print(f"✗ Missing dependency: {e}")
+        sys.exit(1)
+
+    print(f"📦 Manifest written to {BUILD_DIR}/manifest.json")
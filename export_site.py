@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Portfolio Static Site Export
+Renders the read-only sections to plain HTML files for any file server or CDN
+
+Only the contact form needs Python; the exported navigation links its
+"Contact" entry to the running Streamlit app.
+"""
+
+import argparse
+import hashlib
+import html
+import importlib
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from utils.assets import get_profile_picture, get_profile_placeholder, get_resume
+from utils.static_export import HtmlRenderer, rendering_to
+
+# (file name, navigation label, section page module)
+STATIC_SECTIONS = [
+    ("index.html", "🏠 Home", "sections.home"),
+    ("about.html", "👨‍💼 About Me", "sections.about"),
+    ("skills.html", "🛠️ Skills", "sections.skills"),
+    ("experience.html", "💼 Experience", "sections.experience"),
+    ("education.html", "🎓 Education", "sections.education"),
+    ("projects.html", "📁 Projects", "sections.projects"),
+]
+CONTACT_LABEL = "📞 Contact"
+DEFAULT_APP_URL = os.environ.get("PORTFOLIO_APP_URL", "http://localhost:8501")
+
+PAGE_TITLE = "Festus Matsitsa Bombo - Data Scientist Portfolio"
+
+STYLESHEET = """
+:root { --primary: #1f77b4; --background: #ffffff; --secondary: #f0f2f6; --text: #262730; }
+* { box-sizing: border-box; }
+body { margin: 0; font-family: "Source Sans Pro", system-ui, sans-serif; color: var(--text);
+       background: var(--background); display: flex; min-height: 100vh; line-height: 1.6; }
+nav { width: 244px; flex-shrink: 0; background: var(--secondary); padding: 2rem 1rem; }
+nav h2 { font-size: 1.4rem; margin-top: 0; }
+nav a { display: block; padding: 0.35rem 0.5rem; border-radius: 0.4rem; color: var(--text); text-decoration: none; }
+nav a:hover, nav a.active { background: #e0e4ec; }
+main { flex: 1; max-width: 1100px; margin: 0 auto; padding: 2rem 3rem; }
+header { text-align: center; }
+header img { width: 300px; height: 300px; object-fit: cover; background-size: cover; }
+header h1 { margin-bottom: 0; }
+header h3 { color: var(--primary); margin-top: 0.2rem; }
+.caption { color: #808495; font-size: 0.9rem; }
+.button { display: inline-block; padding: 0.5rem 1.5rem; border: 1px solid #d6d6d9; border-radius: 0.5rem;
+          color: var(--text); text-decoration: none; }
+.button:hover { border-color: var(--primary); color: var(--primary); }
+hr { border: none; border-top: 1px solid #e6e6ea; margin: 2rem 0; }
+.row { display: flex; gap: 1rem; flex-wrap: wrap; }
+.column { min-width: 200px; }
+.metric { margin-bottom: 1rem; }
+.metric-label { font-size: 0.9rem; }
+.metric-value { font-size: 2.2rem; }
+.metric-delta { color: #09ab3b; font-size: 0.9rem; }
+.expander { border: 1px solid #e6e6ea; border-radius: 0.5rem; padding: 0.5rem 1rem; margin-bottom: 1rem; }
+.expander summary { cursor: pointer; font-weight: 600; }
+.tab-label { border-bottom: 2px solid var(--primary); display: inline-block; }
+.alert { border-radius: 0.5rem; padding: 0.75rem 1rem; margin-bottom: 1rem; }
+.alert-info { background: #e8f1fb; color: #004280; }
+.alert-success { background: #e6f4ea; color: #177233; }
+.alert-warning { background: #fffce7; color: #926c05; }
+.alert-error { background: #ffecec; color: #7d353b; }
+.progress { height: 0.5rem; background: var(--secondary); border-radius: 0.25rem; margin-bottom: 1rem; }
+.progress-bar { height: 100%; background: var(--primary); border-radius: 0.25rem; }
+@media (max-width: 768px) { body { flex-direction: column; } nav { width: auto; } main { padding: 1rem; } }
+"""
+
+
+def _write_hashed(out_dir, stem, suffix, data):
+    """Write an asset under a content-hashed name and return its relative URL"""
+    name = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{suffix}"
+    (out_dir / "assets" / name).write_bytes(data)
+    return f"assets/{name}"
+
+
+def render_header(profile_url, placeholder, resume_url):
+    """
+    Render the header shared by every exported page
+
+    Args:
+        profile_url (str): Relative URL of the profile picture, or None
+        placeholder (str): Blurred placeholder data URI, or None
+        resume_url (str): Relative URL of the resume PDF, or None
+
+    Returns:
+        str: HTML of the page header
+    """
+    parts = ["<header>"]
+    if profile_url:
+        style = f' style="background-image: url({placeholder})"' if placeholder else ""
+        parts.append(
+            f'<img src="{profile_url}" alt="Festus Matsitsa Bombo" width="300" height="300"{style}>'
+            '<div class="caption">Festus Matsitsa Bombo</div>'
+        )
+    parts.append("<h1>FESTUS MATSITSA BOMBO</h1><h3>DATA SCIENTIST</h3>")
+    if resume_url:
+        parts.append(f'<a class="button" href="{resume_url}" download="Festus_Bombo_Resume.pdf">📄 Download Resume (PDF)</a>')
+    parts.append("</header><hr>")
+    return "".join(parts)
+
+
+def render_navigation(active_file, app_url):
+    """
+    Render the sidebar navigation
+
+    Args:
+        active_file (str): File name of the current page
+        app_url (str): URL of the live Streamlit app for interactive sections
+
+    Returns:
+        str: HTML of the navigation
+    """
+    links = []
+    for file_name, label, _ in STATIC_SECTIONS:
+        active = ' class="active"' if file_name == active_file else ""
+        links.append(f'<a href="{file_name}"{active}>{html.escape(label)}</a>')
+    links.append(f'<a href="{html.escape(app_url.rstrip("/"))}/contact">{html.escape(CONTACT_LABEL)}</a>')
+    return f"<nav><h2>Navigation</h2>{''.join(links)}</nav>"
+
+
+def export_site(out_dir, app_url=DEFAULT_APP_URL):
+    """
+    Export the static sections as a standalone site
+
+    Args:
+        out_dir (Path): Directory to write the site into (recreated)
+        app_url (str): URL of the live Streamlit app
+
+    Returns:
+        list: Paths of the written HTML pages
+    """
+    from utils import helpers
+
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    (out_dir / "assets").mkdir(parents=True)
+    (out_dir / "style.css").write_text(STYLESHEET.lstrip(), encoding="utf-8")
+
+    profile_bytes = get_profile_picture(scale=2)
+    resume_bytes = get_resume()
+    profile_url = _write_hashed(out_dir, "profile_picture", ".jpg", profile_bytes) if profile_bytes else None
+    resume_url = _write_hashed(out_dir, "resume", ".pdf", resume_bytes) if resume_bytes else None
+    header = render_header(profile_url, get_profile_placeholder(), resume_url)
+
+    pages = []
+    for file_name, label, module_name in STATIC_SECTIONS:
+        section = importlib.import_module(module_name)
+        with rendering_to(HtmlRenderer(), section, helpers) as renderer:
+            section.render()
+        page = (
+            '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+            f"<title>{html.escape(PAGE_TITLE)}</title>\n"
+            '<link rel="stylesheet" href="style.css">\n</head>\n<body>\n'
+            f"{render_navigation(file_name, app_url)}\n"
+            f"<main>\n{header}\n{renderer.to_html()}\n</main>\n</body>\n</html>\n"
+        )
+        path = out_dir / file_name
+        path.write_text(page, encoding="utf-8")
+        pages.append(path)
+    return pages
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the portfolio's static sections to HTML")
+    parser.add_argument("out_dir", nargs="?", default="site", help="output directory (default: site)")
+    parser.add_argument("--app-url", default=DEFAULT_APP_URL, help="URL of the live app, used for the Contact link")
+    args = parser.parse_args()
+
+    print("🌐 Exporting static portfolio pages")
+    print("=" * 50)
+
+    try:
+        pages = export_site(Path(args.out_dir), args.app_url)
+    except ImportError as e:
+        print(f"✗ Missing dependency: {e}")
+        sys.exit(1)
+
+    for page in pages:
+        print(f"✓ {page}")
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Portfolio Startup Profiler
+Measures cold-start cost and enforces the budget in startup_budget.json
+
+Every measurement runs in a fresh interpreter so nothing is already imported:
+- import breakdown of ``import app`` from ``python -X importtime``
+- time to first render: a cold process running the app once with AppTest
+
+Exits with status 1 when a budget is exceeded, so it can gate CI or a deploy.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Probe renders are inherited by the child interpreters; keep them out of
+# the real analytics
+os.environ.setdefault("PORTFOLIO_ANALYTICS_DB", os.path.join(tempfile.gettempdir(), "portfolio-startup-analytics.sqlite3"))
+
+BUDGET_PATH = Path("startup_budget.json")
+APP_SCRIPT = "app.py"
+
+# Runs in a fresh interpreter. Every AppTest run rescans installed packages
+# for components and polls the script thread, so the cost of running an empty
+# script is measured first and subtracted: what remains is what the app itself
+# loads and computes on its first render
+FIRST_RENDER_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+AppTest.from_string("pass").run()
+harness_start = time.perf_counter()
+AppTest.from_string("pass").run()
+harness_end = time.perf_counter()
+at = AppTest.from_file({script!r}, default_timeout=120).run()
+rendered = time.perf_counter()
+print(json.dumps({{
+    "streamlit_import_ms": (imported - start) * 1000,
+    "first_render_ms": ((rendered - harness_end) - (harness_end - harness_start)) * 1000,
+    "exceptions": [e.message for e in at.exception],
+    "modules": sorted(sys.modules),
+}}))
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Parse ``-X importtime`` output
+
+    Args:
+        stderr (str): Standard error of a ``python -X importtime`` run
+
+    Returns:
+        list: ``(module, self_us, cumulative_us, depth)`` tuples in import order
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def measure_imports(module="app"):
+    """
+    Measure the import cost of a module in a fresh interpreter
+
+    Args:
+        module (str): Module to import
+
+    Returns:
+        dict: Total import time, per-package self time and loaded modules
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    records = parse_importtime(result.stderr)
+
+    packages = {}
+    for name, self_us, _, _ in records:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    total_us = next(cumulative for name, _, cumulative, depth in records if name == module and depth <= 1)
+    return {
+        "import_ms": total_us / 1000,
+        "packages_ms": {name: us / 1000 for name, us in packages.items()},
+        "modules": [name for name, _, _, _ in records],
+    }
+
+
+def measure_first_render(script=APP_SCRIPT):
+    """
+    Measure time to first render of the app in a fresh interpreter
+
+    Args:
+        script (str): Entry point to render
+
+    Returns:
+        dict: Streamlit import time, first render time, exceptions raised and
+        the modules loaded once the page has rendered
+    """
+    probe = FIRST_RENDER_PROBE.format(script=str(Path(script).resolve()))
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def profile_startup(repeat=3):
+    """
+    Profile startup several times and keep the median of every timing
+
+    Args:
+        repeat (int): Number of cold runs
+
+    Returns:
+        dict: Startup report
+    """
+    import_runs = [measure_imports() for _ in range(repeat)]
+    render_runs = [measure_first_render() for _ in range(repeat)]
+
+    packages = {}
+    for run in import_runs:
+        for name, ms in run["packages_ms"].items():
+            packages.setdefault(name, []).append(ms)
+
+    return {
+        "import_ms": statistics.median(run["import_ms"] for run in import_runs),
+        "streamlit_import_ms": statistics.median(run["streamlit_import_ms"] for run in render_runs),
+        "first_render_ms": statistics.median(run["first_render_ms"] for run in render_runs),
+        "packages_ms": {name: statistics.median(values) for name, values in packages.items()},
+        "import_modules": import_runs[-1]["modules"],
+        "render_modules": render_runs[-1]["modules"],
+        "exceptions": render_runs[-1]["exceptions"],
+    }
+
+
+def check_budget(report, budget):
+    """
+    Compare a startup report against the budget
+
+    Args:
+        report (dict): Output of ``profile_startup``
+        budget (dict): Parsed startup_budget.json
+
+    Returns:
+        list: Human-readable budget violations (empty when within budget)
+    """
+    violations = []
+    for key in ("import_ms", "first_render_ms"):
+        limit = budget.get(f"max_{key}")
+        if limit is not None and report[key] > limit:
+            violations.append(f"{key} {report[key]:.0f} ms exceeds budget of {limit} ms")
+
+    for name, limit in budget.get("max_package_ms", {}).items():
+        spent = report["packages_ms"].get(name, 0)
+        if spent > limit:
+            violations.append(f"{name} imports take {spent:.0f} ms, budget is {limit} ms")
+
+    for stage, modules_key in (("import", "import_modules"), ("first render", "render_modules")):
+        loaded = set(report[modules_key])
+        for name in budget.get(f"forbidden_at_{stage.replace(' ', '_')}", []):
+            if name in loaded:
+                violations.append(f"{name} is loaded at {stage}; it must be imported lazily")
+
+    if report["exceptions"]:
+        violations.append(f"first render raised: {report['exceptions']}")
+    return violations
+
+
+def print_report(report, top=15):
+    """Print the startup report as a table"""
+    print(f"import app:          {report['import_ms']:8.1f} ms")
+    print(f"  streamlit alone    {report['streamlit_import_ms']:8.1f} ms (incl. AppTest)")
+    print(f"first render:        {report['first_render_ms']:8.1f} ms after imports")
+    print()
+    print(f"Top {top} packages by self import time:")
+    ranked = sorted(report["packages_ms"].items(), key=lambda item: item[1], reverse=True)
+    for name, ms in ranked[:top]:
+        print(f"  {name:<30}{ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile the portfolio's cold start against a budget")
+    parser.add_argument("--repeat", type=int, default=3, help="cold runs per measurement (median is kept)")
+    parser.add_argument("--budget", default=str(BUDGET_PATH), help="budget file (default: startup_budget.json)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    report = profile_startup(args.repeat)
+    with open(args.budget, encoding="utf-8") as file:
+        budget = json.load(file)
+    violations = check_budget(report, budget)
+
+    if args.json:
+        printable = {key: value for key, value in report.items() if not key.endswith("_modules")}
+        print(json.dumps(dict(printable, violations=violations), indent=2))
+    else:
+        print("⏱️  Portfolio startup profile")
+        print("=" * 50)
+        print_report(report)
+        print()
+        for violation in violations:
+            print(f"✗ {violation}")
+        if not violations:
+            print("✓ Within startup budget")
+
+    sys.exit(1 if violations else 0)
@@ -2,26 +2,86 @@
 """
 Streamlit Portfolio Runner
 Easy way to run the portfolio application
+
+Usage:
+    python run_portfolio.py [port] [--workers N]
+
+With ``--workers N`` the app runs in N processes behind a sticky reverse
+proxy on ``port``, so sessions are spread over N cores. Each worker renders
+every section once before it receives visitors, and the proxy answers
+readiness probes at ``/_portfolio/ready``.
 """
 
+import argparse
+import hashlib
+import json
 import subprocess
 import sys
 import os
+import signal
+import site
+from importlib import metadata
+
+# Internal ports of the worker processes start here
+WORKER_BASE_PORT = 8600
+
+REQUIRED_DISTRIBUTIONS = ("streamlit", "Pillow")
+REQUIREMENTS_PATH = "requirements_deployment.txt"
+DEPENDENCY_CACHE_PATH = "data/dependencies.json"
+
+def _environment_fingerprint():
+    """Hash of the interpreter, the requirements and the site-packages directories"""
+    digest = hashlib.sha256(sys.executable.encode())
+    digest.update(sys.version.encode())
+    try:
+        with open(REQUIREMENTS_PATH, "rb") as file:
+            digest.update(file.read())
+    except FileNotFoundError:
+        pass
+    # Installing or removing a package changes its site directory's mtime
+    for entry in [*site.getsitepackages(), site.getusersitepackages()]:
+        if os.path.isdir(entry):
+            digest.update(f"{entry}:{os.stat(entry).st_mtime_ns}".encode())
+    return digest.hexdigest()
 
 def check_dependencies():
-    """Check if required packages are installed"""
+    """
+    Check if required packages are installed
+
+    Reads installed package metadata instead of importing the packages, and
+    remembers a successful check in ``data/dependencies.json``: while the
+    interpreter, requirements and site directories are unchanged, later
+    starts skip the check entirely.
+    """
+    fingerprint = _environment_fingerprint()
     try:
-        import streamlit
-        import PIL
-        print("✓ All dependencies are installed")
-        return True
-    except ImportError as e:
-        print(f"✗ Missing dependency: {e}")
+        with open(DEPENDENCY_CACHE_PATH, encoding="utf-8") as file:
+            if json.load(file).get("fingerprint") == fingerprint:
+                print("✓ All dependencies are installed (cached)")
+                return True
+    except (FileNotFoundError, ValueError):
+        pass
+    
+    missing = []
+    for name in REQUIRED_DISTRIBUTIONS:
+        try:
+            metadata.version(name)
+        except metadata.PackageNotFoundError:
+            missing.append(name)
+    if missing:
+        print(f"✗ Missing dependency: {', '.join(missing)}")
         print("Installing required packages...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements_deployment.txt"])
-        return True
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", REQUIREMENTS_PATH])
+        fingerprint = _environment_fingerprint()
+    else:
+        print("✓ All dependencies are installed")
+    
+    os.makedirs(os.path.dirname(DEPENDENCY_CACHE_PATH), exist_ok=True)
+    with open(DEPENDENCY_CACHE_PATH, "w", encoding="utf-8") as file:
+        json.dump({"fingerprint": fingerprint}, file)
+    return True
 
-def run_portfolio(port=8501):
+def run_portfolio(port=8501, host="localhost"):
     """Run the Streamlit portfolio application"""
     if not os.path.exists("app.py"):
         print("✗ app.py not found in current directory")
@@ -34,7 +94,7 @@ def run_portfolio(port=8501):
         subprocess.run([
             sys.executable, "-m", "streamlit", "run", "app.py",
             "--server.port", str(port),
-            "--server.address", "localhost"
+            "--server.address", host
         ])
     except KeyboardInterrupt:
         print("\n👋 Portfolio application stopped")
@@ -44,7 +104,60 @@ def run_portfolio(port=8501):
     
     return True
 
+def run_workers(port=8501, workers=1, host="localhost", base_port=WORKER_BASE_PORT):
+    """
+    Run the portfolio in several processes behind a sticky reverse proxy
+
+    Args:
+        port (int): Public port of the proxy
+        workers (int): Number of app processes
+        host (str): Interface the proxy listens on
+        base_port (int): Internal port of the first worker; the others follow
+
+    Returns:
+        bool: False if the app could not be started
+    """
+    import asyncio
+    from utils.proxy import Worker, serve
+
+    if not os.path.exists("app.py"):
+        print("✗ app.py not found in current directory")
+        return False
+    
+    print(f"🚀 Starting {workers} portfolio workers on ports {base_port}-{base_port + workers - 1}")
+    print(f"📱 Open your browser to: http://localhost:{port}")
+    
+    # Stop the workers on SIGTERM too (process managers, containers)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    pool = [Worker(index, base_port + index) for index in range(workers)]
+    for worker in pool:
+        worker.start()
+    try:
+        asyncio.run(serve(pool, host, port))
+    except KeyboardInterrupt:
+        print("\n👋 Portfolio application stopped")
+    except Exception as e:
+        print(f"✗ Error running portfolio: {e}")
+        return False
+    finally:
+        for worker in pool:
+            worker.stop()
+    
+    return True
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the portfolio application")
+    parser.add_argument("port", nargs="?", type=int, default=8501, help="Public port (default 8501)")
+    parser.add_argument("--workers", type=int,
+                        help="App processes behind a sticky proxy with warmup and readiness, e.g. one per core")
+    parser.add_argument("--host", default="localhost", help="Interface to listen on (default localhost)")
+    parser.add_argument("--worker-port", type=int, default=WORKER_BASE_PORT,
+                        help=f"Internal port of the first worker (default {WORKER_BASE_PORT})")
+    parser.add_argument("--trusted-proxies", type=int, default=0,
+                        help="Reverse proxies in front of this server that append X-Forwarded-For, "
+                             "e.g. 1 behind a hosting platform's edge (default 0)")
+    args = parser.parse_args()
+    
     print("🎯 Festus Matsitsa Bombo - Data Scientist Portfolio")
     print("=" * 50)
     
@@ -52,13 +165,12 @@ if __name__ == "__main__":
     if not check_dependencies():
         sys.exit(1)
     
-    # Get port from command line or use default
-    port = 8501
-    if len(sys.argv) > 1:
-        try:
-            port = int(sys.argv[1])
-        except ValueError:
-            print("Invalid port number, using default 8501")
+    # Tell the app how many X-Forwarded-For entries to skip to reach the
+    # visitor: the given proxies, plus our own in front of the workers
+    os.environ["PORTFOLIO_TRUSTED_PROXIES"] = str(args.trusted_proxies + (1 if args.workers else 0))
     
     # Run the portfolio
-    run_portfolio(port)
\ No newline at end of file
+    if args.workers:
+        run_workers(args.port, args.workers, args.host, args.worker_port)
+    else:
+        run_portfolio(args.port, args.host)
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+About Me page: background, competencies and current status
+"""
+
+import streamlit as st
+from utils.content import get_content
+from utils.helpers import TextBlock
+from utils.metrics import timed_fragment
+
+@timed_fragment("about")
+def render():
+    """Display about me section"""
+    about = get_content().about
+    st.header("About Me")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.subheader("Background & Expertise")
+        st.write(about.background)
+        
+        st.subheader("Core Competencies")
+        with TextBlock() as block:
+            block.bullets(about.competencies, prefix="✅")
+    
+    with col2:
+        st.subheader("Personal Attributes")
+        with TextBlock() as block:
+            for attr in about.attributes:
+                block.write(attr)
+            
+        st.subheader("Current Status")
+        st.success(about.status)
+        
+        st.subheader("Philosophy")
+        st.info(about.philosophy)
+
+if __name__ == "__main__":
+    # Interactions inside the page rerun only the page body, not the header
+    st.fragment(render)()
@@ -0,0 +1,101 @@
+"""
+Analytics page (owner only): section views, downloads and the contact funnel
+"""
+
+import time
+
+import streamlit as st
+from utils.analytics import analytics_summary, buffer_stats, is_owner
+from utils.metrics import timed_fragment
+
+PERIODS = (7, 30, 90)
+
+def percent(part, whole):
+    """Format a ratio as a percentage, or a dash when there is no base"""
+    return f"{part / whole:.1%}" if whole else "–"
+
+@timed_fragment("analytics")
+def render():
+    """Display analytics section"""
+    if not is_owner():
+        st.error("This page is only available to the site owner.")
+        return
+
+    st.header("Analytics")
+    days = st.radio("Period", PERIODS, index=1, format_func=lambda d: f"Last {d} days", horizontal=True)
+    summary = analytics_summary(days=days)
+    funnel = summary["funnel"]
+    downloads = sum(summary["downloads"].values())
+
+    # Headline numbers
+    for col, (label, value) in zip(st.columns(4), [
+        ("Visits", funnel["visits"]),
+        ("Section views", sum(summary["section_views"].values())),
+        ("Resume downloads", downloads),
+        ("Messages received", funnel["sent"]),
+    ]):
+        col.metric(label, f"{value:,}")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Views per Section")
+        if summary["section_views"]:
+            st.vega_lite_chart(
+                {"section": list(summary["section_views"]), "views": list(summary["section_views"].values())},
+                {
+                    "mark": {"type": "bar", "tooltip": True},
+                    "encoding": {
+                        "y": {"field": "section", "type": "nominal", "sort": "-x", "title": None},
+                        "x": {"field": "views", "type": "quantitative"},
+                    },
+                },
+                use_container_width=True,
+            )
+        else:
+            st.info("No views recorded in this period yet.")
+
+    with col2:
+        st.subheader("Views per Hour (UTC, last 48 hours)")
+        hours = summary["hourly_views"]
+        st.bar_chart(
+            {"hour": [time.strftime("%m-%d %H:00", time.gmtime(hour)) for hour in hours], "views": list(hours.values())},
+            x="hour", y="views",
+        )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Resume Downloads")
+        st.metric("Download conversion", percent(funnel["downloads"], funnel["visits"]),
+                  help="Visits that downloaded the resume through the app")
+        st.table({
+            "Served by": list(summary["downloads"]) or ["–"],
+            "Downloads": list(summary["downloads"].values()) or [0],
+        })
+
+    with col2:
+        st.subheader("Contact Form Funnel")
+        steps = [
+            ("Visits", funnel["visits"]),
+            ("Opened Contact", funnel["contact_views"]),
+            ("Submitted the form", funnel["submissions"]),
+            ("Message stored", funnel["sent"]),
+        ]
+        st.table({
+            "Step": [label for label, _ in steps],
+            "Visits": [count for _, count in steps],
+            "Of previous step": ["–"] + [percent(count, previous) for (_, previous), (_, count) in zip(steps, steps[1:])],
+        })
+        if summary["outcomes"]:
+            st.caption("Submissions by outcome: " + ", ".join(
+                f"{outcome} {count:,}" for outcome, count in summary["outcomes"].items()
+            ))
+
+    stats = buffer_stats()
+    st.caption(
+        f"Read from hourly and daily rollups, updated as events are saved. "
+        f"{stats['pending']:,} events waiting in memory, {stats['dropped']:,} dropped since this process started."
+    )
+
+if __name__ == "__main__":
+    # Interactions inside the page rerun only the page body, not the header
+    st.fragment(render)()
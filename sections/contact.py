@@ -0,0 +1,188 @@
+"""
+Contact page: contact form and contact information
+"""
+
+import logging
+import os
+import sqlite3
+import uuid
+
+import streamlit as st
+from utils.admission import ADMITTED, DUPLICATE, contact_admission, message_fingerprint
+from utils.analytics import current_visit, record_event
+from utils.content import get_content
+from utils.helpers import TextBlock, display_bullet_groups, display_metrics
+from utils.metrics import contact_submissions, timed_fragment
+from utils.outbox import enqueue_message
+from utils.validation import check_message
+
+logger = logging.getLogger(__name__)
+
+# Reverse proxies in front of Streamlit that append X-Forwarded-For; set by
+# run_portfolio.py (its own proxy in --workers mode, plus --trusted-proxies)
+TRUSTED_PROXIES = int(os.environ.get("PORTFOLIO_TRUSTED_PROXIES", "0"))
+
+@timed_fragment("contact")
+def render():
+    """Display contact section"""
+    contact = get_content().contact
+    st.header("Get In Touch")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.subheader("Let's Connect!")
+        st.write(contact.intro)
+        
+        # Contact form
+        st.subheader("Send Me a Message")
+        
+        with st.form("contact_form"):
+            name = st.text_input("Your Name")
+            # Stored and emailed as the reply address, so without stray whitespace
+            email = st.text_input("Your Email").strip()
+            subject = st.selectbox("Subject", contact.subjects)
+            message = st.text_area("Your Message", height=150)
+            
+            submitted = st.form_submit_button("Send Message")
+            
+            if submitted:
+                # Every submission spends a token, valid or not
+                admission = admit_submission()
+                check = check_message(name, email, subject, message) if admission == ADMITTED else None
+                if admission != ADMITTED:
+                    st.warning("You're sending messages too quickly. Please wait a minute and try again.")
+                elif not (name and email and message):
+                    count_submission("invalid")
+                    st.error("Please fill in all required fields.")
+                elif not check.valid:
+                    count_submission("invalid")
+                    st.error(" ".join(check.errors))
+                elif is_duplicate(email, message):
+                    st.info("This message has already been sent. I'll respond within 24 hours.")
+                elif not queue_message(name, email, subject, message, spam=check.spam):
+                    st.error(f"""
+                    Sorry, your message could not be saved. Please contact me directly at:
+                    📧 {contact.email}
+                    📱 {contact.phone}
+                    """)
+                else:
+                    st.success(f"""
+                    Thank you {name} for your message! 
+                    
+                    Your message has been received. For immediate response, please contact me directly at:
+                    📧 {contact.email}
+                    📱 {contact.phone}
+                    
+                    I'll respond within 24 hours.
+                    """)
+                    
+                    # Display the message details for reference
+                    st.info(f"""
+                    **Message Details:**
+                    - From: {name} ({email})
+                    - Subject: {subject}
+                    - Message: {message}
+                    """)
+    
+    with col2:
+        st.subheader("Contact Information")
+        
+        # Contact methods
+        with TextBlock() as block:
+            block.write("**📧 Email:**")
+            block.write(contact.email)
+            
+            block.write("**📱 Phone:**")
+            block.write(contact.phone)
+            
+            block.write("**💼 Professional Profiles:**")
+            block.bullets(f"[{profile.label}]({profile.url})" for profile in contact.profiles)
+            
+            block.write("**🌍 Availability:**")
+            block.bullets(contact.availability)
+            
+            block.write("**⏰ Working Hours:**")
+            block.bullets(contact.working_hours)
+        
+        # Quick stats
+        st.subheader("Quick Stats")
+        display_metrics(contact.stats)
+    
+    # Services offered
+    st.subheader("Services & Opportunities")
+    display_bullet_groups(contact.services)
+
+def client_key():
+    """
+    Key identifying the visitor's host for rate limiting
+
+    Without trusted proxies, a direct connection is keyed on its address.
+    Behind ``TRUSTED_PROXIES`` reverse proxies, each appends its peer to
+    ``X-Forwarded-For``, so the visitor is the entry that many places from
+    the right: the right-most one is the edge proxy's address when another
+    proxy sits in front of ours. Entries further left come from the client
+    and are ignored, since anyone can forge them.
+
+    Returns:
+        str: Client address, or None when there is none to trust
+    """
+    if not TRUSTED_PROXIES:
+        ip_address = getattr(st.context, "ip_address", None)
+        return ip_address if isinstance(ip_address, str) else None
+    entries = st.context.headers.get("X-Forwarded-For", "").split(",")
+    if len(entries) < TRUSTED_PROXIES:
+        return None
+    return entries[-TRUSTED_PROXIES].strip() or None
+
+def admit_submission():
+    """
+    Spend a submission token of this session and of its client
+
+    Returns:
+        str: ``ADMITTED``, or the rate limit that rejected the submission
+    """
+    session_key = st.session_state.setdefault("contact_session_key", uuid.uuid4().hex)
+    # Without any address (e.g. localhost) the session is the only key worth limiting
+    outcome = contact_admission.admit(session_key, client_key() or session_key)
+    if outcome != ADMITTED:
+        count_submission(outcome)
+    return outcome
+
+def is_duplicate(email, message):
+    """Whether the same message was already accepted recently"""
+    if contact_admission.is_duplicate(message_fingerprint(email, message)):
+        count_submission(DUPLICATE)
+        return True
+    return False
+
+def count_submission(outcome):
+    """Count a contact form submission in the metrics and the visit's analytics"""
+    contact_submissions.inc(outcome)
+    visit = current_visit()
+    if visit is not None:
+        record_event("contact", "contact", outcome, visit)
+
+def queue_message(name, email, subject, message, spam=False):
+    """
+    Hand a message to the delivery outbox
+
+    Only a local database insert happens here; a background worker sends the
+    email, so a slow mail server never delays the rerun. Likely spam is kept
+    for review but never emailed, and the sender sees the usual confirmation.
+
+    Returns:
+        bool: True if the message was stored
+    """
+    try:
+        enqueue_message(name, email, subject, message, status="spam" if spam else "pending")
+    except (OSError, sqlite3.Error) as e:
+        logger.error("Could not queue contact message: %s", e)
+        count_submission("error")
+        return False
+    count_submission("spam" if spam else "queued")
+    return True
+
+if __name__ == "__main__":
+    # Interactions inside the page rerun only the page body, not the header
+    st.fragment(render)()
@@ -0,0 +1,43 @@
+"""
+Education page: degree, coursework and continuous learning
+"""
+
+import streamlit as st
+from utils.content import get_content
+from utils.helpers import TextBlock, display_bullet_groups, display_metrics
+from utils.metrics import timed_fragment
+
+@timed_fragment("education")
+def render():
+    """Display education section"""
+    education = get_content().education
+    st.header("Education Background")
+    
+    for degree in education.degrees:
+        with st.expander(degree.title, expanded=degree.expanded):
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                with TextBlock() as block:
+                    block.write(f"**Degree:** {degree.degree}")
+                    block.write(f"**Institution:** {degree.institution}")
+                    block.write(f"**Duration:** {degree.duration}")
+                    block.write(f"**Status:** {degree.status}")
+                    
+                    block.write("**Relevant Coursework:**")
+                    block.bullets(degree.coursework)
+                    
+            with col2:
+                display_metrics(degree.metrics)
+    
+    # Additional Learning
+    st.subheader("Continuous Learning & Development")
+    display_bullet_groups(education.learning)
+    
+    # Learning Philosophy
+    st.subheader("Learning Philosophy")
+    st.info(education.philosophy)
+
+if __name__ == "__main__":
+    # Interactions inside the page rerun only the page body, not the header
+    st.fragment(render)()
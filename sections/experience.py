@@ -0,0 +1,37 @@
+"""
+Experience page: freelance roles and skills gained
+"""
+
+import streamlit as st
+from utils.content import get_content
+from utils.helpers import TextBlock, display_bullet_groups, display_metrics
+from utils.metrics import timed_fragment
+
+@timed_fragment("experience")
+def render():
+    """Display experience section"""
+    experience = get_content().experience
+    st.header("Professional Experience")
+    
+    for role in experience.roles:
+        with st.expander(role.title, expanded=role.expanded):
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                with TextBlock() as block:
+                    block.write(f"**Role:** {role.role}")
+                    block.write(f"**Duration:** {role.duration}")
+                    
+                    block.write("**Key Responsibilities:**")
+                    block.bullets(role.responsibilities)
+                
+            with col2:
+                display_metrics(role.metrics)
+    
+    # Skills gained through experience
+    st.subheader("Skills Developed Through Experience")
+    display_bullet_groups(experience.skills_developed)
+
+if __name__ == "__main__":
+    # Interactions inside the page rerun only the page body, not the header
+    st.fragment(render)()
@@ -0,0 +1,38 @@
+"""
+Home page: professional summary, highlights and quick navigation
+"""
+
+import streamlit as st
+from utils.content import get_content
+from utils.helpers import TextBlock
+from utils.metrics import timed_fragment
+
+@timed_fragment("home")
+def render():
+    """Display home page with overview"""
+    home = get_content().home
+    st.header("Welcome to My Portfolio")
+    
+    # Professional summary from resume
+    st.subheader("Professional Summary")
+    st.write(home.summary)
+    
+    # Key highlights
+    for col, metric in zip(st.columns(len(home.highlights)), home.highlights):
+        with col:
+            st.metric(metric.label, metric.value, metric.delta)
+    
+    # Quick links
+    st.subheader("Quick Navigation")
+    st.write(home.navigation_hint)
+    
+    for col, link in zip(st.columns(len(home.quick_links)), home.quick_links):
+        with col:
+            with TextBlock() as block:
+                block.write(f"**{link.title}**")
+                for line in link.items:
+                    block.write(line)
+
+if __name__ == "__main__":
+    # Interactions inside the page rerun only the page body, not the header
+    st.fragment(render)()
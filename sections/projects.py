@@ -0,0 +1,78 @@
+"""
+Projects page: project portfolio by category
+"""
+
+import importlib
+
+import streamlit as st
+from utils.content import get_content
+from utils.helpers import TextBlock, display_bullet_groups, display_metrics
+from utils.metrics import timed_fragment
+
+# Live project demos by content key: modules with a ``render_demo()``,
+# imported (with their NumPy, pandas or scikit-learn dependencies) only once
+# a visitor switches the demo on
+DEMOS = {
+    "churn": "utils.churn_demo",
+    "forecast": "utils.forecast_demo",
+    "sales": "utils.sales_demo",
+    "market": "utils.market_demo",
+}
+
+@timed_fragment("projects")
+def render():
+    """Display projects section"""
+    projects = get_content().projects
+    st.header("Data Science Projects Portfolio")
+    
+    st.write(projects.intro)
+    
+    # Project categories
+    tabs = st.tabs([category.tab for category in projects.categories])
+    
+    for tab, category in zip(tabs, projects.categories):
+        with tab:
+            st.subheader(category.heading)
+            for project in category.projects:
+                show_project(project)
+    
+    # GitHub Integration
+    st.subheader("View More Projects")
+    
+    col1, col2, col3 = st.columns([1, 1, 1])
+    
+    with col2:
+        if st.button("🔗 Visit My GitHub", use_container_width=True):
+            st.markdown(f"[View all projects on GitHub]({projects.github_url})")
+            st.success("Check out my GitHub for complete project code and documentation!")
+    
+    # Contact for custom projects
+    st.subheader("Custom Project Development")
+    st.write(projects.custom_intro)
+    
+    display_bullet_groups(projects.offerings)
+
+def show_project(project):
+    """Display a single project card"""
+    with st.expander(project.title, expanded=project.expanded):
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            with TextBlock() as block:
+                block.write("**Project Overview:**")
+                block.write(project.overview)
+                
+                block.write("**Key Features:**")
+                block.bullets(project.features)
+                
+                block.write(f"**Technologies Used:** {project.technologies}")
+            
+        with col2:
+            display_metrics(project.metrics)
+        
+        if project.demo in DEMOS and st.toggle("▶️ Try the live demo", key=f"demo_{project.demo}"):
+            importlib.import_module(DEMOS[project.demo]).render_demo()
+
+if __name__ == "__main__":
+    # Interactions inside the page rerun only the page body, not the header
+    st.fragment(render)()
@@ -0,0 +1,35 @@
+"""
+Skills page: languages, tools and areas of expertise
+"""
+
+import streamlit as st
+from utils.content import get_content
+from utils.helpers import TextBlock, display_bullet_groups
+from utils.metrics import timed_fragment
+
+@timed_fragment("skills")
+def render():
+    """Display skills section"""
+    skills = get_content().skills
+    st.header("Technical Skills")
+    
+    # Programming Languages
+    st.subheader("Programming Languages")
+    for skill in skills.languages:
+        st.write(f"**{skill.name}**")
+        st.progress(skill.level / 100)
+    
+    # Tools & Technologies
+    for col, group in zip(st.columns(len(skills.tools)), skills.tools):
+        with col:
+            st.subheader(group.title)
+            with TextBlock() as block:
+                block.bullets(group.items)
+    
+    # Technical Expertise
+    st.subheader("Areas of Expertise")
+    display_bullet_groups(skills.expertise)
+
+if __name__ == "__main__":
+    # Interactions inside the page rerun only the page body, not the header
+    st.fragment(render)()
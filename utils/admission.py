@@ -0,0 +1,180 @@
+"""
+Admission control for the contact form
+
+Submissions are checked in constant time, before anything is stored:
+- every submission, valid or not, spends a token of its browser session and
+  of its client address, so a single tab or a single host cannot flood the
+  outbox (or the validation)
+- valid messages are compared with a bounded LRU of recent message
+  fingerprints, so resubmitting the same message (double clicks, refreshes,
+  replaying bots) is dropped
+
+All state is process-wide and capped in size: under abuse the least recently
+seen keys are evicted instead of memory growing. Counters record how much
+load was shed.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+# (capacity, seconds per refilled token)
+SESSION_RATE = (3, 60)
+CLIENT_RATE = (10, 30)
+MAX_TRACKED_KEYS = 10_000
+DUPLICATE_WINDOW = 3600
+MAX_FINGERPRINTS = 10_000
+
+ADMITTED = "admitted"
+SESSION_LIMITED = "session_limited"
+CLIENT_LIMITED = "client_limited"
+DUPLICATE = "duplicate"
+
+
+class TokenBuckets:
+    """Token buckets for many keys, keeping only the most recently used ones"""
+
+    def __init__(self, capacity, refill_seconds, max_keys=MAX_TRACKED_KEYS, clock=time.monotonic):
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets = OrderedDict()
+
+    def _refill(self, key):
+        """Return the current token count of a key, counting refills since last use"""
+        now = self.clock()
+        tokens, updated = self._buckets.get(key, (self.capacity, now))
+        return min(self.capacity, tokens + (now - updated) / self.refill_seconds), now
+
+    def available(self, key):
+        """Whether a key has a token to spend"""
+        tokens, _ = self._refill(key)
+        return tokens >= 1
+
+    def consume(self, key):
+        """Spend one token of a key (the caller checked ``available``)"""
+        tokens, now = self._refill(key)
+        self._buckets[key] = (tokens - 1, now)
+        self._buckets.move_to_end(key)
+        # A forgotten key starts over with a full bucket, so the cap bounds
+        # memory without letting anyone exceed the rate for long
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class RecentFingerprints:
+    """Bounded, time-limited set of recently seen message fingerprints"""
+
+    def __init__(self, window=DUPLICATE_WINDOW, max_size=MAX_FINGERPRINTS, clock=time.monotonic):
+        self.window = window
+        self.max_size = max_size
+        self.clock = clock
+        self._seen = OrderedDict()
+
+    def seen(self, fingerprint):
+        """Whether a fingerprint was added within the window"""
+        added = self._seen.get(fingerprint)
+        return added is not None and self.clock() - added < self.window
+
+    def add(self, fingerprint):
+        """Remember a fingerprint, evicting the oldest beyond ``max_size``"""
+        self._seen[fingerprint] = self.clock()
+        self._seen.move_to_end(fingerprint)
+        while len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+
+    def __len__(self):
+        return len(self._seen)
+
+
+def message_fingerprint(email, message):
+    """
+    Fingerprint a message, ignoring case and whitespace differences
+
+    Args:
+        email (str): Sender's email
+        message (str): Message body
+
+    Returns:
+        str: Hex digest identifying the message
+    """
+    normalized = " ".join(message.lower().split())
+    return hashlib.blake2b(f"{email.strip().lower()}\0{normalized}".encode(), digest_size=16).hexdigest()
+
+
+class ContactAdmission:
+    """Process-wide admission decision for contact form submissions"""
+
+    def __init__(self, session_rate=SESSION_RATE, client_rate=CLIENT_RATE, clock=time.monotonic):
+        self.sessions = TokenBuckets(*session_rate, clock=clock)
+        self.clients = TokenBuckets(*client_rate, clock=clock)
+        self.fingerprints = RecentFingerprints(clock=clock)
+        self.counters = dict.fromkeys((ADMITTED, SESSION_LIMITED, CLIENT_LIMITED, DUPLICATE), 0)
+        self._lock = threading.Lock()
+
+    def admit(self, session_key, client_key):
+        """
+        Spend a submission token of the session and of the client
+
+        Called for every submission before it is validated, so a flood of
+        invalid submissions is limited like any other. A token is only taken
+        when both the session and the client have one.
+
+        Args:
+            session_key (str): Identifier of the browser session
+            client_key (str): Client address (or another per-host key)
+
+        Returns:
+            str: ADMITTED, SESSION_LIMITED or CLIENT_LIMITED
+        """
+        with self._lock:
+            if not self.sessions.available(session_key):
+                outcome = SESSION_LIMITED
+            elif not self.clients.available(client_key):
+                outcome = CLIENT_LIMITED
+            else:
+                self.sessions.consume(session_key)
+                self.clients.consume(client_key)
+                outcome = ADMITTED
+            self.counters[outcome] += 1
+        return outcome
+
+    def is_duplicate(self, fingerprint):
+        """
+        Check a valid message against recently accepted ones, remembering it
+
+        Args:
+            fingerprint (str): Result of ``message_fingerprint``
+
+        Returns:
+            bool: True if the same message was accepted within the window
+        """
+        with self._lock:
+            if self.fingerprints.seen(fingerprint):
+                self.counters[DUPLICATE] += 1
+                return True
+            self.fingerprints.add(fingerprint)
+            return False
+
+    def stats(self):
+        """
+        Get admission counters and the size of the tracked state
+
+        Returns:
+            dict: Count per outcome plus tracked sessions, clients and fingerprints
+        """
+        with self._lock:
+            return dict(
+                self.counters,
+                tracked_sessions=len(self.sessions),
+                tracked_clients=len(self.clients),
+                tracked_fingerprints=len(self.fingerprints),
+            )
+
+
+contact_admission = ContactAdmission()
@@ -0,0 +1,370 @@
+"""
+Visitor and section-view analytics for the Streamlit portfolio application
+
+Recording an event stores a handful of numbers in preallocated ``array``
+columns of a ring buffer, under one short lock: a few microseconds, no
+allocation per event beyond the float timestamp, and no I/O on the rerun.
+A background writer drains the buffer in batches into a local SQLite
+database in WAL mode. If the writer falls behind (or the disk is
+unavailable), the oldest buffered events are overwritten rather than
+letting memory grow, and raw events older than ``RETENTION_DAYS`` are
+deleted from the database.
+
+Each batch also updates hourly and daily rollups (see ``utils.rollups``)
+in the same transaction; the owner-only analytics page reads those, never
+the raw events.
+
+Events are recorded per visit, i.e. per Streamlit session, identified by a
+random number kept in session state; no address or other personal data is
+stored. Configured through the environment:
+- PORTFOLIO_ANALYTICS: "0" disables recording
+- PORTFOLIO_ANALYTICS_DB: database path (default data/analytics.sqlite3)
+- PORTFOLIO_OWNER_TOKEN: secret that unlocks the analytics page when
+  passed once as ``?owner=<token>``; without it the page does not exist
+"""
+
+import atexit
+import hmac
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+
+import streamlit as st
+
+from utils.rollups import migrate, prune_rollups, read_summary, update_rollups
+from utils.warmup import is_warmup_session
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_ENABLED = os.environ.get("PORTFOLIO_ANALYTICS", "1") != "0"
+ANALYTICS_PATH = os.environ.get("PORTFOLIO_ANALYTICS_DB", "data/analytics.sqlite3")
+OWNER_TOKEN = os.environ.get("PORTFOLIO_OWNER_TOKEN", "")
+
+KINDS = ("view", "download", "contact")
+BUFFER_CAPACITY = 32768
+# The writer drains at least this often, and sooner once the buffer is a
+# quarter full
+FLUSH_INTERVAL = 5
+FLUSH_THRESHOLD = BUFFER_CAPACITY // 4
+RETENTION_DAYS = 90
+PRUNE_INTERVAL = 3600
+# Section and detail strings are interned as 16-bit codes
+MAX_LABELS = 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    kind TEXT NOT NULL,
+    section TEXT NOT NULL,
+    visit INTEGER NOT NULL,
+    detail TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_time ON events (time);
+"""
+
+_VISIT_KEY = "analytics_visit"
+_OWNER_KEY = "analytics_owner"
+
+
+class EventBuffer:
+    """
+    Fixed-size ring buffer of events stored column-wise in arrays
+
+    Strings are interned to small integer codes, so every slot is 21 bytes
+    whatever the event.
+    """
+
+    def __init__(self, capacity=BUFFER_CAPACITY):
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.kinds = array("B", bytes(capacity))
+        self.sections = array("H", bytes(2 * capacity))
+        self.visits = array("q", bytes(8 * capacity))
+        self.details = array("H", bytes(2 * capacity))
+        self.labels = [""]
+        self._codes = {"": 0}
+        # Events ever appended and ever drained; their difference is pending
+        self._appended = 0
+        self._drained = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def _code(self, label):
+        """Intern a string; once ``MAX_LABELS`` are taken, new ones share code 0"""
+        code = self._codes.get(label)
+        if code is None:
+            if len(self.labels) >= MAX_LABELS:
+                return 0
+            code = self._codes[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+    def append(self, kind, section, visit, detail, timestamp):
+        """
+        Store one event, overwriting the oldest one if the buffer is full
+
+        Returns:
+            int: Number of events waiting to be drained
+        """
+        with self._lock:
+            if self._appended - self._drained >= self.capacity:
+                self._drained += 1
+                self.dropped += 1
+            slot = self._appended % self.capacity
+            self.times[slot] = timestamp
+            self.kinds[slot] = kind
+            self.sections[slot] = self._code(section)
+            self.visits[slot] = visit
+            self.details[slot] = self._code(detail)
+            self._appended += 1
+            return self._appended - self._drained
+
+    def _slice(self, column, start, end):
+        """Copy ``column[start:end]`` in ring order"""
+        if end <= self.capacity:
+            return column[start:end]
+        return column[start:] + column[:end - self.capacity]
+
+    def drain(self):
+        """
+        Take every pending event out of the buffer
+
+        Returns:
+            list: ``(time, kind, section, visit, detail)`` rows, oldest first
+        """
+        with self._lock:
+            count = self._appended - self._drained
+            start = self._drained % self.capacity
+            end = start + count
+            columns = [self._slice(column, start, end) for column in
+                       (self.times, self.kinds, self.sections, self.visits, self.details)]
+            labels = list(self.labels)
+            self._drained = self._appended
+        times, kinds, sections, visits, details = columns
+        return [
+            (timestamp, KINDS[kind], labels[section], visit, labels[detail])
+            for timestamp, kind, section, visit, detail in zip(times, kinds, sections, visits, details)
+        ]
+
+    def pending(self):
+        return self._appended - self._drained
+
+
+_buffer = EventBuffer()
+_writer = None
+_writer_lock = threading.Lock()
+_local = threading.local()
+
+
+def _connect(path=ANALYTICS_PATH):
+    """Get this thread's connection to the analytics database, creating it if needed"""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    connection = connections.get(path)
+    if connection is None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, timeout=5, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        migrate(connection)
+        connections[path] = connection
+    return connection
+
+
+def write_events(rows, path=ANALYTICS_PATH):
+    """
+    Insert a batch of events and fold it into the rollups, in one transaction
+
+    Args:
+        rows (list): ``(time, kind, section, visit, detail)`` tuples
+        path (str): Analytics database
+    """
+    connection = _connect(path)
+    with connection:
+        connection.execute("BEGIN")
+        connection.executemany(
+            "INSERT INTO events (time, kind, section, visit, detail) VALUES (?, ?, ?, ?, ?)", rows
+        )
+        update_rollups(connection, rows)
+
+
+def prune_events(path=ANALYTICS_PATH, retention_days=RETENTION_DAYS):
+    """Delete raw events, hourly and per-visit rollups older than the retention period"""
+    connection = _connect(path)
+    cutoff = time.time() - retention_days * 86400
+    with connection:
+        connection.execute("BEGIN")
+        connection.execute("DELETE FROM events WHERE time < ?", (cutoff,))
+        prune_rollups(connection, cutoff)
+
+
+def flush_events(path=ANALYTICS_PATH):
+    """
+    Write every buffered event to the database
+
+    Returns:
+        int: Number of events written
+    """
+    rows = _buffer.drain()
+    if rows:
+        write_events(rows, path)
+    return len(rows)
+
+
+class AnalyticsWriter(threading.Thread):
+    """Background thread draining the event buffer into SQLite"""
+
+    def __init__(self, path=ANALYTICS_PATH, flush_interval=FLUSH_INTERVAL):
+        super().__init__(name="analytics-writer", daemon=True)
+        self.path = path
+        self.flush_interval = flush_interval
+        self._wakeup = threading.Event()
+        self._stopping = False
+
+    def wake(self):
+        """Flush now instead of at the next interval"""
+        self._wakeup.set()
+
+    def stop(self):
+        """Ask the writer to exit after one last flush"""
+        self._stopping = True
+        self._wakeup.set()
+
+    def run(self):
+        pruned = 0.0
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                flush_events(self.path)
+                if time.monotonic() - pruned >= PRUNE_INTERVAL:
+                    prune_events(self.path)
+                    pruned = time.monotonic()
+            except (OSError, sqlite3.Error) as e:
+                # The drained batch is lost; the buffer keeps taking events
+                logger.error("Analytics database unavailable: %s", e)
+            if self._stopping:
+                return
+
+
+def start_analytics_writer(path=ANALYTICS_PATH):
+    """
+    Start the process-wide analytics writer
+
+    Safe to call on every event; the writer is started only once.
+
+    Returns:
+        AnalyticsWriter: The running writer
+    """
+    global _writer
+
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AnalyticsWriter(path)
+                _writer.start()
+                # Daemon threads die with the interpreter: write what is left
+                atexit.register(flush_events, path)
+    return _writer
+
+
+def record_event(kind, section="", detail="", visit=0):
+    """
+    Record an event for the background writer
+
+    Args:
+        kind (str): One of ``KINDS``
+        section (str): Section URL path the event belongs to, if any
+        detail (str): Free-form qualifier, e.g. a contact form outcome
+        visit (int): Visit id from ``current_visit``, 0 when unknown
+    """
+    if not ANALYTICS_ENABLED:
+        return
+    pending = _buffer.append(KINDS.index(kind), section, visit, detail, time.time())
+    writer = start_analytics_writer()
+    if pending == FLUSH_THRESHOLD:
+        writer.wake()
+
+
+def current_visit():
+    """
+    Get the visit id of the current session
+
+    Returns:
+        int: Random id assigned on the session's first rerun, or None for
+        synthetic warmup sessions, which are not recorded
+    """
+    visit = st.session_state.get(_VISIT_KEY)
+    if visit is None:
+        visit = st.session_state[_VISIT_KEY] = 0 if is_warmup_session() else random.getrandbits(63) or 1
+    return visit or None
+
+
+def is_owner():
+    """
+    Tell whether the current session belongs to the site owner
+
+    The session is unlocked once by opening the app with
+    ``?owner=<PORTFOLIO_OWNER_TOKEN>``; the token is then removed from the
+    address bar. The owner's own visits stop being recorded.
+
+    Returns:
+        bool: True if analytics may be shown to this session
+    """
+    if not OWNER_TOKEN:
+        return False
+    if st.session_state.get(_OWNER_KEY):
+        return True
+    token = st.query_params.get("owner")
+    if token is None or not hmac.compare_digest(token.encode(), OWNER_TOKEN.encode()):
+        return False
+    del st.query_params["owner"]
+    st.session_state[_OWNER_KEY] = True
+    st.session_state[_VISIT_KEY] = 0
+    return True
+
+
+def record_view(section):
+    """
+    Record a view of a section by the current visit
+
+    Args:
+        section (str): Section URL path
+    """
+    visit = current_visit()
+    if visit is not None:
+        record_event("view", section, visit=visit)
+
+
+def analytics_summary(days=30, hours=48, path=ANALYTICS_PATH):
+    """
+    Get the analytics page's figures, including events still in the buffer
+
+    Args:
+        days (int): Period for section views, downloads and the funnel
+        hours (int): Period of the hourly views series
+        path (str): Analytics database
+
+    Returns:
+        dict: See ``utils.rollups.read_summary``
+    """
+    flush_events(path)
+    return read_summary(_connect(path), time.time(), days, hours)
+
+
+def buffer_stats():
+    """
+    Get the state of the in-memory event buffer
+
+    Returns:
+        dict: Pending and dropped events and the buffer's capacity
+    """
+    return {"pending": _buffer.pending(), "dropped": _buffer.dropped, "capacity": _buffer.capacity}
@@ -0,0 +1,265 @@
+"""
+Process-wide asset cache for the Streamlit portfolio application
+
+Derived assets (resized profile pictures and the like) are computed once per
+process and shared by every session. Entries are revalidated with a cheap
+``stat()`` on each lookup and only re-read when the file's mtime or size
+changes; a content hash decides whether derivatives must be rebuilt.
+
+When ``build_assets.py`` has been run, derivatives are read straight from
+``assets/build/`` using the manifest loaded at import, and this module never
+imports PIL. ``st.image`` still opens the bytes with PIL on every render to
+read their size and format (a header parse, not a decode or resize).
+Rendering in-process is only the fallback for a missing or stale build.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from pathlib import Path
+
+from utils.metrics import asset_cache_lookups
+
+PROFILE_PICTURE_PATH = "assets/profile_picture.jpg"
+PROFILE_PICTURE_SIZE = 300
+PROFILE_PICTURE_SCALES = (1, 2)
+PROFILE_PICTURE_FORMATS = ("JPEG", "WEBP")
+
+RESUME_PATH = "assets/resume.pdf"
+
+# Public URL routing /assets/ to the static asset server (reverse proxy or CDN)
+ASSET_BASE_URL = os.environ.get("PORTFOLIO_ASSET_BASE_URL", "").rstrip("/")
+
+BUILD_DIR = "assets/build"
+MANIFEST_PATH = "assets/build/manifest.json"
+
+_cache_lock = threading.Lock()
+_cache_entries = {}
+
+
+class _CacheEntry:
+    """Cached derivatives of a single source file"""
+
+    __slots__ = ("mtime_ns", "size", "digest", "variants")
+
+    def __init__(self, mtime_ns, size, digest, variants):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.variants = variants
+
+
+def get_file_variants(path, kind, build):
+    """
+    Return the derivatives of a file, rebuilding them only when it changed
+
+    Args:
+        path (str): Path to the source file
+        kind (str): Name of the derivative family, so several builders can
+            cache derivatives of the same file independently
+        build (callable): Function turning the raw file bytes into a dict of variants
+
+    Returns:
+        dict: Variants produced by ``build``
+
+    Raises:
+        FileNotFoundError: If the source file does not exist
+    """
+    key = (kind, path)
+    stat = Path(path).stat()
+    entry = _cache_entries.get(key)
+    if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+        asset_cache_lookups.inc(kind, "hit")
+        return entry.variants
+
+    with _cache_lock:
+        # Another session may have refreshed the entry while we waited
+        entry = _cache_entries.get(key)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            asset_cache_lookups.inc(kind, "hit")
+            return entry.variants
+
+        with open(path, "rb") as file:
+            data = file.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        if entry is not None and entry.digest == digest:
+            # Touched but unchanged: keep the existing derivatives
+            asset_cache_lookups.inc(kind, "revalidated")
+            variants = entry.variants
+        else:
+            asset_cache_lookups.inc(kind, "miss")
+            variants = build(data)
+
+        _cache_entries[key] = _CacheEntry(stat.st_mtime_ns, stat.st_size, digest, variants)
+        return variants
+
+
+def get_cache_sizes():
+    """
+    Get the bytes held by the process-wide cache, per derivative family
+
+    Only ``bytes`` variants are counted; parsed objects (like page content)
+    are reported with a size of 0 and still counted as entries.
+
+    Returns:
+        dict: ``{kind: {"entries": int, "bytes": int}}``
+    """
+    sizes = {}
+    for (kind, _), entry in list(_cache_entries.items()):
+        totals = sizes.setdefault(kind, {"entries": 0, "bytes": 0})
+        totals["entries"] += 1
+        totals["bytes"] += sum(len(value) for value in entry.variants.values() if isinstance(value, bytes))
+    return sizes
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """
+    Load the asset manifest written by ``build_assets.py``
+
+    Args:
+        path (str): Path to the manifest
+
+    Returns:
+        dict: Parsed manifest, or an empty dict if there is no usable build
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+# Read once at import so the request path never parses the manifest
+ASSET_MANIFEST = load_manifest()
+
+
+def get_manifest_entry(path):
+    """
+    Get the manifest entry of a source file
+
+    Args:
+        path (str): Path to the source file under assets/
+
+    Returns:
+        dict: Manifest entry, or None if the file was not part of the build
+    """
+    return ASSET_MANIFEST.get("sources", {}).get(Path(path).name)
+
+
+def render_profile_variants(data):
+    """
+    Decode the profile picture once and encode it at every size and format
+
+    Args:
+        data (bytes): Raw JPEG bytes of the profile picture
+
+    Returns:
+        dict: Encoded image bytes keyed by ``(scale, format)``
+    """
+    from PIL import Image, features
+
+    largest = PROFILE_PICTURE_SIZE * max(PROFILE_PICTURE_SCALES)
+    img = Image.open(io.BytesIO(data))
+    # For JPEG sources this lets libjpeg decode at a reduced DCT scale
+    # instead of materialising the full-resolution bitmap first
+    img.draft("RGB", (largest, largest))
+    img = img.convert("RGB")
+
+    formats = [fmt for fmt in PROFILE_PICTURE_FORMATS if fmt != "WEBP" or features.check("webp")]
+
+    variants = {}
+    for scale in sorted(PROFILE_PICTURE_SCALES, reverse=True):
+        px = PROFILE_PICTURE_SIZE * scale
+        resized = img.resize((px, px), Image.Resampling.LANCZOS)
+        for fmt in formats:
+            buffer = io.BytesIO()
+            resized.save(buffer, format=fmt, quality=85)
+            variants[(scale, fmt)] = buffer.getvalue()
+    return variants
+
+
+def _build_profile_variants(data):
+    """
+    Load the prebuilt profile picture variants, rendering them if needed
+
+    Args:
+        data (bytes): Raw JPEG bytes of the profile picture
+
+    Returns:
+        dict: Encoded image bytes keyed by ``(scale, format)``
+    """
+    entry = get_manifest_entry(PROFILE_PICTURE_PATH)
+    if entry is not None and entry["sha256"] == hashlib.sha256(data).hexdigest():
+        try:
+            variants = {}
+            for variant in entry["variants"]:
+                with open(Path(BUILD_DIR) / variant["file"], "rb") as file:
+                    variants[(variant["scale"], variant["format"])] = file.read()
+            return variants
+        except OSError:
+            pass
+
+    # No build, or the picture changed since it ran
+    return render_profile_variants(data)
+
+
+def get_profile_picture(scale=2, fmt="JPEG"):
+    """
+    Get the pre-encoded profile picture
+
+    Args:
+        scale (int): Pixel density multiplier of the 300px display size
+        fmt (str): Image format, "JPEG" or "WEBP"
+
+    Returns:
+        bytes: Encoded image, or None if the picture is missing or the
+        requested variant is unavailable
+    """
+    try:
+        variants = get_file_variants(PROFILE_PICTURE_PATH, "profile", _build_profile_variants)
+    except FileNotFoundError:
+        return None
+    return variants.get((scale, fmt))
+
+
+def get_profile_placeholder():
+    """
+    Get the blurred placeholder of the profile picture
+
+    Returns:
+        str: Tiny JPEG data URI, or None if the assets have not been built
+    """
+    entry = get_manifest_entry(PROFILE_PICTURE_PATH)
+    return entry.get("placeholder") if entry else None
+
+
+def get_resume():
+    """
+    Get the resume PDF bytes shared by all sessions
+
+    Every session receives the same ``bytes`` object, so Streamlit's media
+    manager registers it under a single, stable file id instead of storing
+    a fresh copy per rerun.
+
+    Returns:
+        bytes: Contents of the resume PDF, or None if it is missing
+    """
+    try:
+        variants = get_file_variants(RESUME_PATH, "resume", lambda data: {"pdf": data})
+    except FileNotFoundError:
+        return None
+    return variants["pdf"]
+
+
+def get_public_base_url():
+    """
+    Get the externally configured asset base URL
+
+    Returns:
+        str: Value of ``PORTFOLIO_ASSET_BASE_URL``, or "" when assets are only
+        reachable on the local asset server
+    """
+    return ASSET_BASE_URL
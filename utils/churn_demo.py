@@ -0,0 +1,285 @@
+"""
+Live customer churn prediction demo for the Projects page
+
+A gradient boosting model is trained on a synthetic customer base the first
+time any visitor opens the demo, then shared by every session of the
+process. Visitors can score one customer from the form, or upload a CSV that
+is scored in vectorized batches; the scores of an upload are kept in the
+session, so interacting with the results never rescores the file.
+
+scikit-learn, NumPy and pandas are imported only here, and this module only
+when a visitor opens the demo.
+"""
+
+import io
+import threading
+import time
+
+import numpy as np
+import streamlit as st
+
+from utils.metrics import timed_fragment
+
+FEATURES = ("tenure_months", "monthly_charges", "support_calls", "contract", "paperless_billing")
+CONTRACTS = ("Month-to-month", "One year", "Two year")
+# Indices of the categorical columns in FEATURES
+CATEGORICAL = (3, 4)
+
+TRAINING_CUSTOMERS = 20000
+HOLDOUT_SHARE = 0.2
+SEED = 7
+# Uploaded rows are scored this many at a time to bound temporary memory
+BATCH_SIZE = 8192
+MAX_UPLOAD_ROWS = 100000
+SAMPLE_ROWS = 2000
+# Churn probabilities at which a customer is labelled high and medium risk
+HIGH_RISK = 0.7
+MEDIUM_RISK = 0.4
+
+_model_lock = threading.Lock()
+_model = None
+_sample_csv = None
+
+
+def generate_customers(count, seed=SEED):
+    """
+    Generate a synthetic customer base with a known churn mechanism
+
+    Churn is more likely with short tenure, high charges, many support calls,
+    month-to-month contracts and paperless billing.
+
+    Args:
+        count (int): Number of customers
+        seed (int): Random seed
+
+    Returns:
+        tuple: Feature matrix (count x 5, float) and churn labels (bool)
+    """
+    rng = np.random.default_rng(seed)
+    features = np.column_stack([
+        rng.integers(1, 73, count),
+        rng.uniform(20, 120, count).round(2),
+        rng.poisson(1.5, count),
+        rng.choice(len(CONTRACTS), count, p=(0.55, 0.25, 0.2)),
+        rng.integers(0, 2, count),
+    ]).astype(float)
+    tenure, charges, calls, contract, paperless = features.T
+    logit = -1.0 - 0.04 * tenure + 0.02 * charges + 0.45 * calls - 1.2 * contract + 0.6 * paperless
+    churned = rng.random(count) < 1 / (1 + np.exp(-logit))
+    return features, churned
+
+
+class ChurnModel:
+    """Fitted classifier plus what the demo shows about its training"""
+
+    def __init__(self, classifier, auc, churn_rate, training_ms):
+        self.classifier = classifier
+        self.auc = auc
+        self.churn_rate = churn_rate
+        self.training_ms = training_ms
+
+    def score(self, features):
+        """
+        Churn probability of each row, computed in batches
+
+        Args:
+            features (numpy.ndarray): Rows in ``FEATURES`` order
+
+        Returns:
+            numpy.ndarray: Probabilities, one per row
+        """
+        scores = np.empty(len(features))
+        for start in range(0, len(features), BATCH_SIZE):
+            batch = features[start:start + BATCH_SIZE]
+            scores[start:start + len(batch)] = self.classifier.predict_proba(batch)[:, 1]
+        return scores
+
+
+def train_model():
+    """
+    Train the churn classifier on synthetic customers
+
+    Returns:
+        ChurnModel: Fitted model with its holdout ROC AUC
+    """
+    from sklearn.ensemble import HistGradientBoostingClassifier
+    from sklearn.metrics import roc_auc_score
+
+    start = time.perf_counter()
+    features, churned = generate_customers(TRAINING_CUSTOMERS)
+    split = int(len(features) * (1 - HOLDOUT_SHARE))
+    classifier = HistGradientBoostingClassifier(
+        max_iter=150, learning_rate=0.1, categorical_features=list(CATEGORICAL), random_state=SEED,
+    )
+    classifier.fit(features[:split], churned[:split])
+    auc = roc_auc_score(churned[split:], classifier.predict_proba(features[split:])[:, 1])
+    return ChurnModel(classifier, auc, churned.mean(), (time.perf_counter() - start) * 1000)
+
+
+def get_model():
+    """
+    Get the process-wide churn model, training it on first use
+
+    Returns:
+        ChurnModel: Shared fitted model
+    """
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                _model = train_model()
+    return _model
+
+
+def sample_csv():
+    """
+    Get a sample upload: synthetic customers in the expected CSV layout
+
+    Returns:
+        bytes: CSV file shared by all sessions
+    """
+    global _sample_csv
+    if _sample_csv is None:
+        features, _ = generate_customers(SAMPLE_ROWS, seed=SEED + 1)
+        lines = [",".join(("customer_id", *FEATURES))]
+        for index, (tenure, charges, calls, contract, paperless) in enumerate(features, 1):
+            lines.append(
+                f"C{index:05d},{tenure:.0f},{charges:.2f},{calls:.0f},{CONTRACTS[int(contract)]},"
+                f"{'yes' if paperless else 'no'}"
+            )
+        _sample_csv = ("\n".join(lines) + "\n").encode("utf-8")
+    return _sample_csv
+
+
+def parse_customers(data):
+    """
+    Parse an uploaded customer CSV into a feature matrix
+
+    Contracts may be given by name or as 0-2; paperless billing as
+    yes/no, true/false or 1/0.
+
+    Args:
+        data (bytes): CSV file with a header row containing ``FEATURES``
+
+    Returns:
+        tuple: ``(frame, features)``: the parsed pandas DataFrame and its
+        feature matrix
+
+    Raises:
+        ValueError: If columns are missing, values invalid or the file too large
+    """
+    import pandas as pd
+
+    frame = pd.read_csv(io.BytesIO(data), nrows=MAX_UPLOAD_ROWS + 1)
+    if len(frame) > MAX_UPLOAD_ROWS:
+        raise ValueError(f"Please upload at most {MAX_UPLOAD_ROWS:,} rows.")
+    frame.columns = [str(column).strip().lower() for column in frame.columns]
+    missing = [name for name in FEATURES if name not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    contract = frame["contract"].astype(str).str.strip().str.lower()
+    contract = contract.map({name.lower(): code for code, name in enumerate(CONTRACTS)}).fillna(
+        pd.to_numeric(contract, errors="coerce")
+    )
+    paperless = frame["paperless_billing"].astype(str).str.strip().str.lower().map(
+        {"yes": 1, "true": 1, "1": 1, "1.0": 1, "no": 0, "false": 0, "0": 0, "0.0": 0}
+    )
+    columns = [pd.to_numeric(frame[name], errors="coerce") for name in FEATURES[:3]] + [contract, paperless]
+    features = np.column_stack([column.to_numpy(dtype=float) for column in columns])
+
+    invalid = np.isnan(features).any(axis=1) | ~np.isin(features[:, 3], range(len(CONTRACTS)))
+    if invalid.any():
+        first = int(np.argmax(invalid)) + 2
+        raise ValueError(f"{int(invalid.sum()):,} rows have missing or invalid values (first on line {first}).")
+    return frame, features
+
+
+def risk_label(probability):
+    """Traffic-light label of a churn probability"""
+    if probability >= HIGH_RISK:
+        return "🔴 High risk"
+    if probability >= MEDIUM_RISK:
+        return "🟠 Medium risk"
+    return "🟢 Low risk"
+
+
+def show_single_customer(model):
+    """Score one customer entered in the form"""
+    col1, col2 = st.columns(2)
+    with col1:
+        tenure = st.slider("Tenure (months)", 1, 72, 8, key="churn_tenure")
+        charges = st.slider("Monthly charges ($)", 20.0, 120.0, 85.0, step=0.5, key="churn_charges")
+        calls = st.slider("Support calls (last quarter)", 0, 10, 3, key="churn_calls")
+    with col2:
+        contract = st.selectbox("Contract", CONTRACTS, key="churn_contract")
+        paperless = st.toggle("Paperless billing", value=True, key="churn_paperless")
+
+        start = time.perf_counter()
+        probability = model.score(np.array([[tenure, charges, calls, CONTRACTS.index(contract), paperless]]))[0]
+        elapsed = (time.perf_counter() - start) * 1000
+        st.metric("Churn probability", f"{probability:.0%}", risk_label(probability), delta_color="off")
+        st.caption(f"Scored in {elapsed:.1f} ms")
+
+
+def show_batch_upload(model):
+    """Score an uploaded CSV, keeping the result in the session"""
+    st.download_button(
+        "Download a sample CSV", sample_csv(), file_name="churn_sample.csv", mime="text/csv", key="churn_sample"
+    )
+    upload = st.file_uploader("Upload customers (CSV)", type="csv", key="churn_upload")
+    if upload is None:
+        st.caption(f"Columns: {', '.join(FEATURES)}. Up to {MAX_UPLOAD_ROWS:,} rows.")
+        return
+
+    result = st.session_state.get("churn_result")
+    if result is None or result["file_id"] != upload.file_id:
+        try:
+            frame, features = parse_customers(upload.getvalue())
+        except ValueError as e:
+            st.error(str(e))
+            return
+        start = time.perf_counter()
+        scores = model.score(features)
+        elapsed = (time.perf_counter() - start) * 1000
+        frame["churn_probability"] = scores.round(4)
+        result = st.session_state["churn_result"] = {
+            "file_id": upload.file_id,
+            "frame": frame,
+            "elapsed": elapsed,
+            "csv": frame.to_csv(index=False).encode("utf-8"),
+        }
+
+    frame = result["frame"]
+    scores = frame["churn_probability"].to_numpy()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Customers scored", f"{len(frame):,}", f"in {result['elapsed']:.0f} ms", delta_color="off")
+    col2.metric("Predicted churn rate", f"{scores.mean():.1%}")
+    col3.metric("High risk", f"{int((scores >= HIGH_RISK).sum()):,}", f"p ≥ {HIGH_RISK:.0%}", delta_color="off")
+
+    st.write("**Highest risk customers**")
+    st.dataframe(frame.nlargest(20, "churn_probability"), hide_index=True, use_container_width=True)
+    st.download_button(
+        "Download scored CSV", result["csv"], file_name="churn_scored.csv", mime="text/csv", key="churn_scored"
+    )
+
+
+@st.fragment
+@timed_fragment("projects")
+def render_demo():
+    """Display the churn prediction demo; its widgets rerun only the demo"""
+    if _model is None:
+        with st.spinner("Training the model (once per server)..."):
+            model = get_model()
+    else:
+        model = _model
+    st.caption(
+        f"Gradient boosting trained on {TRAINING_CUSTOMERS:,} synthetic customers "
+        f"({model.churn_rate:.0%} churned) in {model.training_ms:.0f} ms; holdout ROC AUC {model.auc:.3f}."
+    )
+
+    mode = st.radio("Score", ("One customer", "A CSV file"), horizontal=True, key="churn_mode")
+    if mode == "One customer":
+        show_single_customer(model)
+    else:
+        show_batch_upload(model)
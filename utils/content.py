@@ -0,0 +1,234 @@
+"""
+Structured portfolio content for the Streamlit portfolio application
+
+All page copy lives in ``content/portfolio.json`` (or a YAML file when PyYAML
+is installed). It is parsed once per process into frozen, slotted records
+that every session shares; editing the file is picked up on the next rerun
+without restarting the app, because the parse goes through the same
+mtime-validated cache as the other assets.
+"""
+
+import functools
+import json
+import os
+import typing
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+from utils.assets import get_file_variants
+
+CONTENT_PATH = os.environ.get("PORTFOLIO_CONTENT", "content/portfolio.json")
+
+
+@dataclass(frozen=True, slots=True)
+class Metric:
+    label: str
+    value: str
+    delta: str = None
+
+
+@dataclass(frozen=True, slots=True)
+class Group:
+    """A titled list of short items, rendered as bullets"""
+
+    title: str
+    items: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Link:
+    label: str
+    url: str
+
+
+@dataclass(frozen=True, slots=True)
+class Skill:
+    name: str
+    level: int
+
+
+@dataclass(frozen=True, slots=True)
+class Role:
+    title: str
+    role: str
+    duration: str
+    responsibilities: tuple[str, ...]
+    metrics: tuple[Metric, ...]
+    expanded: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class Degree:
+    title: str
+    degree: str
+    institution: str
+    duration: str
+    status: str
+    coursework: tuple[str, ...]
+    metrics: tuple[Metric, ...]
+    expanded: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    title: str
+    overview: str
+    features: tuple[str, ...]
+    technologies: str
+    metrics: tuple[Metric, ...]
+    expanded: bool = False
+    # Key of a live demo in sections/projects.py DEMOS
+    demo: str = None
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectCategory:
+    tab: str
+    heading: str
+    projects: tuple[Project, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class HomeContent:
+    summary: str
+    highlights: tuple[Metric, ...]
+    navigation_hint: str
+    quick_links: tuple[Group, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class AboutContent:
+    background: str
+    competencies: tuple[str, ...]
+    attributes: tuple[str, ...]
+    status: str
+    philosophy: str
+
+
+@dataclass(frozen=True, slots=True)
+class SkillsContent:
+    languages: tuple[Skill, ...]
+    tools: tuple[Group, ...]
+    expertise: tuple[Group, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ExperienceContent:
+    roles: tuple[Role, ...]
+    skills_developed: tuple[Group, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class EducationContent:
+    degrees: tuple[Degree, ...]
+    learning: tuple[Group, ...]
+    philosophy: str
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectsContent:
+    intro: str
+    categories: tuple[ProjectCategory, ...]
+    github_url: str
+    custom_intro: str
+    offerings: tuple[Group, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ContactContent:
+    intro: str
+    subjects: tuple[str, ...]
+    email: str
+    phone: str
+    profiles: tuple[Link, ...]
+    availability: tuple[str, ...]
+    working_hours: tuple[str, ...]
+    stats: tuple[Metric, ...]
+    services: tuple[Group, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioContent:
+    home: HomeContent
+    about: AboutContent
+    skills: SkillsContent
+    experience: ExperienceContent
+    education: EducationContent
+    projects: ProjectsContent
+    contact: ContactContent
+
+
+@functools.lru_cache(maxsize=None)
+def _record_fields(cls):
+    """Resolve a record's field annotations once instead of per instance"""
+    hints = typing.get_type_hints(cls)
+    return {field.name: hints[field.name] for field in fields(cls)}
+
+
+def _convert(value, annotation):
+    """Convert parsed JSON/YAML data to the type named by a field annotation"""
+    if typing.get_origin(annotation) is tuple:
+        item_type = typing.get_args(annotation)[0]
+        return tuple(_convert(item, item_type) for item in value)
+    if isinstance(annotation, type) and hasattr(annotation, "__dataclass_fields__"):
+        return build_record(annotation, value)
+    return value
+
+
+def build_record(cls, data):
+    """
+    Build a content record from a mapping, recursively
+
+    Args:
+        cls (type): Record dataclass to build
+        data (dict): Parsed mapping for that record
+
+    Returns:
+        object: Instance of ``cls``
+
+    Raises:
+        ValueError: If the mapping has unknown keys or misses required ones
+    """
+    hints = _record_fields(cls)
+    unknown = set(data) - hints.keys()
+    if unknown:
+        raise ValueError(f"Unknown {cls.__name__} fields: {', '.join(sorted(unknown))}")
+    try:
+        return cls(**{key: _convert(value, hints[key]) for key, value in data.items()})
+    except TypeError as e:
+        raise ValueError(f"Invalid {cls.__name__} content: {e}") from None
+
+
+def parse_content(data, suffix=".json"):
+    """
+    Parse a content file into records
+
+    Args:
+        data (bytes): Raw file contents
+        suffix (str): File suffix selecting the format (".json", ".yaml", ".yml")
+
+    Returns:
+        PortfolioContent: Parsed content
+    """
+    if suffix in (".yaml", ".yml"):
+        import yaml
+
+        raw = yaml.safe_load(data)
+    else:
+        raw = json.loads(data)
+    return build_record(PortfolioContent, raw)
+
+
+def get_content(path=CONTENT_PATH):
+    """
+    Get the portfolio content shared by all sessions
+
+    Args:
+        path (str): Path to the content file
+
+    Returns:
+        PortfolioContent: Parsed content, re-parsed only when the file changes
+    """
+    suffix = Path(path).suffix.lower()
+    variants = get_file_variants(path, "content", lambda data: {"content": parse_content(data, suffix)})
+    return variants["content"]
@@ -0,0 +1,115 @@
+"""
+Local diagnostics server for the Streamlit portfolio application
+
+A small HTTP server in a daemon thread, separate from Streamlit's own port,
+where instrumentation modules register read-only routes (Prometheus metrics
+at ``/metrics``, memory reports, tracemalloc snapshots). It binds to
+localhost by default: the routes expose process internals and are meant for
+the operator, not for visitors.
+
+The app starts it for ``/metrics`` unless ``PORTFOLIO_METRICS=0``; memory
+diagnostics (``PORTFOLIO_DIAGNOSTICS=1``) add their routes to the same
+server. It listens on ``<PORTFOLIO_DIAGNOSTICS_HOST>:<PORTFOLIO_DIAGNOSTICS_PORT>``,
+offset by the worker index when ``run_portfolio.py`` runs several workers,
+so each worker is scraped on its own port.
+"""
+
+import json
+import logging
+import os
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from utils.metrics import render_metrics
+
+DIAGNOSTICS_HOST = os.environ.get("PORTFOLIO_DIAGNOSTICS_HOST", "127.0.0.1")
+# Workers started by the proxy are numbered from 0: worker N listens on base + N
+WORKER_INDEX = int(os.environ.get("PORTFOLIO_WORKER", "0"))
+DIAGNOSTICS_PORT = int(os.environ.get("PORTFOLIO_DIAGNOSTICS_PORT", "8503")) + WORKER_INDEX
+
+logger = logging.getLogger(__name__)
+
+_server_lock = threading.Lock()
+_server = None
+_server_started = False
+# URL path -> handler(query) returning (content type, body)
+_routes = {}
+
+
+def register_route(path, handler):
+    """
+    Serve ``handler(query)`` at a path of the diagnostics server
+
+    Args:
+        path (str): URL path, e.g. "/memory"
+        handler (callable): Takes the parsed query string (dict of lists) and
+            returns ``(content_type, body)``; a dict or list body is sent as JSON
+    """
+    _routes[path] = handler
+
+
+class DiagnosticsRequestHandler(BaseHTTPRequestHandler):
+    """Dispatch GET requests to the registered routes"""
+
+    server_version = "PortfolioDiagnostics/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        handler = _routes.get(url.path)
+        if handler is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        try:
+            content_type, body = handler(parse_qs(url.query))
+        except Exception as e:
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, explain=str(e))
+            return
+        if not isinstance(body, (str, bytes)):
+            body = json.dumps(body, indent=2, default=str)
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Streamlit owns the console; scrapes are too chatty to log
+        pass
+
+
+def start_diagnostics_server(host=DIAGNOSTICS_HOST, port=DIAGNOSTICS_PORT):
+    """
+    Start the diagnostics server in a daemon thread if it is not already running
+
+    Args:
+        host (str): Interface to bind to
+        port (int): Port to listen on
+
+    Returns:
+        bool: True if this process serves diagnostics, False if the port is
+        already taken
+    """
+    global _server, _server_started
+    with _server_lock:
+        if _server_started:
+            return _server is not None
+        _server_started = True
+
+        try:
+            _server = ThreadingHTTPServer((host, port), DiagnosticsRequestHandler)
+        except OSError as e:
+            logger.warning("Diagnostics server not started on %s:%s: %s", host, port, e)
+            return False
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="diagnostics-server", daemon=True).start()
+        return True
+
+
+register_route("/metrics", lambda query: ("text/plain; version=0.0.4; charset=utf-8", render_metrics()))
@@ -0,0 +1,260 @@
+"""
+Live sales forecasting demo for the Projects page
+
+Four years of daily sales are generated once per process: trend, weekly and
+yearly seasonality, payday promotions and holiday peaks, with multiplicative
+noise. Forecasts come from a log-linear regression on a trend, Fourier
+seasonality terms and the (known in advance) promotion calendar, fitted by
+least squares over the whole design matrix at once.
+
+Both steps are memoized in bounded LRU caches shared by every session:
+fitted models by seasonality settings, forecasts by settings and horizon. A
+new horizon only projects the cached fit over more days, so moving the
+slider never refits, and settings someone already chose come back without
+computing anything.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.memo import LruCache
+from utils.metrics import timed_fragment
+
+START = np.datetime64("2021-01-01")
+HISTORY_DAYS = 4 * 365 + 1
+HOLDOUT_DAYS = 90
+MAX_HORIZON = 365
+SHOWN_HISTORY_DAYS = 365
+SEED = 11
+
+# Fourier terms per seasonality: (period in days, order)
+WEEKLY = (7, 3)
+YEARLY = (365.25, 6)
+
+# Fits by seasonality settings (at most 8 combinations); forecasts by
+# settings and horizon
+MAX_FITS = 8
+MAX_FORECASTS = 256
+
+_fits = LruCache(MAX_FITS)
+_forecasts = LruCache(MAX_FORECASTS)
+_history_lock = threading.Lock()
+_history = None
+
+
+def calendar(days):
+    """
+    Calendar features of day offsets from ``START``
+
+    Args:
+        days (numpy.ndarray): Integer day offsets
+
+    Returns:
+        tuple: Day of week (0 = Monday), and whether each day is a promotion
+        (paydays on the 25th-27th, Black Friday week) or a holiday peak
+        (December 15th-24th)
+    """
+    dates = START + days
+    months = dates.astype("datetime64[M]")
+    day_of_month = (dates - months).astype(int) + 1
+    month = months.astype(int) % 12 + 1
+    weekday = (dates.astype(int) + 3) % 7
+    promotion = ((day_of_month >= 25) & (day_of_month <= 27)) | ((month == 11) & (day_of_month >= 23))
+    holiday = (month == 12) & (day_of_month >= 15) & (day_of_month <= 24)
+    return weekday, promotion, holiday
+
+
+def generate_history():
+    """
+    Generate the daily sales series
+
+    Returns:
+        numpy.ndarray: Units sold per day from ``START``, ``HISTORY_DAYS`` long
+    """
+    rng = np.random.default_rng(SEED)
+    days = np.arange(HISTORY_DAYS)
+    weekday, promotion, holiday = calendar(days)
+    years = days / 365.25
+    level = 800 * (1 + 0.18 * years)
+    weekly = np.array([0.92, 0.9, 0.95, 1.0, 1.1, 1.22, 0.91])[weekday]
+    yearly = 1 + 0.12 * np.cos(2 * np.pi * (years - 0.95)) + 0.05 * np.sin(4 * np.pi * years)
+    events = np.where(promotion, 1.3, 1.0) * np.where(holiday, 1.45, 1.0)
+    noise = rng.lognormal(0, 0.07, HISTORY_DAYS)
+    return np.round(level * weekly * yearly * events * noise)
+
+
+def get_history():
+    """Get the process-wide sales series, generating it on first use"""
+    global _history
+    if _history is None:
+        with _history_lock:
+            if _history is None:
+                history = generate_history()
+                history.flags.writeable = False
+                _history = history
+    return _history
+
+
+def design_matrix(days, weekly, yearly, events):
+    """
+    Regressors of a set of days
+
+    Args:
+        days (numpy.ndarray): Integer day offsets from ``START``
+        weekly (bool): Include weekly Fourier terms
+        yearly (bool): Include yearly Fourier terms
+        events (bool): Include promotion and holiday indicators
+
+    Returns:
+        numpy.ndarray: One row per day
+    """
+    columns = [np.ones(len(days)), days / 365.25]
+    for enabled, (period, order) in ((weekly, WEEKLY), (yearly, YEARLY)):
+        if enabled:
+            angles = 2 * np.pi * np.outer(days / period, np.arange(1, order + 1))
+            columns.extend((np.sin(angles).T, np.cos(angles).T))
+    if events:
+        _, promotion, holiday = calendar(days)
+        columns.extend((promotion, holiday))
+    return np.vstack(columns).T
+
+
+class FittedModel:
+    """Regression coefficients on log sales plus holdout accuracy"""
+
+    def __init__(self, coefficients, sigma, holdout_mape, fit_ms):
+        self.coefficients = coefficients
+        self.sigma = sigma
+        self.holdout_mape = holdout_mape
+        self.fit_ms = fit_ms
+
+
+def _least_squares(design, target):
+    """Coefficients and residual standard deviation of a least squares fit"""
+    coefficients = np.linalg.lstsq(design, target, rcond=None)[0]
+    residuals = target - design @ coefficients
+    return coefficients, residuals.std(ddof=design.shape[1])
+
+
+def fit_model(weekly, yearly, events):
+    """
+    Fit the forecasting model on the full history
+
+    The last ``HOLDOUT_DAYS`` are first held out to measure accuracy, then
+    the model is refitted on everything.
+
+    Args:
+        weekly (bool): Model weekly seasonality
+        yearly (bool): Model yearly seasonality
+        events (bool): Model promotions and holidays
+
+    Returns:
+        FittedModel: Fitted model
+    """
+    start = time.perf_counter()
+    target = np.log(get_history())
+    design = design_matrix(np.arange(HISTORY_DAYS), weekly, yearly, events)
+
+    split = HISTORY_DAYS - HOLDOUT_DAYS
+    coefficients, _ = _least_squares(design[:split], target[:split])
+    predicted = np.exp(design[split:] @ coefficients)
+    actual = np.exp(target[split:])
+    holdout_mape = np.mean(np.abs(predicted - actual) / actual)
+
+    coefficients, sigma = _least_squares(design, target)
+    return FittedModel(coefficients, sigma, holdout_mape, (time.perf_counter() - start) * 1000)
+
+
+def project(model, horizon, weekly, yearly, events):
+    """
+    Forecast the days after the history with a fitted model
+
+    Args:
+        model (FittedModel): Model fitted with the same settings
+        horizon (int): Number of days to forecast
+        weekly, yearly, events (bool): Settings the model was fitted with
+
+    Returns:
+        numpy.ndarray: ``horizon x 3`` read-only array of the forecast and
+        its 95% interval
+    """
+    days = np.arange(HISTORY_DAYS, HISTORY_DAYS + horizon)
+    log_forecast = design_matrix(days, weekly, yearly, events) @ model.coefficients
+    spread = 1.96 * model.sigma
+    forecast = np.exp(np.column_stack((log_forecast, log_forecast - spread, log_forecast + spread)))
+    forecast.flags.writeable = False
+    return forecast
+
+
+def get_forecast(horizon, weekly, yearly, events):
+    """
+    Get a forecast, reusing cached forecasts and fitted models
+
+    Args:
+        horizon (int): Number of days to forecast
+        weekly, yearly, events (bool): Seasonality settings
+
+    Returns:
+        tuple: Forecast array (see ``project``), the fitted model, and how
+        the forecast was obtained: "cached", "projected" or "fitted"
+    """
+    settings = (weekly, yearly, events)
+    model, model_cached = _fits.get_or_compute(settings, lambda: fit_model(*settings))
+    forecast, cached = _forecasts.get_or_compute(
+        (*settings, horizon), lambda: project(model, horizon, *settings)
+    )
+    return forecast, model, "cached" if cached else "projected" if model_cached else "fitted"
+
+
+def history_frame(horizon, forecast):
+    """Chart data: the last year of actual sales followed by the forecast"""
+    shown = SHOWN_HISTORY_DAYS
+    dates = START + np.arange(HISTORY_DAYS - shown, HISTORY_DAYS + horizon)
+    empty = np.full(horizon, np.nan)
+    padding = np.full(shown, np.nan)
+    return pd.DataFrame({
+        "Actual": np.concatenate((get_history()[-shown:], empty)),
+        "Forecast": np.concatenate((padding, forecast[:, 0])),
+        "Lower (95%)": np.concatenate((padding, forecast[:, 1])),
+        "Upper (95%)": np.concatenate((padding, forecast[:, 2])),
+    }, index=pd.DatetimeIndex(dates, name="Date"))
+
+
+@st.fragment
+@timed_fragment("projects")
+def render_demo():
+    """Display the sales forecasting demo; its widgets rerun only the demo"""
+    horizon = st.slider("Forecast horizon (days)", 7, MAX_HORIZON, 90, step=7, key="forecast_horizon")
+    col1, col2, col3 = st.columns(3)
+    weekly = col1.toggle("Weekly seasonality", value=True, key="forecast_weekly")
+    yearly = col2.toggle("Yearly seasonality", value=True, key="forecast_yearly")
+    events = col3.toggle("Promotions and holidays", value=True, key="forecast_events")
+
+    start = time.perf_counter()
+    forecast, model, source = get_forecast(horizon, weekly, yearly, events)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    st.line_chart(history_frame(horizon, forecast), color=["#1f77b4", "#ff7f0e", "#ffbb78", "#ffbb78"])
+
+    history = get_history()
+    last_year = history[HISTORY_DAYS - 365:HISTORY_DAYS - 365 + horizon].sum()
+    col1, col2, col3 = st.columns(3)
+    col1.metric(f"Forecast units, next {horizon} days", f"{forecast[:, 0].sum():,.0f}",
+                f"{forecast[:, 0].sum() / last_year - 1:+.1%} vs. last year")
+    col2.metric("Holdout error (MAPE)", f"{model.holdout_mape:.1%}", f"last {HOLDOUT_DAYS} days", delta_color="off")
+    col3.metric("Daily spread (95%)", f"±{np.expm1(1.96 * model.sigma):.0%}")
+
+    how = {
+        "cached": "served from the forecast cache",
+        "projected": "projected from a cached fit, no refitting",
+        "fitted": f"fitted in {model.fit_ms:.1f} ms, then projected",
+    }[source]
+    st.caption(
+        f"{HISTORY_DAYS:,} days of generated sales; log-linear regression on trend, Fourier seasonality and the "
+        f"promotion calendar. This forecast was {how} ({elapsed:.1f} ms). Shared caches: {len(_fits)} fits, "
+        f"{len(_forecasts)} forecasts, {_forecasts.hits:,} hits / {_forecasts.misses:,} misses."
+    )
@@ -3,8 +3,12 @@ Helper functions for the Streamlit portfolio application
 """
 
 import base64
+import html
+import mimetypes
 import streamlit as st
 from pathlib import Path
+from utils.assets import get_public_base_url
+from utils.validation import is_valid_email
 
 def get_base64_of_file(path):
     """
@@ -24,10 +28,34 @@ def get_base64_of_file(path):
         st.error(f"File not found: {path}")
         return None
 
+def get_asset_url(file_path, download_filename=None):
+    """
+    Get the cacheable, content-hashed URL of a file in assets/
+
+    Args:
+        file_path (str): Path to the file
+        download_filename (str, optional): Name to save the file under
+
+    Returns:
+        str: URL of the file, or None if it does not exist. Without a public
+        asset base URL (see ``utils.assets.get_public_base_url``) it is only
+        reachable from the machine running the app
+    """
+    # The asset server (and http.server with it) is only loaded on first use
+    from utils.static_assets import asset_url
+
+    return asset_url(file_path, download_name=download_filename)
+
 def create_download_link(file_path, download_filename, link_text):
     """
     Create a download link for a file
     
+    When a public asset base URL is configured, the link points at the
+    content-hashed static asset route, so the file is fetched (and cached by
+    the browser) on demand. Otherwise the asset server is only reachable
+    from the machine running the app, and the file is inlined into the page
+    as a base64 data URI instead.
+    
     Args:
         file_path (str): Path to the file to be downloaded
         download_filename (str): Name for the downloaded file
@@ -36,15 +64,19 @@ def create_download_link(file_path, download_filename, link_text):
     Returns:
         str: HTML string for the download link
     """
-    try:
-        with open(file_path, "rb") as file:
-            contents = file.read()
-        
-        b64 = base64.b64encode(contents).decode()
-        href = f'<a href="data:application/pdf;base64,{b64}" download="{download_filename}">{link_text}</a>'
-        return href
-    except FileNotFoundError:
+    if get_public_base_url():
+        url = get_asset_url(file_path, download_filename)
+    else:
+        try:
+            with open(file_path, "rb") as file:
+                contents = base64.b64encode(file.read()).decode()
+            content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+            url = f"data:{content_type};base64,{contents}"
+        except FileNotFoundError:
+            url = None
+    if url is None:
         return f"<span style='color: red;'>File not found: {file_path}</span>"
+    return f'<a href="{html.escape(url)}" download="{html.escape(download_filename)}">{link_text}</a>'
 
 def load_css(css_file):
     """
@@ -85,6 +117,70 @@ def create_metric_card(title, value, delta=None):
     else:
         st.metric(title, value)
 
+def display_metrics(metrics):
+    """
+    Display a vertical stack of metrics
+    
+    Args:
+        metrics (iterable): Records with label, value and delta attributes
+    """
+    for metric in metrics:
+        st.metric(metric.label, metric.value, metric.delta)
+
+def display_bullet_groups(groups):
+    """
+    Display titled bullet lists side by side, one column per group
+    
+    Args:
+        groups (sequence): Records with title and items attributes
+    """
+    for col, group in zip(st.columns(len(groups)), groups):
+        with col:
+            with TextBlock() as block:
+                block.write(f"**{group.title}**")
+                block.bullets(group.items)
+
+class TextBlock:
+    """
+    Buffer consecutive lines of text and write them as one markdown element
+
+    Every ``st.write`` call is its own element, delta and frontend diff. Lines
+    written to a block are kept as separate paragraphs, so the page looks the
+    same, but reach the browser as a single element when the block is flushed
+    (on leaving the ``with`` statement, or by calling ``flush``).
+
+    Example:
+        with TextBlock() as block:
+            block.write("**Key Features:**")
+            block.bullets(features)
+    """
+
+    def __init__(self, bullet="•"):
+        self.bullet = bullet
+        self._lines = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+        return False
+
+    def write(self, text):
+        """Add a paragraph of markdown text"""
+        self._lines.append(str(text).strip("\n"))
+
+    def bullets(self, items, prefix=None):
+        """Add one bullet paragraph per item"""
+        prefix = self.bullet if prefix is None else prefix
+        self._lines.extend(f"{prefix} {item}" for item in items)
+
+    def flush(self):
+        """Write the buffered lines as one markdown element"""
+        if self._lines:
+            st.markdown("\n\n".join(self._lines))
+            self._lines = []
+
 def format_experience_duration(start_date, end_date=None):
     """
     Format experience duration for display
@@ -136,9 +232,7 @@ def validate_email(email):
     Returns:
         bool: True if email format is valid
     """
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return is_valid_email(email)
 
 def get_file_size(file_path):
     """
@@ -159,44 +253,3 @@ def get_file_size(file_path):
         return f"{size:.1f} TB"
     except FileNotFoundError:
         return "File not found"
-
-# Constants for the application
-SKILLS_DATA = {
-    "Programming Languages": {
-        "Python": 95,
-        "R": 80,
-        "SQL": 90,
-        "JavaScript": 70
-    },
-    "Data Science Tools": {
-        "Pandas": 95,
-        "NumPy": 90,
-        "Scikit-learn": 85,
-        "TensorFlow": 80,
-        "Matplotlib": 90,
-        "Seaborn": 85
-    },
-    "Visualization Tools": {
-        "Tableau": 85,
-        "Power BI": 80,
-        "Plotly": 75,
-        "Excel": 90
-    }
-}
-
-SOCIAL_LINKS = {
-    "Fiverr": "https://www.fiverr.com/festusbombo",
-    "Upwork": "https://www.upwork.com/freelancers/festusbombo", 
-    "LinkedIn": "https://linkedin.com/in/festusbombo",
-    "GitHub": "https://github.com/Bombo9",
-    "Email": "mailto:bombomatsitsa@gmail.com"
-}
-
-PROJECT_CATEGORIES = [
-    "Data Analysis",
-    "Machine Learning", 
-    "Data Visualization",
-    "Business Intelligence",
-    "Statistical Modeling",
-    "A/B Testing"
-]
@@ -0,0 +1,318 @@
+"""
+Live financial market analysis demo for the Projects page
+
+A panel of 200 tickers in 10 sectors is generated once per process from a
+factor model (market, sector and stock-specific returns, with a volatility
+spike), about three years of trading days. Prefix sums of returns, squared
+returns and prices are kept with it, so any rolling mean, volatility or
+Bollinger band is computed for every ticker and day at once, whatever the
+window.
+
+For each window the demo also keeps the cross-product matrix and column
+sums of the last ``window`` daily returns, from which the full 200 x 200
+correlation matrix follows in one step. These results are memoized per
+window in an LRU cache shared by every session. A window nobody has chosen
+yet is derived from the nearest cached one by adding or removing only the
+days between the two, so moving the slider costs a few rank-one updates
+instead of a full recomputation.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.memo import LruCache
+from utils.metrics import timed_fragment
+
+SECTORS = (
+    "Technology", "Healthcare", "Financials", "Energy", "Industrials",
+    "Consumer Disc.", "Consumer Staples", "Utilities", "Materials", "Real Estate",
+)
+TICKERS_PER_SECTOR = 20
+TRADING_DAYS = 756
+FIRST_DAY = "2022-01-03"
+SEED = 3
+ANNUALIZE = np.sqrt(252)
+
+MIN_WINDOW = 20
+MAX_WINDOW = 252
+RSI_DAYS = 14
+# Each cached window holds about 1 MB (correlation state and the rolling
+# volatility of every ticker)
+MAX_WINDOWS = 24
+
+_panel_lock = threading.Lock()
+_panel = None
+_windows = LruCache(MAX_WINDOWS)
+
+
+def _tickers(rng, count):
+    """Unique random 3-4 letter symbols"""
+    letters = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    symbols = []
+    while len(symbols) < count:
+        symbol = "".join(rng.choice(letters, rng.integers(3, 5)))
+        if symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+class MarketPanel:
+    """Generated prices of every ticker plus prefix sums for rolling statistics"""
+
+    def __init__(self, seed=SEED):
+        rng = np.random.default_rng(seed)
+        count = len(SECTORS) * TICKERS_PER_SECTOR
+        self.tickers = _tickers(rng, count)
+        self.sector = np.repeat(np.arange(len(SECTORS)), TICKERS_PER_SECTOR)
+        self.dates = np.busday_offset(FIRST_DAY, np.arange(TRADING_DAYS + 1), roll="forward")
+
+        # Market volatility triples for a few months in the middle
+        days = np.arange(TRADING_DAYS)
+        stress = np.where((days >= 380) & (days < 450), 2.5, 1.0)
+        market = rng.normal(0.0004, 0.009, TRADING_DAYS) * stress
+        sectors = rng.normal(0, 0.007, (TRADING_DAYS, len(SECTORS))) * stress[:, None]
+        beta = rng.uniform(0.6, 1.5, count)
+        loading = rng.uniform(0.5, 1.3, count)
+        specific = rng.normal(0, 1, (TRADING_DAYS, count)) * rng.uniform(0.008, 0.022, count)
+        self.returns = market[:, None] * beta + sectors[:, self.sector] * loading + specific
+
+        start_prices = rng.uniform(15, 400, count)
+        log_prices = np.vstack((np.zeros(count), np.cumsum(self.returns, axis=0)))
+        self.prices = start_prices * np.exp(log_prices)
+
+        def prefix(values):
+            return np.vstack((np.zeros(values.shape[1]), np.cumsum(values, axis=0)))
+
+        self.returns_sum = prefix(self.returns)
+        self.returns_squares = prefix(self.returns ** 2)
+        self.prices_sum = prefix(self.prices)
+        self.prices_squares = prefix(self.prices ** 2)
+        for array in (self.returns, self.prices, self.returns_sum, self.returns_squares,
+                      self.prices_sum, self.prices_squares):
+            array.flags.writeable = False
+
+    def rolling_volatility(self, window):
+        """
+        Annualized rolling volatility of every ticker
+
+        Returns:
+            numpy.ndarray: ``(TRADING_DAYS - window + 1) x tickers``, row ``i``
+            covering returns ``i`` to ``i + window - 1``
+        """
+        total = self.returns_sum[window:] - self.returns_sum[:-window]
+        squares = self.returns_squares[window:] - self.returns_squares[:-window]
+        variance = (squares - total ** 2 / window) / (window - 1)
+        return np.sqrt(np.maximum(variance, 0)) * ANNUALIZE
+
+    def bands(self, ticker, window):
+        """
+        Moving average and Bollinger bands (2 standard deviations) of a price
+
+        Returns:
+            tuple: Average, lower and upper band for prices ``window - 1`` on
+        """
+        total = self.prices_sum[window:, ticker] - self.prices_sum[:-window, ticker]
+        squares = self.prices_squares[window:, ticker] - self.prices_squares[:-window, ticker]
+        average = total / window
+        deviation = np.sqrt(np.maximum(squares / window - average ** 2, 0))
+        return average, average - 2 * deviation, average + 2 * deviation
+
+    def rsi(self, ticker, days=RSI_DAYS):
+        """Relative strength index of a ticker's last ``days`` price changes"""
+        changes = np.diff(self.prices[-days - 1:, ticker])
+        gains, losses = changes[changes > 0].sum(), -changes[changes < 0].sum()
+        return 100.0 if losses == 0 else 100 - 100 / (1 + gains / losses)
+
+
+def get_panel():
+    """Get the process-wide price panel, generating it on first use"""
+    global _panel
+    if _panel is None:
+        with _panel_lock:
+            if _panel is None:
+                _panel = MarketPanel()
+    return _panel
+
+
+class WindowStats:
+    """
+    Correlation state and rolling volatility of one window length
+
+    ``cross`` and ``total`` are the cross-product matrix and column sums of
+    the last ``window`` daily returns; the correlation matrix follows from
+    them directly.
+    """
+
+    def __init__(self, window, cross, total, panel):
+        self.window = window
+        self.cross = cross
+        self.total = total
+        covariance = (cross - np.outer(total, total) / window) / (window - 1)
+        deviation = np.sqrt(np.diag(covariance))
+        self.correlation = (covariance / np.outer(deviation, deviation)).astype(np.float32)
+        self.volatility = panel.rolling_volatility(window).astype(np.float32)
+
+        # Average correlation between the tickers of each pair of sectors,
+        # excluding each ticker's correlation with itself
+        members = np.eye(len(SECTORS))[panel.sector]
+        counts = members.sum(axis=0)
+        sums = members.T @ self.correlation @ members - np.diag(counts)
+        self.sector_correlation = sums / (np.outer(counts, counts) - np.diag(counts))
+
+    @classmethod
+    def compute(cls, panel, window):
+        """Compute from the last ``window`` returns"""
+        recent = panel.returns[-window:]
+        return cls(window, recent.T @ recent, recent.sum(axis=0), panel)
+
+    @classmethod
+    def update(cls, panel, base, window):
+        """Derive from the stats of another window, touching only the days in between"""
+        if window > base.window:
+            added = panel.returns[-window:-base.window]
+            cross, total = base.cross + added.T @ added, base.total + added.sum(axis=0)
+        else:
+            removed = panel.returns[-base.window:-window]
+            cross, total = base.cross - removed.T @ removed, base.total - removed.sum(axis=0)
+        return cls(window, cross, total, panel)
+
+
+def get_window_stats(window):
+    """
+    Get the statistics of a window, shared by every session
+
+    Args:
+        window (int): Window length in trading days
+
+    Returns:
+        tuple: ``WindowStats`` and how they were obtained: "cached",
+        "updated from <n> days" or "computed"
+    """
+    panel = get_panel()
+    source = "computed"
+
+    def compute():
+        nonlocal source
+        cached = [stats for _, stats in _windows.items()]
+        if cached:
+            base = min(cached, key=lambda stats: abs(stats.window - window))
+            # Beyond this, rebuilding from the window's own rows is cheaper
+            if abs(base.window - window) < window:
+                source = f"updated from {base.window} days"
+                return WindowStats.update(panel, base, window)
+        return WindowStats.compute(panel, window)
+
+    stats, cached = _windows.get_or_compute(window, compute)
+    return stats, "cached" if cached else source
+
+
+def line_chart(dates, series, colors=None, percent=False):
+    """
+    Display daily series as a line chart
+
+    ``st.line_chart`` builds its chart through Altair, which takes longer
+    than everything else in the demo; this passes a Vega-Lite spec directly.
+
+    Args:
+        dates (numpy.ndarray): Date of each value
+        series (dict): Series name to values
+        colors (list): Line colors in ``series`` order, if not the default
+        percent (bool): Format the values as percentages
+    """
+    frame = pd.DataFrame({"Date": pd.DatetimeIndex(dates), **series})
+    color = {"field": "Series", "type": "nominal", "sort": list(series), "title": None,
+             "legend": {"orient": "bottom"}}
+    if colors:
+        color["scale"] = {"domain": list(series), "range": colors}
+    st.vega_lite_chart(frame, {
+        "transform": [{"fold": list(series), "as": ["Series", "Value"]}],
+        "mark": {"type": "line", "strokeWidth": 1.5},
+        "encoding": {
+            "x": {"field": "Date", "type": "temporal", "title": None},
+            "y": {"field": "Value", "type": "quantitative", "title": None, "scale": {"zero": False},
+                  "axis": {"format": ".0%"} if percent else {}},
+            "color": color,
+        },
+    }, use_container_width=True)
+
+
+def sector_heatmap(stats):
+    """Display the average correlation between sectors as a heatmap"""
+    rows, columns = np.meshgrid(np.arange(len(SECTORS)), np.arange(len(SECTORS)), indexing="ij")
+    frame = pd.DataFrame({
+        "Sector": np.array(SECTORS)[rows.ravel()],
+        "With": np.array(SECTORS)[columns.ravel()],
+        "Correlation": stats.sector_correlation.ravel().round(2),
+    })
+    st.vega_lite_chart(frame, {
+        "mark": {"type": "rect", "tooltip": True},
+        "encoding": {
+            "x": {"field": "With", "type": "nominal", "sort": list(SECTORS), "title": None},
+            "y": {"field": "Sector", "type": "nominal", "sort": list(SECTORS), "title": None},
+            "color": {"field": "Correlation", "type": "quantitative",
+                      "scale": {"scheme": "blueorange", "domain": [-1, 1]}},
+        },
+    }, use_container_width=True)
+
+
+@st.fragment
+@timed_fragment("projects")
+def render_demo():
+    """Display the market analysis demo; its widgets rerun only the demo"""
+    panel = get_panel()
+    col1, col2 = st.columns([2, 1])
+    window = col1.slider("Rolling window (trading days)", MIN_WINDOW, MAX_WINDOW, 60, key="market_window")
+    labels = [f"{ticker} ({SECTORS[sector]})" for ticker, sector in zip(panel.tickers, panel.sector)]
+    ticker = col2.selectbox("Ticker", range(len(labels)), format_func=labels.__getitem__, key="market_ticker")
+
+    start = time.perf_counter()
+    stats, source = get_window_stats(window)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    correlation = stats.correlation[ticker]
+    same_sector = panel.sector == panel.sector[ticker]
+    peers = np.flatnonzero(np.arange(len(panel.tickers)) != ticker)
+    closest = peers[np.argsort(correlation[peers])[::-1][:3]]
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric(f"Volatility ({window}d, annualized)", f"{stats.volatility[-1, ticker]:.1%}")
+    # Leave out the ticker's correlation of 1 with itself
+    same_sector_mean = (correlation[same_sector].sum() - 1) / (same_sector.sum() - 1)
+    col2.metric("Avg. correlation, same sector", f"{same_sector_mean:.2f}")
+    col3.metric("Avg. correlation, other sectors", f"{correlation[~same_sector].mean():.2f}")
+    col4.metric(f"RSI ({RSI_DAYS}d)", f"{panel.rsi(ticker):.0f}")
+    st.caption("Most correlated: " + ", ".join(
+        f"{panel.tickers[other]} {correlation[other]:.2f}" for other in closest
+    ))
+
+    dates = panel.dates[window - 1:]
+    average, lower, upper = panel.bands(ticker, window)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write(f"**{panel.tickers[ticker]} price, {window}-day average and Bollinger bands**")
+        line_chart(dates, {
+            "Price": panel.prices[window - 1:, ticker],
+            "Average": average,
+            "Lower band": lower,
+            "Upper band": upper,
+        }, colors=["#1f77b4", "#ff7f0e", "#bbbbbb", "#bbbbbb"])
+    with col2:
+        st.write(f"**{window}-day volatility, annualized**")
+        line_chart(dates[1:], {
+            panel.tickers[ticker]: stats.volatility[:, ticker],
+            f"{SECTORS[panel.sector[ticker]]} average": stats.volatility[:, same_sector].mean(axis=1),
+            "All tickers": stats.volatility.mean(axis=1),
+        }, percent=True)
+
+    st.write(f"**Average correlation between sectors, last {window} days**")
+    sector_heatmap(stats)
+
+    how = "served from the cache" if source == "cached" else source
+    st.caption(
+        f"{len(panel.tickers)} generated tickers over {TRADING_DAYS} trading days. The {len(panel.tickers)} x "
+        f"{len(panel.tickers)} correlation matrix and rolling volatility of every ticker were {how} in "
+        f"{elapsed:.1f} ms; {len(_windows)} windows cached for all visitors."
+    )
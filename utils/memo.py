@@ -0,0 +1,52 @@
+"""
+Memoization shared by the live project demos
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class LruCache:
+    """Thread-safe memo keeping the most recently used results"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        """
+        Get the result for a key, computing and storing it on a miss
+
+        Args:
+            key (tuple): Hashable parameters
+            compute (callable): Called with no arguments on a miss
+
+        Returns:
+            tuple: The result and whether it came from the cache
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key], True
+            self.misses += 1
+        # Computed outside the lock; two sessions missing the same key at
+        # once both compute it, which is harmless
+        value = compute()
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+        return value, False
+
+    def __len__(self):
+        return len(self._items)
+
+    def items(self):
+        """Snapshot of the cached ``(key, value)`` pairs, least recently used first"""
+        with self._lock:
+            return list(self._items.items())
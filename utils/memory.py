@@ -0,0 +1,300 @@
+"""
+Per-session memory accounting for the Streamlit portfolio application
+
+Each full rerun records an approximate footprint of its session: the values
+in ``st.session_state`` and the media files (images, downloads) Streamlit
+keeps for it. A sampler thread adds process totals (RSS, sessions, Streamlit
+caches, the shared asset cache) to a bounded history, so per-session cost
+and growth over time can be read off while the app serves real traffic.
+
+Reports are served by the diagnostics server:
+- ``/memory``: current per-session footprints and process totals
+- ``/memory/history``: process totals over time
+- ``/memory/snapshot``: tracemalloc top allocations, and growth since the
+  previous snapshot; the first call starts tracing (or set
+  ``PORTFOLIO_TRACEMALLOC=<frames>`` to trace from startup)
+
+Everything here is only imported when ``PORTFOLIO_DIAGNOSTICS=1``.
+"""
+
+import itertools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils.assets import get_cache_sizes
+from utils.diagnostics import register_route, start_diagnostics_server
+
+# A session is re-measured at most this often (seconds)
+SESSION_SAMPLE_INTERVAL = 10
+PROCESS_SAMPLE_INTERVAL = 60
+# One day of process samples at the default interval
+HISTORY_SIZE = 1440
+SNAPSHOT_DIR = Path(os.environ.get("PORTFOLIO_SNAPSHOT_DIR", "data/snapshots"))
+SNAPSHOT_TOP = 25
+# Snapshot files kept in SNAPSHOT_DIR (shared by all workers); older ones are deleted
+MAX_SNAPSHOTS = int(os.environ.get("PORTFOLIO_MAX_SNAPSHOTS", "10"))
+TRACEMALLOC_FRAMES = int(os.environ.get("PORTFOLIO_TRACEMALLOC", "0"))
+
+_lock = threading.Lock()
+# Session id -> latest footprint
+_sessions = {}
+_history = deque(maxlen=HISTORY_SIZE)
+_sampler = None
+# Serializes snapshots, which come from concurrent diagnostics requests, and
+# guards the previous one; separate from _lock so reruns never wait on it
+_snapshot_lock = threading.Lock()
+_previous_snapshot = None
+_snapshot_numbers = itertools.count()
+
+
+def approximate_size(obj, _seen=None):
+    """
+    Approximate the memory held by an object and everything it contains
+
+    Follows dicts, lists, tuples, sets and object ``__dict__``s, counting
+    shared objects once. Good enough to compare sessions, not an exact count.
+
+    Args:
+        obj (object): Object to measure
+
+    Returns:
+        int: Size in bytes
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj, 0)
+    if isinstance(obj, dict):
+        size += sum(approximate_size(key, _seen) + approximate_size(value, _seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(approximate_size(item, _seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += approximate_size(vars(obj), _seen)
+    return size
+
+
+def _session_media(session_id):
+    """
+    Count the media files Streamlit holds for a session
+
+    Streamlit has no public API for this, so the media file manager's
+    bookkeeping is read directly; returns ``(0, 0)`` if it changes shape.
+    """
+    try:
+        manager = runtime.get_instance().media_file_mgr
+        file_ids = set(manager._files_by_session_and_coord.get(session_id, {}).values())
+        files = manager._storage._files_by_id
+    except (AttributeError, RuntimeError):
+        return 0, 0
+    return len(file_ids), sum(len(files[file_id].content) for file_id in file_ids if file_id in files)
+
+
+def record_session_memory():
+    """
+    Record the footprint of the current session
+
+    Call once per rerun; measurements are throttled per session. Starts the
+    sampler and the diagnostics server on first use.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return
+    now = time.monotonic()
+    previous = _sessions.get(ctx.session_id)
+    if previous is not None and now - previous["measured"] < SESSION_SAMPLE_INTERVAL:
+        return
+
+    state = {key: st.session_state[key] for key in st.session_state}
+    media_files, media_bytes = _session_media(ctx.session_id)
+    with _lock:
+        _sessions[ctx.session_id] = {
+            "measured": now,
+            "state_keys": len(state),
+            "state_bytes": approximate_size(state),
+            "media_files": media_files,
+            "media_bytes": media_bytes,
+        }
+    _start_sampler()
+
+
+def _rss_bytes():
+    """Resident set size of this process, or None where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _streamlit_cache_bytes():
+    """Bytes per Streamlit cache category (st.cache_data, media, session state, ...)"""
+    try:
+        families = runtime.get_instance().stats_mgr.get_stats()
+    except RuntimeError:
+        return {}
+    totals = {}
+    for stats in families.values():
+        for stat in stats:
+            category = getattr(stat, "category_name", None)
+            if category is not None:
+                totals[category] = totals.get(category, 0) + stat.byte_length
+    return totals
+
+
+def _prune_sessions():
+    """Forget sessions that have disconnected"""
+    try:
+        instance = runtime.get_instance()
+    except RuntimeError:
+        return
+    with _lock:
+        for session_id in [sid for sid in _sessions if not instance.is_active_session(sid)]:
+            del _sessions[session_id]
+
+
+def sample_process(record=True):
+    """
+    Take a sample of process-wide memory totals
+
+    Args:
+        record (bool): Whether to add the sample to the history
+
+    Returns:
+        dict: The sample
+    """
+    _prune_sessions()
+    with _lock:
+        sessions = list(_sessions.values())
+    sample = {
+        "time": time.time(),
+        "rss_bytes": _rss_bytes(),
+        "sessions": len(sessions),
+        "session_state_bytes": sum(session["state_bytes"] for session in sessions),
+        "session_media_bytes": sum(session["media_bytes"] for session in sessions),
+        "streamlit_bytes": _streamlit_cache_bytes(),
+        "asset_cache": get_cache_sizes(),
+    }
+    if record:
+        with _lock:
+            _history.append(sample)
+    return sample
+
+
+def _sample_forever():
+    while True:
+        sample_process()
+        time.sleep(PROCESS_SAMPLE_INTERVAL)
+
+
+def _start_sampler():
+    global _sampler
+    if _sampler is not None:
+        return
+    with _lock:
+        if _sampler is not None:
+            return
+        _sampler = threading.Thread(target=_sample_forever, name="memory-sampler", daemon=True)
+        _sampler.start()
+    start_diagnostics_server()
+
+
+def memory_report():
+    """
+    Get the current per-session footprints and process totals
+
+    Returns:
+        dict: ``process`` totals, a ``per_session`` average and each session's
+        footprint keyed by a shortened session id
+    """
+    totals = sample_process(record=False)
+    with _lock:
+        sessions = {session_id[:8]: dict(session) for session_id, session in _sessions.items()}
+    for session in sessions.values():
+        session.pop("measured")
+    count = max(len(sessions), 1)
+    return {
+        "process": totals,
+        "per_session": {
+            "state_bytes": totals["session_state_bytes"] / count,
+            "media_bytes": totals["session_media_bytes"] / count,
+        },
+        "sessions": sessions,
+    }
+
+
+def take_snapshot(limit=SNAPSHOT_TOP):
+    """
+    Take a tracemalloc snapshot and report the top allocations
+
+    The first call only starts tracing, since allocations made before that
+    are invisible to tracemalloc. Each snapshot is written to
+    ``SNAPSHOT_DIR`` for offline analysis, where only the newest
+    ``MAX_SNAPSHOTS`` files are kept, and compared with the previous one to
+    show where memory grew.
+
+    Args:
+        limit (int): Number of source lines to report
+
+    Returns:
+        dict: Snapshot file, top allocations and growth by source line
+    """
+    global _previous_snapshot
+
+    with _snapshot_lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(max(TRACEMALLOC_FRAMES, 1))
+            return {"tracing": "started; request another snapshot once the app has served some traffic"}
+
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+        # Time first, so names sort oldest first; the pid keeps workers apart
+        # and the sequence number snapshots taken within the same second
+        name = f"snapshot-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_snapshot_numbers):04d}"
+        path = SNAPSHOT_DIR / f"{name}.tracemalloc"
+        snapshot.dump(str(path))
+        _rotate_snapshots()
+
+        report = {
+            "file": str(path),
+            "traced_bytes": tracemalloc.get_traced_memory()[0],
+            "top": [str(stat) for stat in snapshot.statistics("lineno")[:limit]],
+        }
+        if _previous_snapshot is not None:
+            report["growth"] = [str(stat) for stat in snapshot.compare_to(_previous_snapshot, "lineno")[:limit]]
+        _previous_snapshot = snapshot
+        return report
+
+
+def _rotate_snapshots(keep=MAX_SNAPSHOTS):
+    """Delete all but the newest ``keep`` snapshot files"""
+    paths = sorted(SNAPSHOT_DIR.glob("snapshot-*.tracemalloc"))
+    for path in paths[:max(len(paths) - keep, 0)]:
+        # Another worker may be rotating the same directory
+        path.unlink(missing_ok=True)
+
+
+def _limit(query):
+    return int(query.get("limit", [SNAPSHOT_TOP])[0])
+
+
+if TRACEMALLOC_FRAMES and not tracemalloc.is_tracing():
+    tracemalloc.start(TRACEMALLOC_FRAMES)
+
+register_route("/memory", lambda query: ("application/json", memory_report()))
+register_route("/memory/history", lambda query: ("application/json", list(_history)))
+register_route("/memory/snapshot", lambda query: ("application/json", take_snapshot(_limit(query))))
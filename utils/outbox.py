@@ -0,0 +1,319 @@
+"""
+Durable outbox for contact form messages
+
+Submitting the contact form only inserts a row into a local SQLite database,
+which takes well under a millisecond, so the rerun never waits on a mail
+server. A single background worker per process and outbox delivers pending
+messages over SMTP in batches, retrying connection and server errors with
+exponential backoff. The app starts it on its first run whenever SMTP is
+configured, so messages left pending by an earlier process are picked up
+without waiting for the next submission. Messages that cannot be built into
+an email are marked failed right away, since retrying cannot help them.
+
+Delivery is configured through the environment:
+- PORTFOLIO_SMTP_HOST / PORTFOLIO_SMTP_PORT: mail server (no host: messages
+  are kept in the outbox until one is configured)
+- PORTFOLIO_SMTP_USER / PORTFOLIO_SMTP_PASSWORD: optional login
+- PORTFOLIO_SMTP_STARTTLS: "1" to upgrade the connection with STARTTLS
+- PORTFOLIO_CONTACT_TO / PORTFOLIO_CONTACT_FROM: recipient and sender
+
+Any local SMTP stand-in works for trying it out, for example
+``python -m aiosmtpd -n -l localhost:8025`` with PORTFOLIO_SMTP_PORT=8025.
+"""
+
+import logging
+import os
+import random
+import smtplib
+import sqlite3
+import threading
+import time
+from email.errors import MessageError
+from email.headerregistry import Address
+from email.message import EmailMessage
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_PATH = os.environ.get("PORTFOLIO_OUTBOX", "data/outbox.sqlite3")
+
+SMTP_HOST = os.environ.get("PORTFOLIO_SMTP_HOST", "")
+SMTP_PORT = int(os.environ.get("PORTFOLIO_SMTP_PORT", "587"))
+SMTP_USER = os.environ.get("PORTFOLIO_SMTP_USER", "")
+SMTP_PASSWORD = os.environ.get("PORTFOLIO_SMTP_PASSWORD", "")
+SMTP_STARTTLS = os.environ.get("PORTFOLIO_SMTP_STARTTLS", "") == "1"
+SMTP_TIMEOUT = 30
+CONTACT_TO = os.environ.get("PORTFOLIO_CONTACT_TO", "bombomatsitsa@gmail.com")
+CONTACT_FROM = os.environ.get("PORTFOLIO_CONTACT_FROM", CONTACT_TO)
+
+BATCH_SIZE = 20
+MAX_ATTEMPTS = 8
+# Retry delays double from BACKOFF_BASE up to BACKOFF_MAX seconds (with jitter)
+BACKOFF_BASE = 30
+BACKOFF_MAX = 3600
+# How often the worker looks for due retries when nothing new was submitted
+POLL_INTERVAL = 15
+# Claimed messages are hidden from other workers for this long; if a process
+# dies mid-batch they become due again afterwards
+CLAIM_LEASE = 300
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    message TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt);
+"""
+
+_local = threading.local()
+# Outbox database path -> its delivery worker
+_workers = {}
+_worker_lock = threading.Lock()
+
+
+def _connect(path=OUTBOX_PATH):
+    """Get this thread's connection to the outbox, creating the database if needed"""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    connection = connections.get(path)
+    if connection is None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, timeout=5, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        # WAL lets the worker read while sessions write; NORMAL sync keeps
+        # inserts fast while staying durable across application crashes
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        connections[path] = connection
+    return connection
+
+
+def enqueue_message(name, email, subject, message, path=OUTBOX_PATH, status="pending"):
+    """
+    Store a contact message for delivery and wake the delivery worker
+
+    Args:
+        name (str): Sender's name
+        email (str): Sender's email, used as Reply-To
+        subject (str): Selected subject
+        message (str): Message body
+        path (str): Outbox database
+        status (str): "pending" to deliver, or "spam" to keep it for review only
+
+    Returns:
+        int: Outbox id of the message
+
+    Raises:
+        sqlite3.Error: If the outbox cannot be written
+    """
+    now = time.time()
+    cursor = _connect(path).execute(
+        "INSERT INTO outbox (created, name, email, subject, message, status, next_attempt) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (now, name, email, subject, message, status, now),
+    )
+    worker = start_outbox_worker(path) if status == "pending" else None
+    if worker is not None:
+        worker.wake()
+    return cursor.lastrowid
+
+
+def build_email(row):
+    """
+    Build the email for an outbox row
+
+    Args:
+        row (sqlite3.Row): Outbox row
+
+    Returns:
+        EmailMessage: Message addressed to the portfolio owner
+    """
+    email = EmailMessage()
+    email["From"] = CONTACT_FROM
+    email["To"] = CONTACT_TO
+    # Built as a structured address, so a crafted display name can never add
+    # or replace the reply address
+    email["Reply-To"] = Address(display_name=row["name"], addr_spec=row["email"])
+    email["Subject"] = f"[Portfolio] {row['subject']}"
+    email.set_content(f"From: {row['name']} ({row['email']})\nSubject: {row['subject']}\n\n{row['message']}\n")
+    return email
+
+
+def smtp_connection():
+    """Open an SMTP connection using the configured server and login"""
+    smtp = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+    if SMTP_STARTTLS:
+        smtp.starttls()
+    if SMTP_USER:
+        smtp.login(SMTP_USER, SMTP_PASSWORD)
+    return smtp
+
+
+def retry_delay(attempts):
+    """Seconds to wait before the next attempt after ``attempts`` failures"""
+    delay = min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def deliver_pending(path=OUTBOX_PATH, connect=smtp_connection, limit=BATCH_SIZE):
+    """
+    Deliver one batch of due messages over a single SMTP connection
+
+    Args:
+        path (str): Outbox database
+        connect (callable): Returns an open ``smtplib.SMTP``-like connection
+        limit (int): Maximum number of messages to send
+
+    Returns:
+        tuple: ``(sent, failed)`` counts for the batch
+    """
+    db = _connect(path)
+    now = time.time()
+    # Claim the batch in one write transaction, so workers in other processes
+    # sharing the outbox never send the same message twice
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        rows = db.execute(
+            "SELECT * FROM outbox WHERE status = 'pending' AND next_attempt <= ? ORDER BY next_attempt LIMIT ?",
+            (now, limit),
+        ).fetchall()
+        db.executemany(
+            "UPDATE outbox SET next_attempt = ? WHERE id = ?", [(now + CLAIM_LEASE, row["id"]) for row in rows]
+        )
+        db.execute("COMMIT")
+    except sqlite3.Error:
+        db.execute("ROLLBACK")
+        raise
+    if not rows:
+        return 0, 0
+
+    sent = failed = 0
+    try:
+        smtp = connect()
+    except (OSError, smtplib.SMTPException) as e:
+        for row in rows:
+            _record_failure(db, row, str(e))
+        return 0, len(rows)
+
+    try:
+        with smtp:
+            for row in rows:
+                try:
+                    email = build_email(row)
+                except (ValueError, MessageError) as e:
+                    # An address or header the email package rejects fails
+                    # the same way on every attempt: give up on it now
+                    _record_failure(db, row, str(e) or type(e).__name__, permanent=True)
+                    failed += 1
+                    continue
+                try:
+                    smtp.send_message(email)
+                except (OSError, smtplib.SMTPException) as e:
+                    # Retried later; the rest of the batch is still sent
+                    _record_failure(db, row, str(e) or type(e).__name__)
+                    failed += 1
+                else:
+                    # Recorded right away, so nothing already sent is sent
+                    # again if a later step fails
+                    db.execute("UPDATE outbox SET status = 'sent', last_error = NULL WHERE id = ?", (row["id"],))
+                    sent += 1
+    except (OSError, smtplib.SMTPException) as e:
+        # Raised by QUIT when leaving the connection, after every row was recorded
+        logger.warning("Contact outbox: closing the SMTP connection failed: %s", e)
+    return sent, failed
+
+
+def _record_failure(db, row, error, permanent=False):
+    """Schedule a retry of a message, or give up if ``permanent`` or after ``MAX_ATTEMPTS``"""
+    attempts = row["attempts"] + 1
+    status = "failed" if permanent or attempts >= MAX_ATTEMPTS else "pending"
+    db.execute(
+        "UPDATE outbox SET status = ?, attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+        (status, attempts, time.time() + retry_delay(attempts), error, row["id"]),
+    )
+
+
+def outbox_counts(path=OUTBOX_PATH):
+    """
+    Count outbox messages by status
+
+    Args:
+        path (str): Outbox database
+
+    Returns:
+        dict: Number of messages per status ("pending", "sent", "failed", "spam")
+    """
+    rows = _connect(path).execute("SELECT status, COUNT(*) FROM outbox GROUP BY status")
+    return {status: count for status, count in rows}
+
+
+class OutboxWorker(threading.Thread):
+    """Background thread delivering the outbox whenever it is woken or polls"""
+
+    def __init__(self, path=OUTBOX_PATH, connect=smtp_connection, poll_interval=POLL_INTERVAL):
+        super().__init__(name="outbox-worker", daemon=True)
+        self.path = path
+        self.connect = connect
+        self.poll_interval = poll_interval
+        self._wakeup = threading.Event()
+        self._stopping = False
+
+    def wake(self):
+        """Deliver new messages now instead of at the next poll"""
+        self._wakeup.set()
+
+    def stop(self):
+        """Ask the worker to exit after its current batch"""
+        self._stopping = True
+        self._wakeup.set()
+
+    def run(self):
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                sent, failed = deliver_pending(self.path, self.connect)
+            except sqlite3.Error as e:
+                logger.error("Contact outbox unavailable: %s", e)
+                sent = failed = 0
+            except Exception:
+                # The worker is the only sender in this process: never let an
+                # unexpected error end it
+                logger.exception("Contact outbox delivery failed")
+                sent = failed = 0
+            # Keep draining full batches; otherwise sleep until woken or the next poll
+            if sent + failed < BATCH_SIZE:
+                self._wakeup.wait(self.poll_interval)
+
+
+def start_outbox_worker(path=OUTBOX_PATH):
+    """
+    Start the delivery worker of an outbox if SMTP is configured
+
+    Safe to call on every rerun; each outbox gets one worker per process,
+    started again if it has died.
+
+    Args:
+        path (str): Outbox database
+
+    Returns:
+        OutboxWorker: The running worker, or None when no SMTP host is set
+    """
+    if not SMTP_HOST:
+        return None
+    worker = _workers.get(path)
+    if worker is None or not worker.is_alive():
+        with _worker_lock:
+            worker = _workers.get(path)
+            if worker is None or not worker.is_alive():
+                worker = _workers[path] = OutboxWorker(path)
+                worker.start()
+    return worker
@@ -0,0 +1,161 @@
+"""
+Opt-in cProfile sampling of app reruns
+
+With ``PORTFOLIO_PROFILE=N`` one full rerun in N is run under cProfile
+(``1`` profiles every rerun). Profiles are aggregated per section and,
+once a window of samples is complete (or the process exits), written to
+``PORTFOLIO_PROFILE_DIR`` (default ``data/profiles``) as:
+- ``<section>-<timestamp>.pstats``: open with ``python -m pstats`` or snakeviz
+- ``<section>-<timestamp>.collapsed``: folded stacks for flamegraph.pl or
+  speedscope
+
+Only the latest ``MAX_WINDOWS`` windows per section are kept. When the flag
+is unset this module is never imported.
+"""
+
+import atexit
+import cProfile
+import itertools
+import os
+import pstats
+import threading
+import time
+from pathlib import Path
+
+PROFILE_EVERY = int(os.environ.get("PORTFOLIO_PROFILE", "0"))
+PROFILE_DIR = Path(os.environ.get("PORTFOLIO_PROFILE_DIR", "data/profiles"))
+# Sampled reruns aggregated into one pair of files
+WINDOW_SAMPLES = 20
+MAX_WINDOWS = 10
+# Deeper or cheaper call paths are cut off in the collapsed stacks
+MAX_STACK_DEPTH = 64
+MIN_STACK_TIME = 1e-5
+
+_lock = threading.Lock()
+_reruns = itertools.count()
+# Section -> [aggregated pstats.Stats, samples in the window]
+_windows = {}
+
+
+def _label(func):
+    """Readable frame name for a pstats function key"""
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def collapsed_stacks(stats):
+    """
+    Convert profile stats to folded stacks
+
+    cProfile only records caller/callee pairs, not full stacks, so stacks are
+    rebuilt from the call graph and each function's time is split between
+    its callers in proportion to the time spent under each of them.
+
+    Args:
+        stats (pstats.Stats): Profile to convert
+
+    Returns:
+        list: ``"root;caller;callee <microseconds>"`` lines
+    """
+    children = {}
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((func, edge[3]))
+    roots = [func for func, entry in stats.stats.items() if not entry[4]]
+
+    folded = {}
+
+    def walk(func, share, path):
+        _, _, self_time, _, _ = stats.stats[func]
+        path = (*path, _label(func))
+        weight = self_time * share
+        if weight > 0:
+            folded[path] = folded.get(path, 0) + weight
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for child, edge_time in children.get(func, ()):
+            # Recursion would repeat forever; its time stays with the caller
+            if _label(child) in path:
+                continue
+            child_total = stats.stats[child][3]
+            child_share = share * min(edge_time, child_total) / child_total if child_total > 0 else 0
+            if child_share * child_total >= MIN_STACK_TIME:
+                walk(child, child_share, path)
+
+    for root in roots:
+        walk(root, 1.0, ())
+    return [f"{';'.join(path)} {round(seconds * 1_000_000)}" for path, seconds in folded.items() if seconds >= 1e-6]
+
+
+def _rotate(section):
+    """Delete all but the latest ``MAX_WINDOWS`` windows of a section"""
+    windows = sorted(PROFILE_DIR.glob(f"{section}-*.pstats"))
+    for old in windows[:-MAX_WINDOWS]:
+        old.unlink(missing_ok=True)
+        old.with_suffix(".collapsed").unlink(missing_ok=True)
+
+
+def _write_window(section, stats):
+    """Write one aggregated window of a section to the profile directory"""
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    stem = PROFILE_DIR / f"{section}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+    stats.dump_stats(stem.with_suffix(".pstats"))
+    stem.with_suffix(".collapsed").write_text("\n".join(collapsed_stacks(stats)) + "\n", encoding="utf-8")
+    _rotate(section)
+
+
+def _record(section, profiler):
+    """Add a profiled rerun to its section's window, writing full windows"""
+    with _lock:
+        window = _windows.get(section)
+        if window is None:
+            window = _windows[section] = [pstats.Stats(profiler), 0]
+        else:
+            window[0].add(profiler)
+        window[1] += 1
+        if window[1] < WINDOW_SAMPLES:
+            return
+        del _windows[section]
+    _write_window(section, window[0])
+
+
+def flush():
+    """Write every partially filled window"""
+    with _lock:
+        windows = list(_windows.items())
+        _windows.clear()
+    for section, (stats, _) in windows:
+        _write_window(section, stats)
+
+
+def profile_rerun(run, every=PROFILE_EVERY):
+    """
+    Run one app rerun, under cProfile if it is sampled
+
+    Args:
+        run (callable): Renders the app and returns the section's name
+        every (int): Profile one rerun in this many
+
+    Returns:
+        object: Whatever ``run`` returns
+    """
+    if next(_reruns) % every:
+        return run()
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler is active in this interpreter
+        return run()
+    try:
+        section = run()
+    finally:
+        profiler.disable()
+    _record(section, profiler)
+    return section
+
+
+atexit.register(flush)
@@ -0,0 +1,403 @@
+"""
+Sticky asyncio reverse proxy in front of several Streamlit worker processes
+
+A Streamlit session lives inside the process that serves its websocket,
+together with its media files, so every request of a browser must reach the
+same worker. The proxy assigns new clients to the least busy healthy worker
+and pins them to it with a cookie. Connections are pinned as a whole:
+request heads are parsed only to add ``X-Forwarded-For`` and read the
+cookie, and websocket upgrades are piped through as raw bytes.
+
+Workers are health-checked on ``/_stcore/health``. Once healthy, a worker
+renders every section once in a synthetic session (see ``utils.warmup``)
+and only then receives clients; ``READY_PATH`` answers 200 as soon as one
+worker is warm, for load balancer and autoscaler readiness probes. A worker
+that exits, or stays unhealthy for too long, is restarted with a growing
+delay; its clients are moved to another worker (and start a fresh session
+there).
+
+Only the standard library is used, so the runner needs nothing beyond the
+app's own requirements.
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from utils.warmup import warm_worker
+
+WORKER_HOST = "127.0.0.1"
+WORKER_COOKIE = "portfolio_worker"
+# Answered by the proxy itself, never forwarded
+READY_PATH = "/_portfolio/ready"
+# Request heads larger than this are rejected
+MAX_HEAD_BYTES = 64 * 1024
+CHUNK_SIZE = 64 * 1024
+
+HEALTH_INTERVAL = 2
+HEALTH_TIMEOUT = 2
+# Consecutive failed checks before a worker stops receiving clients, and
+# before it is killed and restarted (covers a slow cold start)
+UNHEALTHY_AFTER = 2
+RESTART_AFTER = 15
+RESTART_DELAY_MAX = 30
+WARMUP_TIMEOUT = 120
+
+
+class Worker:
+    """One ``streamlit run app.py`` process on an internal port"""
+
+    def __init__(self, index, port, script="app.py"):
+        self.index = index
+        self.port = port
+        self.script = script
+        self.process = None
+        self.healthy = False
+        self.warm = False
+        self.failures = 0
+        self.connections = 0
+        self.assigned = 0
+        self.restarts = 0
+        # Monotonic time of a pending restart
+        self.restart_at = None
+        # Running warmup task, if any
+        self.warmup = None
+
+    def start(self):
+        """Launch the worker process"""
+        self.process = subprocess.Popen([
+            sys.executable, "-m", "streamlit", "run", self.script,
+            "--server.port", str(self.port),
+            "--server.address", WORKER_HOST,
+            "--server.headless", "true",
+        ], env={**os.environ, "PORTFOLIO_WORKER": str(self.index)})
+        self.healthy = False
+        self.warm = False
+        self.failures = 0
+        self.restart_at = None
+
+    def stop(self, timeout=10):
+        """Terminate the worker process, killing it if it does not exit"""
+        if self.process is None or self.process.poll() is not None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+    @property
+    def running(self):
+        return self.process is not None and self.process.poll() is None
+
+    @property
+    def ready(self):
+        """Whether the worker may receive clients"""
+        return self.healthy and self.warm
+
+    def schedule_restart(self):
+        """Mark the worker down and pick when to start it again"""
+        self.healthy = False
+        if self.warmup is not None:
+            self.warmup.cancel()
+            self.warmup = None
+        self.restart_at = time.monotonic() + min(2 ** self.restarts, RESTART_DELAY_MAX)
+        self.restarts += 1
+
+
+def _parse_headers(head):
+    """Lower-cased header names to values of a raw HTTP head"""
+    headers = {}
+    for line in head.split(b"\r\n")[1:]:
+        name, sep, value = line.partition(b":")
+        if sep:
+            headers[name.strip().lower().decode("latin-1")] = value.strip().decode("latin-1")
+    return headers
+
+
+def _add_header(head, name, value):
+    """Insert a header line before the blank line ending a raw HTTP head"""
+    return head[:-2] + f"{name}: {value}\r\n".encode("latin-1") + b"\r\n"
+
+
+def _with_forwarded_for(head, headers, client_ip):
+    """Append the client's address to the ``X-Forwarded-For`` chain of a head"""
+    forwarded = headers.get("x-forwarded-for")
+    if forwarded:
+        head = b"\r\n".join(line for line in head.split(b"\r\n") if not line.lower().startswith(b"x-forwarded-for:"))
+    return _add_header(head, "X-Forwarded-For", f"{forwarded}, {client_ip}" if forwarded else client_ip)
+
+
+def _worker_cookie(headers):
+    """Worker index stored in the request's cookie, or None"""
+    for pair in headers.get("cookie", "").split(";"):
+        name, _, value = pair.strip().partition("=")
+        if name == WORKER_COOKIE and value.isdigit():
+            return int(value)
+    return None
+
+
+async def _close(writer):
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (ConnectionError, OSError):
+        pass
+
+
+async def _pipe(reader, writer):
+    """Copy bytes until EOF"""
+    while data := await reader.read(CHUNK_SIZE):
+        writer.write(data)
+        await writer.drain()
+
+
+class StickyProxy:
+    """Reverse proxy pinning each client to one worker"""
+
+    def __init__(self, workers):
+        self.workers = workers
+
+    def pick(self, headers):
+        """
+        Choose the worker for a client connection
+
+        Args:
+            headers (dict): Headers of the connection's first request
+
+        Returns:
+            tuple: ``(worker, assigned)`` where ``assigned`` is True if the
+            client must be (re)pinned with a cookie; worker is None when no
+            worker is ready
+        """
+        index = _worker_cookie(headers)
+        if index is not None and index < len(self.workers) and self.workers[index].ready:
+            return self.workers[index], False
+        ready = [worker for worker in self.workers if worker.ready]
+        if not ready:
+            return None, False
+        worker = min(ready, key=lambda worker: (worker.connections, worker.assigned))
+        worker.assigned += 1
+        return worker, True
+
+    async def handle(self, reader, writer):
+        """Serve one client connection"""
+        peer = writer.get_extra_info("peername")
+        client_ip = peer[0] if peer else ""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            await _close(writer)
+            return
+
+        if head.split(b" ", 2)[1:2] == [READY_PATH.encode("ascii")]:
+            await self._readiness(writer)
+            return
+
+        headers = _parse_headers(head)
+        while True:
+            worker, assigned = self.pick(headers)
+            if worker is None:
+                await self._reject(writer, b"503 Service Unavailable")
+                return
+            try:
+                upstream_reader, upstream_writer = await asyncio.open_connection(WORKER_HOST, worker.port)
+                break
+            except OSError:
+                # Crashed since the last health check: try another worker
+                worker.healthy = False
+
+        worker.connections += 1
+        try:
+            await asyncio.gather(
+                self._forward_requests(reader, upstream_writer, head, headers, client_ip),
+                self._forward_responses(upstream_reader, writer, worker.index if assigned else None),
+                return_exceptions=True,
+            )
+        finally:
+            worker.connections -= 1
+            await _close(upstream_writer)
+            await _close(writer)
+
+    async def _forward_requests(self, reader, upstream, head, headers, client_ip):
+        """Forward the client's requests, adding ``X-Forwarded-For`` to each"""
+        try:
+            while True:
+                upstream.write(_with_forwarded_for(head, headers, client_ip))
+
+                if "upgrade" in headers.get("connection", "").lower() or "chunked" in headers.get("transfer-encoding", "").lower():
+                    # Websocket frames or a chunked body: raw bytes from here on
+                    await _pipe(reader, upstream)
+                    break
+                remaining = int(headers.get("content-length") or 0)
+                while remaining > 0:
+                    data = await reader.read(min(remaining, CHUNK_SIZE))
+                    if not data:
+                        return
+                    upstream.write(data)
+                    remaining -= len(data)
+                await upstream.drain()
+
+                head = await reader.readuntil(b"\r\n\r\n")
+                headers = _parse_headers(head)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+            pass
+        finally:
+            if upstream.can_write_eof() and not upstream.is_closing():
+                upstream.write_eof()
+
+    async def _forward_responses(self, upstream, writer, assign_index):
+        """Pipe the worker's responses, pinning the client on the first one"""
+        try:
+            if assign_index is not None:
+                head = await upstream.readuntil(b"\r\n\r\n")
+                cookie = f"{WORKER_COOKIE}={assign_index}; Path=/; HttpOnly; SameSite=Lax"
+                writer.write(_add_header(head, "Set-Cookie", cookie))
+            await _pipe(upstream, writer)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            # Unblocks the request direction, which is waiting on the client
+            writer.close()
+
+    async def _readiness(self, writer):
+        """Answer a readiness probe: 200 once any worker is warm, else 503"""
+        states = [
+            {"worker": worker.index, "port": worker.port, "healthy": worker.healthy, "warm": worker.warm}
+            for worker in self.workers
+        ]
+        ready = any(worker.ready for worker in self.workers)
+        body = json.dumps({"ready": ready, "workers": states}).encode("utf-8")
+        writer.write(
+            (b"HTTP/1.1 200 OK" if ready else b"HTTP/1.1 503 Service Unavailable")
+            + b"\r\nContent-Type: application/json\r\nCache-Control: no-store\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\nConnection: close\r\n\r\n" + body
+        )
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        await _close(writer)
+
+    async def _reject(self, writer, status):
+        """Answer with an error status and close the connection"""
+        body = b"No portfolio worker is available, please retry shortly\n"
+        writer.write(
+            b"HTTP/1.1 " + status + b"\r\nContent-Type: text/plain\r\nRetry-After: 2\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\nConnection: close\r\n\r\n" + body
+        )
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        await _close(writer)
+
+    async def check(self, worker):
+        """
+        Check a worker's health endpoint
+
+        Returns:
+            bool: True if it answered 200 in time
+        """
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(WORKER_HOST, worker.port), HEALTH_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        try:
+            writer.write(f"GET /_stcore/health HTTP/1.1\r\nHost: {WORKER_HOST}\r\nConnection: close\r\n\r\n".encode())
+            status = await asyncio.wait_for(reader.readline(), HEALTH_TIMEOUT)
+            return status.split(b" ")[1:2] == [b"200"]
+        except (OSError, asyncio.TimeoutError):
+            return False
+        finally:
+            await _close(writer)
+
+    async def _supervise_worker(self, worker):
+        """Run one health-check round for a worker"""
+        if not worker.running:
+            if worker.restart_at is None:
+                print(f"✗ Worker {worker.index} exited (code {worker.process.returncode})", flush=True)
+                worker.schedule_restart()
+            elif time.monotonic() >= worker.restart_at:
+                print(f"🔄 Restarting worker {worker.index} on port {worker.port}", flush=True)
+                worker.start()
+            return
+
+        if await self.check(worker):
+            # Healthy but not warm is still not ready for clients
+            worker.healthy = True
+            if worker.warm:
+                worker.failures = 0
+                worker.restarts = 0
+                return
+            if worker.warmup is None:
+                # Warming up takes up to WARMUP_TIMEOUT; run it beside the
+                # health checks so a worker that hangs or dies meanwhile is
+                # still noticed and restarted
+                worker.warmup = asyncio.create_task(self.warm(worker))
+        else:
+            worker.failures += 1
+            if worker.failures >= UNHEALTHY_AFTER:
+                worker.healthy = False
+
+        # Failed warmups count as failures too
+        if worker.failures >= RESTART_AFTER:
+            print(f"✗ Worker {worker.index} unresponsive, killing it", flush=True)
+            worker.process.kill()
+            worker.process.wait()
+            worker.schedule_restart()
+
+    async def warm(self, worker):
+        """
+        Render every section on a newly healthy worker
+
+        Run as a task of its own by the supervisor; a failed warmup counts as
+        a failed health check, and the next round starts another one.
+
+        Returns:
+            bool: True if the worker is warm and may receive clients
+        """
+        start = time.perf_counter()
+        try:
+            timings = await asyncio.wait_for(warm_worker(WORKER_HOST, worker.port), WARMUP_TIMEOUT)
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, RuntimeError) as e:
+            print(f"✗ Worker {worker.index} warmup failed: {str(e) or type(e).__name__}", flush=True)
+            worker.failures += 1
+            return False
+        finally:
+            if worker.warmup is asyncio.current_task():
+                worker.warmup = None
+        worker.warm = True
+        print(
+            f"✓ Worker {worker.index} ready on port {worker.port} "
+            f"({len(timings)} sections warmed in {time.perf_counter() - start:.1f}s)",
+            flush=True,
+        )
+        return True
+
+    async def supervise(self):
+        """Health-check the workers forever, restarting dead or hung ones"""
+        while True:
+            await asyncio.gather(*(self._supervise_worker(worker) for worker in self.workers))
+            await asyncio.sleep(HEALTH_INTERVAL)
+
+
+async def serve(workers, host, port):
+    """
+    Run the proxy and the supervisor until cancelled
+
+    Args:
+        workers (list): Worker instances, already started
+        host (str): Interface the proxy listens on
+        port (int): Public port of the proxy
+    """
+    proxy = StickyProxy(workers)
+    server = await asyncio.start_server(proxy.handle, host, port, limit=MAX_HEAD_BYTES)
+    async with server:
+        await asyncio.gather(server.serve_forever(), proxy.supervise())
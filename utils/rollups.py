@@ -0,0 +1,222 @@
+"""
+Incrementally maintained analytics rollups
+
+Every batch of events written by the analytics writer also updates, in the
+same transaction:
+- ``hourly`` and ``daily``: event counts per (bucket, kind, section, detail)
+- ``visit_days``: one row per visit and day with funnel flags (saw the
+  contact page, downloaded the resume, submitted the form, message queued)
+- ``daily_funnel``: per-day totals of those flags, bumped only when a
+  visit's flag first turns on
+
+The analytics page reads nothing else, so its queries touch a number of
+rows bounded by the selected period, never the raw event log. Buckets are
+UTC; hours and days are stored as Unix timestamps of their start.
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hourly (
+    hour INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    section TEXT NOT NULL,
+    detail TEXT NOT NULL,
+    events INTEGER NOT NULL,
+    PRIMARY KEY (hour, kind, section, detail)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS daily (
+    day INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    section TEXT NOT NULL,
+    detail TEXT NOT NULL,
+    events INTEGER NOT NULL,
+    PRIMARY KEY (day, kind, section, detail)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS visit_days (
+    day INTEGER NOT NULL,
+    visit INTEGER NOT NULL,
+    flags INTEGER NOT NULL,
+    PRIMARY KEY (day, visit)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS daily_funnel (
+    day INTEGER PRIMARY KEY,
+    visits INTEGER NOT NULL DEFAULT 0,
+    contact_views INTEGER NOT NULL DEFAULT 0,
+    downloads INTEGER NOT NULL DEFAULT 0,
+    submissions INTEGER NOT NULL DEFAULT 0,
+    sent INTEGER NOT NULL DEFAULT 0
+);
+"""
+# Bumped whenever the rollups change shape; older databases are rebuilt
+# from their raw events
+ROLLUP_VERSION = 1
+
+# Funnel flags of a visit, in daily_funnel column order after ``visits``
+CONTACT_VIEW, DOWNLOAD, SUBMISSION, SENT = 1, 2, 4, 8
+FUNNEL_FLAGS = (CONTACT_VIEW, DOWNLOAD, SUBMISSION, SENT)
+FUNNEL_COLUMNS = ("contact_views", "downloads", "submissions", "sent")
+# Contact form outcomes that mean the message was stored
+SENT_OUTCOMES = frozenset(("queued", "spam"))
+
+HOUR = 3600
+DAY = 86400
+REBUILD_BATCH = 10000
+
+
+def _event_flags(kind, section, detail):
+    """Funnel flags an event turns on"""
+    if kind == "view":
+        return CONTACT_VIEW if section == "contact" else 0
+    if kind == "download":
+        return DOWNLOAD
+    if kind == "contact":
+        return SUBMISSION | (SENT if detail in SENT_OUTCOMES else 0)
+    return 0
+
+
+def update_rollups(connection, rows):
+    """
+    Fold a batch of events into the rollup tables
+
+    Must run inside the transaction inserting the events, so rollups and
+    raw events never disagree.
+
+    Args:
+        connection (sqlite3.Connection): Analytics database, in a transaction
+        rows (list): ``(time, kind, section, visit, detail)`` tuples
+    """
+    hourly = {}
+    daily = {}
+    visits = {}
+    for timestamp, kind, section, visit, detail in rows:
+        hour = int(timestamp // HOUR) * HOUR
+        day = int(timestamp // DAY) * DAY
+        hourly[hour, kind, section, detail] = hourly.get((hour, kind, section, detail), 0) + 1
+        daily[day, kind, section, detail] = daily.get((day, kind, section, detail), 0) + 1
+        if visit:
+            visits[day, visit] = visits.get((day, visit), 0) | _event_flags(kind, section, detail)
+
+    for table, counts in (("hourly", hourly), ("daily", daily)):
+        bucket = "hour" if table == "hourly" else "day"
+        connection.executemany(
+            f"INSERT INTO {table} ({bucket}, kind, section, detail, events) VALUES (?, ?, ?, ?, ?) "
+            f"ON CONFLICT ({bucket}, kind, section, detail) DO UPDATE SET events = events + excluded.events",
+            [(*key, count) for key, count in counts.items()],
+        )
+
+    funnel = {}
+    for (day, visit), flags in visits.items():
+        row = connection.execute("SELECT flags FROM visit_days WHERE day = ? AND visit = ?", (day, visit)).fetchone()
+        if row is None:
+            connection.execute("INSERT INTO visit_days (day, visit, flags) VALUES (?, ?, ?)", (day, visit, flags))
+            new_flags, new_visit = flags, 1
+        else:
+            new_flags, new_visit = flags & ~row[0], 0
+            if new_flags:
+                connection.execute(
+                    "UPDATE visit_days SET flags = ? WHERE day = ? AND visit = ?", (row[0] | flags, day, visit)
+                )
+        if new_visit or new_flags:
+            totals = funnel.setdefault(day, [0] * (1 + len(FUNNEL_FLAGS)))
+            totals[0] += new_visit
+            for index, flag in enumerate(FUNNEL_FLAGS, 1):
+                totals[index] += bool(new_flags & flag)
+
+    columns = ("visits", *FUNNEL_COLUMNS)
+    connection.executemany(
+        f"INSERT INTO daily_funnel (day, {', '.join(columns)}) VALUES (?, {', '.join('?' * len(columns))}) "
+        f"ON CONFLICT (day) DO UPDATE SET {', '.join(f'{column} = {column} + excluded.{column}' for column in columns)}",
+        [(day, *totals) for day, totals in funnel.items()],
+    )
+
+
+def migrate(connection):
+    """
+    Create the rollup tables, rebuilding them from raw events if outdated
+
+    Args:
+        connection (sqlite3.Connection): Analytics database in autocommit mode
+    """
+    if connection.execute("PRAGMA user_version").fetchone()[0] >= ROLLUP_VERSION:
+        return
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        # Another process may have migrated while we waited for the lock
+        if connection.execute("PRAGMA user_version").fetchone()[0] < ROLLUP_VERSION:
+            for table in ("hourly", "daily", "visit_days", "daily_funnel"):
+                connection.execute(f"DROP TABLE IF EXISTS {table}")
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    connection.execute(statement)
+            cursor = connection.execute("SELECT time, kind, section, visit, detail FROM events ORDER BY id")
+            while rows := cursor.fetchmany(REBUILD_BATCH):
+                update_rollups(connection, rows)
+            connection.execute(f"PRAGMA user_version = {ROLLUP_VERSION}")
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def prune_rollups(connection, before):
+    """
+    Delete per-visit and hourly rollups older than a cutoff
+
+    Daily counts and funnel totals are kept: they are small and make up the
+    long-term history once raw events expire.
+
+    Args:
+        connection (sqlite3.Connection): Analytics database
+        before (float): Unix time cutoff
+    """
+    connection.execute("DELETE FROM visit_days WHERE day < ?", (int(before // DAY) * DAY,))
+    connection.execute("DELETE FROM hourly WHERE hour < ?", (int(before // HOUR) * HOUR,))
+
+
+def read_summary(connection, now, days=30, hours=48):
+    """
+    Read the analytics page's figures from the rollups
+
+    Args:
+        connection (sqlite3.Connection): Analytics database
+        now (float): Current Unix time
+        days (int): Period for section views, downloads and the funnel
+        hours (int): Period of the hourly views series
+
+    Returns:
+        dict: ``section_views`` {section: views}, ``hourly_views``
+        {hour start: views}, ``downloads`` {via: count} and ``funnel``
+        {visits, contact_views, downloads, submissions, sent}, plus
+        ``outcomes`` {contact form outcome: count}
+    """
+    first_day = (int(now // DAY) - days + 1) * DAY
+    first_hour = (int(now // HOUR) - hours + 1) * HOUR
+
+    section_views = dict(connection.execute(
+        "SELECT section, SUM(events) FROM daily WHERE day >= ? AND kind = 'view' "
+        "GROUP BY section ORDER BY SUM(events) DESC",
+        (first_day,),
+    ))
+    hourly_views = dict.fromkeys(range(first_hour, first_hour + hours * HOUR, HOUR), 0)
+    hourly_views.update(connection.execute(
+        "SELECT hour, SUM(events) FROM hourly WHERE hour >= ? AND kind = 'view' GROUP BY hour", (first_hour,)
+    ))
+    downloads = dict(connection.execute(
+        "SELECT detail, SUM(events) FROM daily WHERE day >= ? AND kind = 'download' GROUP BY detail", (first_day,)
+    ))
+    outcomes = dict(connection.execute(
+        "SELECT detail, SUM(events) FROM daily WHERE day >= ? AND kind = 'contact' "
+        "GROUP BY detail ORDER BY SUM(events) DESC",
+        (first_day,),
+    ))
+    columns = ("visits", *FUNNEL_COLUMNS)
+    totals = connection.execute(
+        f"SELECT {', '.join(f'COALESCE(SUM({column}), 0)' for column in columns)} FROM daily_funnel WHERE day >= ?",
+        (first_day,),
+    ).fetchone()
+    return {
+        "section_views": section_views,
+        "hourly_views": hourly_views,
+        "downloads": downloads,
+        "outcomes": outcomes,
+        "funnel": dict(zip(columns, totals)),
+    }
@@ -0,0 +1,383 @@
+"""
+Live e-commerce sales analysis demo for the Projects page
+
+Synthetic orders (1M by default) are generated the first time anyone opens
+the demo and written, in chunks, to one ``.npy`` file per column under
+``PORTFOLIO_SALES_DIR``. Categories, segments and regions are stored as
+1-byte codes, and rows are in date order. In the same pass, the orders are
+aggregated into cubes over month x category x segment x region, plus an
+order value histogram.
+
+Worker processes map the column files read-only, so their pages live once
+in the OS page cache for every process and session. Each process loads the
+cubes (under a megabyte) once. Filter interactions sum slices of the
+cubes and never scan the orders. The only rows ever read are the latest
+orders matching a filter: a bounded backwards scan of the month range,
+which is located by binary search. A session's memory therefore does not
+depend on the number of orders or on how many people view the demo.
+
+Configured through the environment:
+- PORTFOLIO_SALES_DIR: dataset directory (default data/sales)
+- PORTFOLIO_SALES_ROWS: number of orders, 500,000 to 5,000,000
+  (default 1,000,000)
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.metrics import timed_fragment
+
+SALES_DIR = Path(os.environ.get("PORTFOLIO_SALES_DIR", "data/sales"))
+ROWS = min(max(int(os.environ.get("PORTFOLIO_SALES_ROWS", "1000000")), 500_000), 5_000_000)
+
+# Bumped whenever the generated data or file layout changes; older datasets
+# are rebuilt
+DATASET_VERSION = 1
+SEED = 5
+FIRST_MONTH = np.datetime64("2022-01", "M")
+MONTHS = 36
+CATEGORIES = ("Electronics", "Fashion", "Home & Garden", "Beauty", "Sports", "Toys", "Books", "Groceries")
+SEGMENTS = ("New", "Occasional", "Regular", "VIP")
+REGIONS = ("North", "South", "East", "West", "Central")
+COLUMNS = {
+    "month": np.uint8,
+    "day": np.uint8,
+    "category": np.uint8,
+    "segment": np.uint8,
+    "region": np.uint8,
+    "quantity": np.uint16,
+    "revenue": np.float32,
+}
+# Order values are counted in log-spaced bins from $5 to $2,000
+VALUE_BINS = np.geomspace(5, 2000, 25)
+
+BUILD_CHUNK = 500_000
+SCAN_CHUNK = 65_536
+RECENT_ORDERS = 20
+
+_dataset_lock = threading.Lock()
+_dataset = None
+
+
+def _month_labels():
+    return [str(month) for month in FIRST_MONTH + np.arange(MONTHS)]
+
+
+def generate_orders(rng, months):
+    """
+    Generate orders for a run of consecutive rows
+
+    Args:
+        rng (numpy.random.Generator): Random source
+        months (numpy.ndarray): Month index of each row, in order
+
+    Returns:
+        dict: Column name to array, typed as in ``COLUMNS``
+    """
+    count = len(months)
+    category = rng.choice(len(CATEGORIES), count, p=(0.2, 0.18, 0.14, 0.12, 0.1, 0.09, 0.08, 0.09))
+    segment = rng.choice(len(SEGMENTS), count, p=(0.3, 0.35, 0.27, 0.08))
+    price = rng.lognormal(np.log((120, 45, 60, 25, 55, 30, 15, 20))[category], 0.6)
+    # Frequent customers buy bigger baskets
+    quantity = 1 + rng.poisson(np.array((0.3, 0.5, 0.8, 1.5))[segment])
+    return {
+        "month": months,
+        "day": rng.integers(1, 29, count),
+        "category": category,
+        "segment": segment,
+        "region": rng.choice(len(REGIONS), count, p=(0.22, 0.2, 0.24, 0.2, 0.14)),
+        "quantity": quantity,
+        "revenue": (price * quantity).round(2),
+    }
+
+
+def _cube_index(columns):
+    """Flat index of each row in the month x category x segment x region cube"""
+    index = columns["month"].astype(np.int64)
+    for name, size in (("category", len(CATEGORIES)), ("segment", len(SEGMENTS)), ("region", len(REGIONS))):
+        index = index * size + columns[name]
+    return index
+
+
+def build_dataset(directory, rows):
+    """
+    Generate the orders into column files and aggregate them into cubes
+
+    Rows are generated and written ``BUILD_CHUNK`` at a time, so building
+    5M orders needs no more memory than building 500K.
+
+    Args:
+        directory (Path): Empty directory to write to
+        rows (int): Number of orders
+    """
+    rng = np.random.default_rng(SEED)
+    # Order volume grows over time and peaks in November and December
+    weights = (1 + np.arange(MONTHS) / 24) * np.where(np.arange(MONTHS) % 12 >= 10, 1.6, 1.0)
+    month_ends = np.cumsum(rng.multinomial(rows, weights / weights.sum()))
+
+    files = {
+        name: np.lib.format.open_memmap(directory / f"{name}.npy", mode="w+", dtype=dtype, shape=(rows,))
+        for name, dtype in COLUMNS.items()
+    }
+    shape = (MONTHS, len(CATEGORIES), len(SEGMENTS), len(REGIONS))
+    cells = int(np.prod(shape))
+    orders = np.zeros(cells, np.int64)
+    revenue = np.zeros(cells)
+    units = np.zeros(cells, np.int64)
+    values = np.zeros((cells, len(VALUE_BINS) + 1), np.int32)
+
+    for start in range(0, rows, BUILD_CHUNK):
+        end = min(start + BUILD_CHUNK, rows)
+        months = np.searchsorted(month_ends, np.arange(start, end), side="right")
+        chunk = generate_orders(rng, months)
+        for name, dtype in COLUMNS.items():
+            files[name][start:end] = chunk[name].astype(dtype)
+
+        index = _cube_index(chunk)
+        orders += np.bincount(index, minlength=cells)
+        revenue += np.bincount(index, weights=chunk["revenue"], minlength=cells)
+        units += np.bincount(index, weights=chunk["quantity"], minlength=cells).astype(np.int64)
+        value_bin = np.digitize(chunk["revenue"], VALUE_BINS)
+        values += np.bincount(
+            index * values.shape[1] + value_bin, minlength=values.size
+        ).reshape(values.shape).astype(np.int32)
+
+    for column in files.values():
+        column.flush()
+    np.savez(
+        directory / "cubes.npz",
+        orders=orders.reshape(shape),
+        revenue=revenue.reshape(shape),
+        units=units.reshape(shape),
+        values=values.reshape(*shape, -1),
+    )
+    # Written last: a directory with a manifest is complete
+    (directory / "manifest.json").write_text(
+        json.dumps({"version": DATASET_VERSION, "rows": rows, "seed": SEED}), encoding="utf-8"
+    )
+
+
+def _read_manifest(directory):
+    try:
+        return json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def ensure_dataset(directory=SALES_DIR, rows=ROWS):
+    """
+    Build the dataset unless an up-to-date one exists
+
+    Processes build into a private directory and rename it into place, so
+    workers starting together never see a half-written dataset.
+
+    Args:
+        directory (Path): Dataset directory
+        rows (int): Number of orders
+
+    Returns:
+        bool: Whether this call built the dataset
+    """
+    expected = {"version": DATASET_VERSION, "rows": rows, "seed": SEED}
+    if _read_manifest(directory) == expected:
+        return False
+    building = directory.with_name(f"{directory.name}.building-{os.getpid()}")
+    shutil.rmtree(building, ignore_errors=True)
+    building.mkdir(parents=True)
+    try:
+        build_dataset(building, rows)
+        if _read_manifest(directory) == expected:
+            # Another worker finished first
+            return False
+        # Processes still mapping the old files keep them until they exit
+        shutil.rmtree(directory, ignore_errors=True)
+        try:
+            building.rename(directory)
+        except OSError:
+            # Another worker renamed its build into place between the rmtree
+            # and the rename; keep theirs and discard this one
+            if _read_manifest(directory) != expected:
+                raise
+            return False
+    finally:
+        shutil.rmtree(building, ignore_errors=True)
+    return True
+
+
+class SalesDataset:
+    """Read-only views of the order columns plus the precomputed cubes"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.columns = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in COLUMNS}
+        with np.load(directory / "cubes.npz") as cubes:
+            self.cubes = {name: cubes[name] for name in cubes.files}
+        self.rows = len(self.columns["month"])
+        # First row of every month; rows are in month order
+        self.month_starts = np.searchsorted(self.columns["month"], np.arange(MONTHS + 1))
+
+    @property
+    def disk_bytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+    @property
+    def cube_bytes(self):
+        return sum(cube.nbytes for cube in self.cubes.values())
+
+    def aggregate(self, months, categories, segments, regions):
+        """
+        Totals of the orders matching a filter, read from the cubes
+
+        Args:
+            months (tuple): First and last month index, inclusive
+            categories, segments, regions (list): Selected codes
+
+        Returns:
+            dict: ``orders``, ``revenue`` and ``units`` cubes reduced to the
+            selection (month x category x segment x region), and ``values``,
+            the order value histogram of the selection
+        """
+        selection = np.ix_(np.arange(months[0], months[1] + 1), categories, segments, regions)
+        result = {name: self.cubes[name][selection] for name in ("orders", "revenue", "units")}
+        result["values"] = self.cubes["values"][selection].sum(axis=(0, 1, 2, 3))
+        return result
+
+    def recent_orders(self, months, categories, segments, regions, limit=RECENT_ORDERS, expected=None):
+        """
+        Latest orders matching a filter
+
+        Scans backwards from the end of the month range, ``SCAN_CHUNK`` rows
+        at a time, until ``limit`` orders (or the ``expected`` number of
+        matches, known from the cubes) are found.
+
+        Returns:
+            list: Matching row numbers, latest first
+        """
+        wanted = limit if expected is None else min(limit, expected)
+        first, end = self.month_starts[months[0]], self.month_starts[months[1] + 1]
+        found = []
+        while end > first and len(found) < wanted:
+            start = max(first, end - SCAN_CHUNK)
+            mask = (
+                np.isin(self.columns["category"][start:end], categories)
+                & np.isin(self.columns["segment"][start:end], segments)
+                & np.isin(self.columns["region"][start:end], regions)
+            )
+            found.extend((start + np.flatnonzero(mask))[::-1][:wanted - len(found)])
+            end = start
+        return found
+
+    def orders_frame(self, rows):
+        """Display table of the given rows"""
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = {name: self.columns[name][rows] for name in COLUMNS}
+        months = FIRST_MONTH + columns["month"].astype(np.int64)
+        return pd.DataFrame({
+            "Order": rows + 1,
+            "Date": months.astype("datetime64[D]") + (columns["day"].astype(np.int64) - 1),
+            "Category": np.array(CATEGORIES)[columns["category"]],
+            "Segment": np.array(SEGMENTS)[columns["segment"]],
+            "Region": np.array(REGIONS)[columns["region"]],
+            "Units": columns["quantity"],
+            "Revenue ($)": columns["revenue"],
+        })
+
+
+def get_dataset():
+    """
+    Get the process-wide dataset, building it on disk on first use
+
+    Returns:
+        SalesDataset: Shared read-only dataset
+    """
+    global _dataset
+    if _dataset is None:
+        with _dataset_lock:
+            if _dataset is None:
+                ensure_dataset()
+                _dataset = SalesDataset(SALES_DIR)
+    return _dataset
+
+
+def _codes(labels, selected):
+    return [labels.index(label) for label in selected]
+
+
+@st.fragment
+@timed_fragment("projects")
+def render_demo():
+    """Display the e-commerce analysis demo; its widgets rerun only the demo"""
+    if _dataset is None:
+        with st.spinner(f"Generating {ROWS:,} orders (once per server)..."):
+            dataset = get_dataset()
+    else:
+        dataset = _dataset
+
+    labels = _month_labels()
+    first, last = st.select_slider("Months", labels, value=(labels[0], labels[-1]), key="sales_months")
+    col1, col2, col3 = st.columns(3)
+    categories = col1.multiselect("Categories", CATEGORIES, default=CATEGORIES, key="sales_categories")
+    segments = col2.multiselect("Customer segments", SEGMENTS, default=SEGMENTS, key="sales_segments")
+    regions = col3.multiselect("Regions", REGIONS, default=REGIONS, key="sales_regions")
+
+    start = time.perf_counter()
+    months = (labels.index(first), labels.index(last))
+    selection = (months, _codes(CATEGORIES, categories), _codes(SEGMENTS, segments), _codes(REGIONS, regions))
+    totals = dataset.aggregate(*selection)
+    order_count = int(totals["orders"].sum())
+    revenue = totals["revenue"].sum()
+    recent = dataset.recent_orders(*selection, expected=order_count)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Orders", f"{order_count:,}")
+    col2.metric("Revenue", f"${revenue:,.0f}")
+    col3.metric("Average order value", f"${revenue / order_count:,.2f}" if order_count else "–")
+    col4.metric("Units sold", f"{int(totals['units'].sum()):,}")
+    if not order_count:
+        st.info("No orders match these filters.")
+        return
+
+    selected_months = labels[months[0]:months[1] + 1]
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write("**Monthly revenue by category**")
+        st.bar_chart(pd.DataFrame(
+            totals["revenue"].sum(axis=(2, 3)), index=selected_months, columns=categories
+        ))
+    with col2:
+        st.write("**Revenue by segment and region**")
+        st.bar_chart(pd.DataFrame(
+            totals["revenue"].sum(axis=(0, 1)).T, index=regions, columns=segments
+        ))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write("**Order value distribution**")
+        edges = [0, *VALUE_BINS]
+        bins = [f"${low:,.0f}+" for low in edges]
+        # Bins in value order rather than sorted by label
+        st.vega_lite_chart(pd.DataFrame({"Order value": bins, "Orders": totals["values"]}), {
+            "mark": {"type": "bar", "tooltip": True},
+            "encoding": {
+                "x": {"field": "Order value", "type": "ordinal", "sort": bins},
+                "y": {"field": "Orders", "type": "quantitative"},
+            },
+        }, use_container_width=True)
+    with col2:
+        st.write("**Latest matching orders**")
+        st.dataframe(dataset.orders_frame(recent), hide_index=True, use_container_width=True, height=250)
+
+    st.caption(
+        f"{dataset.rows:,} orders in {dataset.disk_bytes / 2**20:.0f} MB of memory-mapped column files, "
+        f"shared by every session; this filter was answered from {dataset.cube_bytes / 2**10:.0f} KB of "
+        f"precomputed cubes in {elapsed:.1f} ms."
+    )
@@ -0,0 +1,326 @@
+"""
+Content-hashed static asset server for the Streamlit portfolio application
+
+Files under ``assets/`` are published as ``/assets/<stem>.<hash><suffix>``.
+Because the URL changes whenever the content does, responses are sent with
+``Cache-Control: immutable`` and browsers (or a CDN in front of the server)
+only ever download a given version once. Compressible files are served
+brotli-compressed (when ``build_assets.py`` wrote a ``.br`` copy) or gzipped
+to clients that accept it, each encoding under an ETag of its own, and
+``ETag`` / ``If-None-Match`` revalidation answers with ``304 Not Modified``.
+
+The server runs in a daemon thread next to Streamlit. Set
+``PORTFOLIO_ASSET_BASE_URL`` when it is reachable from visitors' browsers
+(for example through a reverse proxy or CDN); otherwise URLs point at
+``http://<PORTFOLIO_ASSET_HOST>:<PORTFOLIO_ASSET_PORT>``, which only the
+machine running the app can reach, and pages serve files in-app instead.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote, urlsplit
+
+from utils.assets import (
+    ASSET_BASE_URL,
+    BUILD_DIR,
+    RESUME_PATH,
+    get_file_variants,
+    get_manifest_entry,
+)
+from utils.analytics import record_event
+from utils.metrics import resume_downloads
+
+ASSETS_DIR = "assets"
+ASSET_URL_PREFIX = "/assets/"
+ASSET_SERVER_HOST = os.environ.get("PORTFOLIO_ASSET_HOST", "127.0.0.1")
+ASSET_SERVER_PORT = int(os.environ.get("PORTFOLIO_ASSET_PORT", "8502"))
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Only keep a gzip variant when it saves at least this fraction of the bytes
+MIN_GZIP_SAVING = 0.05
+# Content codings served, most preferred first, with their ETag suffixes.
+# Brotli is only ever prebuilt; gzip falls back to compressing in process
+ENCODINGS = (("br", "-br"), ("gzip", "-gz"))
+
+_server_lock = threading.Lock()
+_server = None
+_server_started = False
+# Hashed file name -> source path, filled as URLs are handed out
+_hashed_paths = {}
+
+
+class StaticAsset:
+    """One immutable version of a file under ``assets/``"""
+
+    __slots__ = ("hashed_name", "content_type", "etag", "data", "encoded")
+
+    def __init__(self, hashed_name, content_type, digest, data, encoded):
+        self.hashed_name = hashed_name
+        self.content_type = content_type
+        self.etag = f'"{digest}"'
+        self.data = data
+        # Encoding -> (body, ETag); each encoding is different bytes, so it
+        # has its own strong ETag
+        self.encoded = {
+            encoding: (encoded[encoding], f'"{digest}{suffix}"')
+            for encoding, suffix in ENCODINGS if encoded.get(encoding) is not None
+        }
+
+
+def _load_prebuilt(path, data, encoding):
+    """
+    Read a compressed copy written by ``build_assets.py`` if it is current
+
+    Args:
+        path (str): Path to the source file
+        data (bytes): Current contents of the source file
+        encoding (str): "gzip" or "br"
+
+    Returns:
+        bytes: Compressed contents, or None if there is no up-to-date build
+    """
+    entry = get_manifest_entry(path)
+    if entry is None or entry.get("sha256") != hashlib.sha256(data).hexdigest():
+        return None
+    record = entry.get("precompressed", {}).get(encoding)
+    if record is None:
+        return None
+    try:
+        with open(Path(BUILD_DIR) / record["file"], "rb") as file:
+            return file.read()
+    except OSError:
+        return None
+
+
+def _build_static_asset(path):
+    """
+    Create the ``get_file_variants`` builder for a static asset
+
+    Args:
+        path (str): Path to the source file
+
+    Returns:
+        callable: Builder returning ``{"asset": StaticAsset}`` for the file bytes
+    """
+    source = Path(path)
+
+    def build(data):
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        hashed_name = f"{source.stem}.{digest}{source.suffix}"
+        content_type = mimetypes.guess_type(source.name)[0] or "application/octet-stream"
+
+        gzip_data = _load_prebuilt(path, data, "gzip")
+        if gzip_data is None:
+            gzip_data = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(gzip_data) > len(data) * (1 - MIN_GZIP_SAVING):
+                gzip_data = None
+
+        encoded = {"br": _load_prebuilt(path, data, "br"), "gzip": gzip_data}
+        asset = StaticAsset(hashed_name, content_type, digest, data, encoded)
+        return {"asset": asset}
+
+    return build
+
+
+def get_static_asset(path):
+    """
+    Get the current version of a static asset
+
+    Args:
+        path (str): Path to the source file
+
+    Returns:
+        StaticAsset: Current version of the file, or None if it is missing
+    """
+    try:
+        variants = get_file_variants(path, "static", _build_static_asset(path))
+    except FileNotFoundError:
+        return None
+    asset = variants["asset"]
+    _hashed_paths[asset.hashed_name] = path
+    return asset
+
+
+def choose_encoding(accept_encoding, available):
+    """
+    Pick the content coding of a response from an ``Accept-Encoding`` header
+
+    Args:
+        accept_encoding (str): Header value, e.g. "gzip;q=0.8, br"
+        available (iterable): Codings the response exists in, most preferred
+            first
+
+    Returns:
+        str: The available coding with the highest non-zero quality (``*``
+        covers codings not listed; ties go to the earlier one), or None to
+        send the identity body
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    if "gzip" not in qualities and "x-gzip" in qualities:
+        qualities["gzip"] = qualities["x-gzip"]
+
+    chosen, best = None, 0.0
+    for coding in available:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best:
+            chosen, best = coding, quality
+    return chosen
+
+
+def etag_matches(if_none_match, etag):
+    """
+    Whether an ``If-None-Match`` header matches an ETag
+
+    Uses the weak comparison the header calls for: ``W/`` prefixes are
+    ignored.
+
+    Args:
+        if_none_match (str): Header value, a list of ETags or ``*``
+        etag (str): Quoted ETag of the representation being served
+
+    Returns:
+        bool: True if any listed ETag (or ``*``) matches
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class AssetRequestHandler(BaseHTTPRequestHandler):
+    """Serve hashed assets with long-lived caching and ETag revalidation"""
+
+    server_version = "PortfolioAssets/1.0"
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def _serve(self, send_body):
+        url = urlsplit(self.path)
+        if not url.path.startswith(ASSET_URL_PREFIX):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        hashed_name = url.path[len(ASSET_URL_PREFIX):]
+        path = _hashed_paths.get(hashed_name)
+        asset = get_static_asset(path) if path else None
+        if asset is None or asset.hashed_name != hashed_name:
+            # Unknown name, or the file changed and this version no longer exists
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        encoding = choose_encoding(self.headers.get("Accept-Encoding", ""), asset.encoded)
+        body, etag = asset.encoded[encoding] if encoding else (asset.data, asset.etag)
+
+        if etag_matches(self.headers.get("If-None-Match", ""), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+            # Same headers as the 200, so cross-origin revalidations succeed
+            self.send_header("Access-Control-Allow-Origin", "*")
+            if asset.encoded:
+                self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        # Sent with every encoding, so caches keep them apart
+        if asset.encoded:
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        download_name = parse_qs(url.query).get("download", [None])[0]
+        if download_name:
+            self.send_header("Content-Disposition", f"attachment; filename*=UTF-8''{quote(download_name)}")
+        self.end_headers()
+
+        if send_body:
+            self.wfile.write(body)
+            if path == RESUME_PATH:
+                resume_downloads.inc("asset_server")
+                record_event("download", detail="asset_server")
+
+    def log_message(self, format, *args):
+        # Streamlit owns the console; asset hits are too chatty to log
+        pass
+
+
+def start_asset_server(host=ASSET_SERVER_HOST, port=ASSET_SERVER_PORT):
+    """
+    Start the asset server in a daemon thread if it is not already running
+
+    Args:
+        host (str): Interface to bind to
+        port (int): Port to listen on
+
+    Returns:
+        bool: True if this process serves the assets, False if the port is
+        already taken (typically by another portfolio worker)
+    """
+    global _server, _server_started
+    with _server_lock:
+        if _server_started:
+            return _server is not None
+        _server_started = True
+
+        # Register everything up front so hashed URLs resolve before any
+        # session has asked for them
+        for path in sorted(Path(ASSETS_DIR).glob("*")):
+            if path.is_file():
+                get_static_asset(str(path))
+
+        try:
+            _server = ThreadingHTTPServer((host, port), AssetRequestHandler)
+        except OSError:
+            return False
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="asset-server", daemon=True).start()
+        return True
+
+
+def asset_url(path, download_name=None):
+    """
+    Get the content-hashed URL of a file under ``assets/``
+
+    Args:
+        path (str): Path to the file
+        download_name (str, optional): File name to force a download with
+
+    Returns:
+        str: Absolute URL of the current version, or None if the file is missing
+    """
+    asset = get_static_asset(path)
+    if asset is None:
+        return None
+
+    start_asset_server()
+    base_url = ASSET_BASE_URL or f"http://{ASSET_SERVER_HOST}:{ASSET_SERVER_PORT}"
+
+    url = f"{base_url}{ASSET_URL_PREFIX}{asset.hashed_name}"
+    if download_name:
+        url += f"?download={quote(download_name)}"
+    return url
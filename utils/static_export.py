@@ -0,0 +1,209 @@
+"""
+Static HTML rendering of the read-only portfolio sections
+
+``HtmlRenderer`` implements the subset of the Streamlit API the static
+sections use (headers, markdown, metrics, columns, expanders, tabs, alerts,
+progress bars). Rendering a section means temporarily pointing the section
+module's ``st`` at a renderer and calling the section function unchanged, so
+the exported pages always match what the app shows.
+"""
+
+import html
+import re
+import textwrap
+from contextlib import contextmanager
+
+_BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+_CODE_PATTERN = re.compile(r"`([^`]+)`")
+_BLOCK_SEPARATOR = re.compile(r"\n\s*\n")
+
+
+def _inline_markdown(text, allow_html):
+    """Convert inline markdown (bold, links, code) to HTML"""
+    if not allow_html:
+        text = html.escape(text, quote=False)
+    text = _CODE_PATTERN.sub(r"<code>\1</code>", text)
+    text = _BOLD_PATTERN.sub(r"<strong>\1</strong>", text)
+    return _LINK_PATTERN.sub(r'<a href="\2">\1</a>', text)
+
+
+def markdown_to_html(text, allow_html=False):
+    """
+    Convert the markdown used by the portfolio sections to HTML
+
+    Supports paragraphs, ``-`` bullet lists, hard line breaks (two trailing
+    spaces), bold, links and inline code. With ``allow_html`` raw HTML blocks
+    pass through untouched, mirroring ``unsafe_allow_html=True``.
+
+    Args:
+        text (str): Markdown source
+        allow_html (bool): Whether raw HTML is allowed
+
+    Returns:
+        str: HTML fragment
+    """
+    out = []
+    for block in _BLOCK_SEPARATOR.split(textwrap.dedent(text).strip("\n")):
+        lines = [line for line in block.splitlines() if line.strip()]
+        if not lines:
+            continue
+        if allow_html and lines[0].lstrip().startswith("<"):
+            out.append("\n".join(line.strip() for line in lines))
+            continue
+
+        paragraph, items = [], []
+        for line in lines:
+            hard_break = line.endswith("  ")
+            line = line.strip()
+            if line.startswith(("- ", "* ")):
+                if paragraph:
+                    out.append(f"<p>{' '.join(paragraph)}</p>")
+                    paragraph = []
+                items.append(f"<li>{_inline_markdown(line[2:], allow_html)}</li>")
+                continue
+            if items:
+                out.append(f"<ul>{''.join(items)}</ul>")
+                items = []
+            paragraph.append(_inline_markdown(line, allow_html) + ("<br>" if hard_break else ""))
+        if paragraph:
+            out.append(f"<p>{' '.join(paragraph)}</p>")
+        if items:
+            out.append(f"<ul>{''.join(items)}</ul>")
+    return "\n".join(out)
+
+
+class _Container:
+    """A block of rendered HTML that elements can be written into"""
+
+    __slots__ = ("renderer", "open_tag", "close_tag", "children")
+
+    def __init__(self, renderer, open_tag="", close_tag=""):
+        self.renderer = renderer
+        self.open_tag = open_tag
+        self.close_tag = close_tag
+        self.children = []
+
+    def __enter__(self):
+        self.renderer._stack.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.renderer._stack.pop()
+        return False
+
+    def to_html(self):
+        body = "\n".join(
+            child.to_html() if isinstance(child, _Container) else child for child in self.children
+        )
+        return f"{self.open_tag}{body}{self.close_tag}"
+
+
+class HtmlRenderer:
+    """Streamlit look-alike that records elements as static HTML"""
+
+    def __init__(self):
+        self._root = _Container(self)
+        self._stack = [self._root]
+
+    def _add(self, fragment):
+        self._stack[-1].children.append(fragment)
+
+    def _add_container(self, open_tag, close_tag):
+        container = _Container(self, open_tag, close_tag)
+        self._add(container)
+        return container
+
+    def to_html(self):
+        """Return everything rendered so far"""
+        return self._root.to_html()
+
+    def header(self, body):
+        self._add(f"<h2>{html.escape(body)}</h2>")
+
+    def subheader(self, body):
+        self._add(f"<h3>{html.escape(body)}</h3>")
+
+    def markdown(self, body, unsafe_allow_html=False, **kwargs):
+        self._add(markdown_to_html(body, allow_html=unsafe_allow_html))
+
+    def write(self, *args, **kwargs):
+        for arg in args:
+            self.markdown(str(arg))
+
+    def _alert(self, kind, body):
+        self._add(f'<div class="alert alert-{kind}">{markdown_to_html(body)}</div>')
+
+    def info(self, body, **kwargs):
+        self._alert("info", body)
+
+    def success(self, body, **kwargs):
+        self._alert("success", body)
+
+    def warning(self, body, **kwargs):
+        self._alert("warning", body)
+
+    def error(self, body, **kwargs):
+        self._alert("error", body)
+
+    def metric(self, label, value, delta=None, **kwargs):
+        delta_html = f'<div class="metric-delta">↑ {html.escape(str(delta))}</div>' if delta else ""
+        self._add(
+            f'<div class="metric"><div class="metric-label">{html.escape(label)}</div>'
+            f'<div class="metric-value">{html.escape(str(value))}</div>{delta_html}</div>'
+        )
+
+    def progress(self, value, text=None):
+        percent = value if isinstance(value, int) else round(value * 100)
+        self._add(f'<div class="progress"><div class="progress-bar" style="width: {percent}%"></div></div>')
+
+    def columns(self, spec, **kwargs):
+        weights = [1] * spec if isinstance(spec, int) else list(spec)
+        row = self._add_container('<div class="row">', "</div>")
+        columns = []
+        for weight in weights:
+            column = _Container(self, f'<div class="column" style="flex: {weight}">', "</div>")
+            row.children.append(column)
+            columns.append(column)
+        return columns
+
+    def expander(self, label, expanded=False, **kwargs):
+        open_attr = " open" if expanded else ""
+        return self._add_container(
+            f'<details class="expander"{open_attr}><summary>{html.escape(label)}</summary>',
+            "</details>",
+        )
+
+    def tabs(self, labels):
+        # Static pages have no tab widget: show every tab as a titled block
+        return [
+            self._add_container(f'<section class="tab"><h3 class="tab-label">{html.escape(label)}</h3>', "</section>")
+            for label in labels
+        ]
+
+    def button(self, label, **kwargs):
+        # There is nothing to click on a static page, so show what a click reveals
+        return True
+
+    def toggle(self, label, **kwargs):
+        # Live demos need the running app; static pages leave them out
+        return False
+
+
+@contextmanager
+def rendering_to(renderer, *modules):
+    """
+    Temporarily route the ``st`` calls of some modules to a renderer
+
+    Args:
+        renderer (HtmlRenderer): Renderer receiving the elements
+        *modules (module): Modules whose global ``st`` is replaced
+    """
+    originals = [module.st for module in modules]
+    for module in modules:
+        module.st = renderer
+    try:
+        yield renderer
+    finally:
+        for module, original in zip(modules, originals):
+            module.st = original
@@ -0,0 +1,190 @@
+"""
+Validation and spam scoring of contact messages
+
+Patterns are compiled and word lists built once at import, so checking a
+single message is a handful of regex scans and set lookups (microseconds).
+Spam scoring uses cheap features combined with fixed weights; ``score_messages``
+computes the same score for a whole exported inbox in one vectorized pass.
+"""
+
+import re
+import string
+from dataclasses import dataclass
+
+# Dot-atom local part (no leading, trailing or doubled dots) and a domain of
+# labels that neither start nor end with a hyphen, so every address accepted
+# here also parses as the Reply-To of the outgoing email. Matched with
+# fullmatch: "$" would also accept a trailing newline
+EMAIL_PATTERN = re.compile(
+    r"[a-zA-Z0-9_%+-]+(?:\.[a-zA-Z0-9_%+-]+)*"
+    r"@((?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,})"
+)
+URL_PATTERN = re.compile(r"https?://|www\.", re.IGNORECASE)
+REPEATED_CHARACTER_PATTERN = re.compile(r"(.)\1{5,}")
+# str.translate tables: counting characters by deleting them, and splitting
+# words at punctuation, both run in C instead of a Python loop or regex
+_DELETE_LETTERS = str.maketrans("", "", string.ascii_letters)
+_DELETE_UPPERCASE = str.maketrans("", "", string.ascii_uppercase)
+_PUNCTUATION_TO_SPACE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+SPAM_PHRASES = (
+    "casino", "crypto", "bitcoin", "forex", "viagra", "cialis", "loan", "lottery",
+    "winner", "free money", "click here", "buy now", "limited time", "seo services",
+    "backlinks", "guest post", "web traffic", "act now", "100% free", "earn cash",
+)
+# Phrases are matched as words and word pairs with set lookups, which is
+# several times faster than one case-insensitive alternation regex
+_SPAM_TOKENS = [tuple(phrase.translate(_PUNCTUATION_TO_SPACE).split()) for phrase in SPAM_PHRASES]
+SPAM_WORDS = frozenset(tokens[0] for tokens in _SPAM_TOKENS if len(tokens) == 1)
+SPAM_WORD_PAIRS = frozenset(tokens for tokens in _SPAM_TOKENS if len(tokens) == 2)
+
+DISPOSABLE_DOMAINS = frozenset({
+    "10minutemail.com", "33mail.com", "dispostable.com", "emailondeck.com", "fakeinbox.com",
+    "getairmail.com", "getnada.com", "guerrillamail.com", "guerrillamail.net", "maildrop.cc",
+    "mailinator.com", "mailnesia.com", "mintemail.com", "mohmal.com", "moakt.com",
+    "sharklasers.com", "spamgourmet.com", "temp-mail.org", "tempail.com", "tempmail.com",
+    "tempmailo.com", "throwawaymail.com", "trashmail.com", "yopmail.com", "yopmail.net",
+})
+
+MAX_NAME_LENGTH = 100
+MIN_MESSAGE_LENGTH = 10
+MAX_MESSAGE_LENGTH = 5000
+
+# Feature order shared by the single-message and batch scorers
+FEATURES = ("links", "spam_phrases", "uppercase_ratio", "repeated_characters", "disposable_email", "link_in_name")
+WEIGHTS = (0.15, 0.25, 0.8, 0.2, 0.5, 0.6)
+SPAM_THRESHOLD = 0.7
+
+
+@dataclass(frozen=True, slots=True)
+class MessageCheck:
+    """Outcome of validating and scoring one message"""
+
+    errors: tuple[str, ...]
+    spam_score: float
+
+    @property
+    def valid(self):
+        return not self.errors
+
+    @property
+    def spam(self):
+        return self.spam_score >= SPAM_THRESHOLD
+
+
+def is_valid_email(email):
+    """
+    Check the format of an email address
+
+    Args:
+        email (str): Email address to validate
+
+    Returns:
+        bool: True if email format is valid
+
+    Examples:
+        >>> is_valid_email("first.last+tag@mail.example.com")
+        True
+        >>> [is_valid_email(email) for email in ("a..b@example.com", ".a@example.com", "a.@example.com")]
+        [False, False, False]
+        >>> [is_valid_email(email) for email in ("a@-ex..com", "a@ex-.com", "a@example.com\\n")]
+        [False, False, False]
+    """
+    return EMAIL_PATTERN.fullmatch(email) is not None
+
+
+def is_disposable_domain(domain):
+    """
+    Check a domain, and each domain it belongs to, against the disposable list
+
+    Args:
+        domain (str): Domain part of an email address
+
+    Returns:
+        bool: True for throwaway mail services (including their subdomains)
+    """
+    domain = domain.lower()
+    while "." in domain:
+        if domain in DISPOSABLE_DOMAINS:
+            return True
+        domain = domain.split(".", 1)[1]
+    return False
+
+
+def message_features(name, email, subject, message):
+    """
+    Compute the spam features of a message
+
+    Args:
+        name (str): Sender's name
+        email (str): Sender's email
+        subject (str): Selected subject
+        message (str): Message body
+
+    Returns:
+        tuple: Feature values in ``FEATURES`` order
+    """
+    letters = len(message) - len(message.translate(_DELETE_LETTERS))
+    uppercase = len(message) - len(message.translate(_DELETE_UPPERCASE))
+    words = f"{subject} {message}".lower().translate(_PUNCTUATION_TO_SPACE).split()
+    domain = email.rpartition("@")[2]
+    return (
+        len(URL_PATTERN.findall(message)),
+        len(SPAM_WORDS.intersection(words)) + len(SPAM_WORD_PAIRS.intersection(zip(words, words[1:]))),
+        uppercase / letters if letters >= 20 else 0.0,
+        1 if REPEATED_CHARACTER_PATTERN.search(message) else 0,
+        1 if is_disposable_domain(domain) else 0,
+        1 if URL_PATTERN.search(name) else 0,
+    )
+
+
+def spam_score(features):
+    """Combine message features into a score between 0 and 1"""
+    return min(1.0, sum(weight * value for weight, value in zip(WEIGHTS, features)))
+
+
+def check_message(name, email, subject, message):
+    """
+    Validate a contact message and score it for spam
+
+    Args:
+        name (str): Sender's name
+        email (str): Sender's email
+        subject (str): Selected subject
+        message (str): Message body
+
+    Returns:
+        MessageCheck: Validation errors (empty when valid) and spam score
+    """
+    errors = []
+    if not name.strip() or len(name) > MAX_NAME_LENGTH:
+        errors.append(f"Please enter your name (up to {MAX_NAME_LENGTH} characters).")
+    if not is_valid_email(email.strip()):
+        errors.append("Please enter a valid email address.")
+    if not MIN_MESSAGE_LENGTH <= len(message.strip()) <= MAX_MESSAGE_LENGTH:
+        errors.append(f"Please write a message of {MIN_MESSAGE_LENGTH} to {MAX_MESSAGE_LENGTH} characters.")
+    return MessageCheck(tuple(errors), spam_score(message_features(name, email.strip(), subject, message)))
+
+
+def score_messages(messages):
+    """
+    Score many messages at once, e.g. to re-score an exported inbox
+
+    Features are extracted per message, then weighted for all messages in a
+    single matrix product.
+
+    Args:
+        messages (iterable): Mappings with name, email, subject and message keys
+
+    Returns:
+        numpy.ndarray: Spam score of each message, in input order
+    """
+    import numpy as np
+
+    matrix = np.array(
+        [
+            message_features(item["name"], item["email"].strip(), item["subject"], item["message"])
+            for item in messages
+        ],
+        dtype=float,
+    ).reshape(-1, len(FEATURES))
+    return np.minimum(matrix @ np.array(WEIGHTS), 1.0)
@@ -0,0 +1,158 @@
+"""
+Synthetic warmup render of every section on a freshly started worker
+
+A new Streamlit process is cold: the app's modules are imported, page scripts
+compiled and the asset and content caches filled by the first session that
+asks for them. ``warm_worker`` plays that first session over a plain
+websocket: it renders the default page, reads the page list from the
+navigation message and renders every other section, so by the time real
+visitors are routed to the worker all of that is done.
+
+Warmup sessions send ``X-Portfolio-Warmup: 1``; instrumentation that counts
+visitors can use ``is_warmup_session`` to leave them out.
+"""
+
+import asyncio
+import base64
+import os
+import time
+
+WARMUP_HEADER = "X-Portfolio-Warmup"
+STREAM_PATH = "/_stcore/stream"
+
+
+def is_warmup_session():
+    """
+    Tell whether the current Streamlit session is a synthetic warmup render
+
+    Returns:
+        bool: True for sessions opened by ``warm_worker``
+    """
+    import streamlit as st
+
+    try:
+        return st.context.headers.get(WARMUP_HEADER) == "1"
+    except (AttributeError, RuntimeError):
+        return False
+
+
+async def _connect(host, port):
+    """Open a Streamlit websocket on a worker"""
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode("ascii")
+    writer.write((
+        f"GET {STREAM_PATH} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        f"Origin: http://{host}:{port}\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        "Sec-WebSocket-Version: 13\r\n"
+        "Sec-WebSocket-Protocol: streamlit\r\n"
+        f"{WARMUP_HEADER}: 1\r\n"
+        "\r\n"
+    ).encode("ascii"))
+    head = await reader.readuntil(b"\r\n\r\n")
+    if head.split(b" ", 2)[1:2] != [b"101"]:
+        writer.close()
+        raise ConnectionError(f"websocket upgrade refused: {head.splitlines()[0].decode('latin-1')}")
+    return reader, writer
+
+
+def _send(writer, payload, opcode=0x2):
+    """Write one masked client frame (binary by default)"""
+    length = len(payload)
+    if length < 126:
+        header = bytes((0x80 | opcode, 0x80 | length))
+    elif length < 1 << 16:
+        header = bytes((0x80 | opcode, 0x80 | 126)) + length.to_bytes(2, "big")
+    else:
+        header = bytes((0x80 | opcode, 0x80 | 127)) + length.to_bytes(8, "big")
+    mask = os.urandom(4)
+    masked = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+    writer.write(header + mask + masked)
+
+
+async def _receive(reader, writer):
+    """Read one complete data message, answering pings on the way"""
+    parts = []
+    while True:
+        first, second = await reader.readexactly(2)
+        length = second & 0x7F
+        if length == 126:
+            length = int.from_bytes(await reader.readexactly(2), "big")
+        elif length == 127:
+            length = int.from_bytes(await reader.readexactly(8), "big")
+        if second & 0x80:
+            await reader.readexactly(4)
+        payload = await reader.readexactly(length)
+
+        opcode = first & 0x0F
+        if opcode == 0x8:
+            raise ConnectionError("websocket closed by the worker")
+        if opcode == 0x9:
+            _send(writer, payload, opcode=0xA)
+            continue
+        if opcode == 0xA:
+            continue
+        parts.append(payload)
+        if first & 0x80:
+            return b"".join(parts)
+
+
+async def _render(reader, writer, page_name):
+    """
+    Rerun one page and wait until its script finishes
+
+    Returns:
+        list: URL paths of the other pages, if the run sent the navigation
+    """
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    message = BackMsg()
+    message.rerun_script.page_name = page_name
+    _send(writer, message.SerializeToString())
+    await writer.drain()
+
+    pages = []
+    while True:
+        forward = ForwardMsg()
+        forward.ParseFromString(await _receive(reader, writer))
+        kind = forward.WhichOneof("type")
+        if kind == "navigation":
+            pages = [page.url_pathname for page in forward.navigation.app_pages if not page.is_default]
+        elif kind == "script_finished":
+            if forward.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                raise RuntimeError(f"page {page_name or '(default)'} failed to compile")
+            return pages
+
+
+async def warm_worker(host, port):
+    """
+    Render every section once on a worker
+
+    Args:
+        host (str): Worker's interface
+        port (int): Worker's port
+
+    Returns:
+        dict: Seconds taken per section URL path ("" is the default page)
+
+    Raises:
+        ConnectionError: If the worker refuses or drops the websocket
+        RuntimeError: If a page fails to compile
+    """
+    reader, writer = await _connect(host, port)
+    timings = {}
+    try:
+        start = time.perf_counter()
+        pages = await _render(reader, writer, "")
+        timings[""] = time.perf_counter() - start
+        for page in pages:
+            start = time.perf_counter()
+            await _render(reader, writer, page)
+            timings[page] = time.perf_counter() - start
+    finally:
+        writer.close()
+    return timings